@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from platformdirs import user_config_dir
+
+from .globset import GlobSet
+from .hashing import CacheKey, HashCache, cache_key
+from .policy import Policy
+
+
+CACHE_FILE = "attach-cache.db"
+CHUNK_CHARS = 4000  # target chunk size; chunks end on line boundaries
+MAX_FILE_BYTES = 8 * 1024 * 1024
+SNIFF_BYTES = 8192
+SKIP_DIRS = (".git", ".hg", ".svn", "__pycache__")
+
+# Control bytes that still occur in ordinary text files
+_TEXT_CONTROLS = frozenset(b"\t\n\r\f\b\x1b")
+
+# (ordinal, start_line, end_line, text) as stored in the chunk cache
+RawChunk = Tuple[int, int, int, str]
+
+
+@dataclass(frozen=True)
+class Chunk:
+    id: str  # stable for a given path and content
+    path: str  # relative to the attach root
+    ordinal: int
+    start_line: int
+    end_line: int
+    text: str
+
+
+@dataclass
+class AttachedFile:
+    path: str  # relative to the attach root
+    sha256: str
+    size: int
+    kind: str  # text|binary|too_large|unreadable
+    chunks: List[Chunk] = field(default_factory=list)
+
+
+@dataclass
+class AttachResult:
+    root: Path
+    files: List[AttachedFile]
+    read: int = 0  # files actually opened; the rest came from the cache
+    elapsed_s: float = 0.0
+
+    @property
+    def text_files(self) -> List[AttachedFile]:
+        return [f for f in self.files if f.kind == "text"]
+
+    @property
+    def skipped(self) -> List[AttachedFile]:
+        return [f for f in self.files if f.kind != "text"]
+
+    @property
+    def chunks(self) -> List[Chunk]:
+        return [c for f in self.files for c in f.chunks]
+
+
+def is_binary(sample: bytes) -> bool:
+    """NUL bytes, or more than 10% control characters, mean not text."""
+    if not sample:
+        return False
+    if b"\0" in sample:
+        return True
+    controls = sum(1 for b in sample if b < 32 and b not in _TEXT_CONTROLS)
+    return controls * 10 > len(sample)
+
+
+def chunk_text(text: str, max_chars: int = CHUNK_CHARS) -> List[RawChunk]:
+    """Split on line boundaries into chunks of at most `max_chars` (long lines are cut)."""
+    out: List[RawChunk] = []
+    buf: List[str] = []
+    size = 0
+    start = 1
+    line_no = 0
+
+    def flush(end: int) -> None:
+        nonlocal buf, size, start
+        if buf:
+            out.append((len(out), start, end, "".join(buf)))
+        buf, size, start = [], 0, end + 1
+
+    for line_no, line in enumerate(text.splitlines(keepends=True), start=1):
+        while len(line) > max_chars:
+            flush(line_no - 1)
+            out.append((len(out), line_no, line_no, line[:max_chars]))
+            line = line[max_chars:]
+            start = line_no
+        if size + len(line) > max_chars:
+            flush(line_no - 1)
+        buf.append(line)
+        size += len(line)
+    flush(line_no)
+    return out
+
+
+def chunk_id(path: str, sha256: str, ordinal: int) -> str:
+    return hashlib.sha256(f"{path}\0{sha256}\0{ordinal}".encode("utf-8")).hexdigest()[:16]
+
+
+def _chunks(path: str, sha256: str, raw: Sequence[RawChunk]) -> List[Chunk]:
+    return [Chunk(chunk_id(path, sha256, o), path, o, a, b, text) for o, a, b, text in raw]
+
+
+class ChunkCache:
+    """Persistent file classification and chunks, keyed by content SHA-256.
+
+    Together with the stat-keyed `HashCache`, an unchanged file is
+    re-attached without being opened; identical content at another path
+    is chunked only once.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or (Path(user_config_dir("actcli", "actcli")) / CACHE_FILE)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS files (sha256 TEXT, chunk_chars INTEGER, kind TEXT, PRIMARY KEY (sha256, chunk_chars));"
+                "CREATE TABLE IF NOT EXISTS chunks (sha256 TEXT, chunk_chars INTEGER, ordinal INTEGER, start_line INTEGER,"
+                " end_line INTEGER, text TEXT, PRIMARY KEY (sha256, chunk_chars, ordinal));"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, digests: Iterable[str], chunk_chars: int) -> Dict[str, Tuple[str, List[RawChunk]]]:
+        """(kind, chunks) for each cached digest; unknown digests are left out."""
+        wanted = list(dict.fromkeys(digests))
+        out: Dict[str, Tuple[str, List[RawChunk]]] = {}
+        with self._lock:
+            conn = self._db()
+            for k in range(0, len(wanted), 500):
+                batch = wanted[k:k + 500]
+                marks = ",".join("?" * len(batch))
+                for sha256, kind in conn.execute(
+                    f"SELECT sha256, kind FROM files WHERE chunk_chars = ? AND sha256 IN ({marks})", (chunk_chars, *batch)
+                ):
+                    out[sha256] = (kind, [])
+                for sha256, *raw in conn.execute(
+                    "SELECT sha256, ordinal, start_line, end_line, text FROM chunks "
+                    f"WHERE chunk_chars = ? AND sha256 IN ({marks}) ORDER BY sha256, ordinal",
+                    (chunk_chars, *batch),
+                ):
+                    if sha256 in out:
+                        out[sha256][1].append(tuple(raw))  # type: ignore[arg-type]
+        return out
+
+    def put_many(self, items: Iterable[Tuple[str, int, str, Sequence[RawChunk]]]) -> None:
+        """Store (sha256, chunk_chars, kind, chunks) rows in one transaction."""
+        with self._lock:
+            conn = self._db()
+            with conn:
+                for sha256, chunk_chars, kind, raw in items:
+                    conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)", (sha256, chunk_chars, kind))
+                    conn.execute("DELETE FROM chunks WHERE sha256 = ? AND chunk_chars = ?", (sha256, chunk_chars))
+                    conn.executemany(
+                        "INSERT INTO chunks VALUES (?, ?, ?, ?, ?, ?)", [(sha256, chunk_chars, *c) for c in raw]
+                    )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _read_file(path: Path, st: os.stat_result, chunk_chars: int) -> Tuple[str, str, List[RawChunk], bool]:
+    """(sha256, kind, chunks, stable) for one file; runs on the pool."""
+    with open(path, "rb") as f:
+        if st.st_size == 0:
+            data: bytes | mmap.mmap = b""
+        else:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                data = f.read()
+        try:
+            digest = hashlib.sha256(data).hexdigest()
+            if is_binary(data[:SNIFF_BYTES]):
+                kind, raw = "binary", []
+            else:
+                kind, raw = "text", chunk_text(bytes(data).decode("utf-8", errors="replace"), chunk_chars)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    after = path.stat()
+    # Only cache if the file did not change while we were reading it
+    stable = (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns)
+    return digest, kind, raw, stable
+
+
+class Attacher:
+    """Policy-aware file attachment: walk, classify, read and chunk.
+
+    Only files the policy's read globs allow are visited, and denied
+    subtrees are pruned rather than filtered. Unchanged files are served
+    from the hash and chunk caches at the cost of one stat; the rest are
+    read through mmap on a thread pool (hashing releases the GIL).
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        root: Optional[Path] = None,
+        *,
+        hash_cache: Optional[HashCache] = None,
+        chunk_cache: Optional[ChunkCache] = None,
+        max_workers: Optional[int] = None,
+        chunk_chars: int = CHUNK_CHARS,
+        max_file_bytes: int = MAX_FILE_BYTES,
+    ) -> None:
+        self.policy = policy
+        self.root = (root or policy.root or Path.cwd()).resolve()
+        self.hash_cache = hash_cache if hash_cache is not None else HashCache()
+        self.chunk_cache = chunk_cache if chunk_cache is not None else ChunkCache()
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.chunk_chars = chunk_chars
+        self.max_file_bytes = max_file_bytes
+
+    def _pattern(self, pattern: str) -> Optional[str]:
+        """Root-relative glob for user input; a directory means everything below it."""
+        p = Path(pattern).expanduser()
+        if p.is_absolute():
+            try:
+                rel = p.resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                return None  # outside the project root
+        else:
+            rel = pattern.replace("\\", "/")
+        rel = rel.strip("/") or "."
+        if (self.root / rel).is_dir():
+            return "**" if rel == "." else f"{rel}/**"
+        return rel
+
+    def collect(self, patterns: Sequence[str]) -> List[str]:
+        """Relative paths matching `patterns` that the policy lets us read, sorted."""
+        globs = [g for g in (self._pattern(p) for p in patterns) if g]
+        if not globs:
+            return []
+        wanted = GlobSet(globs)
+        return sorted(wanted.walk(self.root, within=self.policy.globs("read"), skip_dirs=SKIP_DIRS))
+
+    def attach(self, patterns: Sequence[str]) -> AttachResult:
+        started = time.perf_counter()
+        files: Dict[int, AttachedFile] = {}
+        known: List[Tuple[int, str, Path, os.stat_result, CacheKey, str]] = []
+        misses: List[Tuple[int, str, Path, os.stat_result, CacheKey]] = []
+        for i, rel in enumerate(self.collect(patterns)):
+            path = self.root / rel
+            try:
+                st = path.stat()
+            except OSError:
+                files[i] = AttachedFile(rel, "", 0, "unreadable")
+                continue
+            if st.st_size > self.max_file_bytes:
+                files[i] = AttachedFile(rel, "", st.st_size, "too_large")
+                continue
+            key = cache_key(path, st)
+            digest = self.hash_cache.get(key)
+            if digest:
+                known.append((i, rel, path, st, key, digest))
+            else:
+                misses.append((i, rel, path, st, key))
+
+        cached = self.chunk_cache.get_many((k[5] for k in known), self.chunk_chars)
+        for i, rel, path, st, key, digest in known:
+            if digest in cached:
+                kind, raw = cached[digest]
+                files[i] = AttachedFile(rel, digest, st.st_size, kind, _chunks(rel, digest, raw))
+            else:
+                misses.append((i, rel, path, st, key))
+
+        if misses:
+            digests: List[Tuple[CacheKey, str]] = []
+            entries: List[Tuple[str, int, str, Sequence[RawChunk]]] = []
+            workers = min(self.max_workers, len(misses))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="actcli-attach") as pool:
+                futures = [(m, pool.submit(_read_file, m[2], m[3], self.chunk_chars)) for m in misses]
+                for (i, rel, _, st, key), fut in futures:
+                    try:
+                        digest, kind, raw, stable = fut.result()
+                    except OSError:
+                        files[i] = AttachedFile(rel, "", st.st_size, "unreadable")
+                        continue
+                    files[i] = AttachedFile(rel, digest, st.st_size, kind, _chunks(rel, digest, raw))
+                    if stable:
+                        digests.append((key, digest))
+                        entries.append((digest, self.chunk_chars, kind, raw))
+            self.hash_cache.put_many(digests)
+            self.chunk_cache.put_many(entries)
+
+        return AttachResult(
+            root=self.root,
+            files=[files[i] for i in sorted(files)],
+            read=len(misses),
+            elapsed_s=time.perf_counter() - started,
+        )
+
+    def close(self) -> None:
+        self.hash_cache.close()
+        self.chunk_cache.close()
+
+
+def render_chunk(c: Chunk) -> str:
+    return f"--- {c.path} (lines {c.start_line}-{c.end_line}) ---\n{c.text.rstrip()}\n"
+
+
+def format_context(chunks: Sequence[Chunk]) -> str:
+    """Render chunks as blocks labelled with path and line range."""
+    return "\n".join(render_chunk(c) for c in chunks)
+
+
+def with_context(prompt: str, context: str) -> str:
+    """The prompt as sent to models when files are attached."""
+    if not context:
+        return prompt
+    return f"Context (excerpts from attached files and earlier turns):\n\n{context}\n\nUsing the context where relevant, respond to:\n{prompt}"
@@ -4,7 +4,7 @@ import os
 from dataclasses import dataclass
 from typing import Dict, Optional
 
-from .store import CredentialStore, Credentials
+from .store import CredentialStore, Credentials, get_credential_store
 
 
 @dataclass
@@ -53,7 +53,7 @@ class ProviderRegistry:
 
     @classmethod
     def default(cls) -> "ProviderRegistry":
-        store = CredentialStore()
+        store = get_credential_store()
         providers = {
             "openai": Provider(id="openai", env_key="OPENAI_API_KEY", store=store),
             "anthropic": Provider(id="anthropic", env_key="ANTHROPIC_API_KEY", store=store),
@@ -10,7 +10,6 @@ from platformdirs import user_config_dir
 
 
 CONFIG_DIR = Path(user_config_dir("actcli", "actcli"))
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 CREDS_PATH = CONFIG_DIR / "credentials.json"
 
 
@@ -22,12 +21,17 @@ class Credentials:
 
 
 class CredentialStore:
-    def __init__(self) -> None:
-        self.path = CREDS_PATH
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or CREDS_PATH
         self._cache: Dict[str, Credentials] = {}
-        self._load()
+        self._loaded = False
 
     def _load(self) -> None:
+        # Read on first access, not construction, so commands that never look
+        # at credentials never touch the file
+        if self._loaded:
+            return
+        self._loaded = True
         if self.path.exists():
             try:
                 data = json.loads(self.path.read_text())
@@ -37,19 +41,35 @@ class CredentialStore:
                 pass
 
     def save(self) -> None:
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
         tmp = {k: vars(v) for k, v in self._cache.items()}
         self.path.write_text(json.dumps(tmp, indent=2))
         os.chmod(self.path, 0o600)
 
     def get(self, provider: str) -> Optional[Credentials]:
+        self._load()
         return self._cache.get(provider)
 
     def set(self, provider: str, creds: Credentials) -> None:
+        self._load()
         self._cache[provider] = creds
         self.save()
 
     def clear(self, provider: str) -> None:
+        self._load()
         if provider in self._cache:
             del self._cache[provider]
             self.save()
 
+
+
+_STORE: Optional[CredentialStore] = None
+
+
+def get_credential_store() -> CredentialStore:
+    """Process-wide credential store, created on first use."""
+    global _STORE
+    if _STORE is None:
+        _STORE = CredentialStore()
+    return _STORE
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import lzma
+import os
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-writer only
+    fcntl = None  # type: ignore[assignment]
+
+
+INDEX_FILE = "index"
+LOCK_FILE = "lock"
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+REF_PREFIX = "sha256:"
+
+# codec id -> (compress, decompress)
+_CODECS = {
+    "r": (lambda b: b, lambda b: b),
+    "z": (lambda b: zlib.compress(b, 6), zlib.decompress),
+    "x": (lambda b: lzma.compress(b, preset=6), lzma.decompress),
+}
+_CODEC_NAMES = {"raw": "r", "zlib": "z", "lzma": "x"}
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_ref(digest: str) -> str:
+    return REF_PREFIX + digest
+
+
+def parse_ref(ref: str) -> str:
+    return ref[len(REF_PREFIX):] if ref.startswith(REF_PREFIX) else ref
+
+
+@dataclass
+class BlobStats:
+    blobs: int
+    stored_bytes: int
+    raw_bytes: int
+
+
+class BlobStore:
+    """Content-addressed, compressed store for response texts.
+
+    Blobs are keyed by SHA-256 and appended once to size-capped segment files
+    (`seg-000000.pack`, ...). An append-only index maps digest to
+    (segment, offset, length, codec); it is read incrementally, so `get` is
+    a dict lookup plus one seek/read, and a miss first picks up index lines
+    other processes appended since. Writers hold an exclusive lock on
+    `lock` while appending, so concurrent REPLs record correct offsets.
+    Writing a digest that already exists is a no-op, which is what
+    deduplicates repeated responses.
+    """
+
+    def __init__(self, root: Path, codec: str = "zlib", segment_max_bytes: int = SEGMENT_MAX_BYTES) -> None:
+        self.root = root
+        self.codec = _CODEC_NAMES.get(codec, codec)
+        if self.codec not in _CODECS:
+            raise ValueError(f"Unknown codec: {codec}")
+        self._segment_max = segment_max_bytes
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int, int, str, int]] = {}
+        self._index_offset = 0  # bytes of the index file already read (complete lines only)
+        self._segment = 0
+
+    def _segment_path(self, seg: int) -> Path:
+        return self.root / f"seg-{seg:06d}.pack"
+
+    def _refresh_index(self) -> None:
+        """Read index lines appended since the last call (by this or any other process)."""
+        path = self.root / INDEX_FILE
+        try:
+            with open(path, "rb") as f:
+                f.seek(self._index_offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        end = chunk.rfind(b"\n") + 1  # a line still being written is read next time
+        for line in chunk[:end].decode("ascii", "replace").splitlines():
+            parts = line.split()
+            if len(parts) != 6:
+                continue  # torn line from a crash
+            digest, seg, off, length, codec, raw = parts
+            self._index[digest] = (int(seg), int(off), int(length), codec, int(raw))
+            self._segment = max(self._segment, int(seg))
+        self._index_offset += end
+
+    def _load_index(self) -> Dict[str, Tuple[int, int, int, str, int]]:
+        with self._lock:
+            if not self._index_offset:
+                self._refresh_index()
+            return self._index
+
+    def _lookup(self, digest: str) -> Optional[Tuple[int, int, int, str, int]]:
+        entry = self._load_index().get(digest)
+        if entry is None:
+            with self._lock:
+                self._refresh_index()
+                entry = self._index.get(digest)
+        return entry
+
+    def __contains__(self, digest: str) -> bool:
+        return self._lookup(parse_ref(digest)) is not None
+
+    def put(self, text: str) -> str:
+        """Store `text` if new and return its digest."""
+        raw = text.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest in self._load_index():
+            return digest
+        data = _CODECS[self.codec][0](raw)
+        codec = self.codec
+        if len(data) >= len(raw):
+            data, codec = raw, "r"
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.root / LOCK_FILE, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)  # released when the file closes
+            self._refresh_index()  # another process may have stored it, or opened a new segment
+            if digest in self._index:
+                return digest
+            seg_path = self._segment_path(self._segment)
+            if seg_path.exists() and seg_path.stat().st_size + len(data) > self._segment_max:
+                self._segment += 1
+                seg_path = self._segment_path(self._segment)
+            with open(seg_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(data)
+            # Index after data so a crash never leaves an entry pointing at missing bytes
+            with open(self.root / INDEX_FILE, "ab") as f:
+                size = f.seek(0, os.SEEK_END)
+                prefix = b"\n" if size > self._index_offset else b""  # terminate a torn line left by a crash
+                f.write(prefix + f"{digest} {self._segment} {offset} {len(data)} {codec} {len(raw)}\n".encode("ascii"))
+            self._refresh_index()
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        entry = self._lookup(parse_ref(digest))
+        if entry is None:
+            return None
+        seg, offset, length, codec, _ = entry
+        with open(self._segment_path(seg), "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+        return _CODECS[codec][1](data).decode("utf-8")
+
+    def stats(self) -> BlobStats:
+        index = self._load_index()
+        return BlobStats(
+            blobs=len(index),
+            stored_bytes=sum(e[2] for e in index.values()),
+            raw_bytes=sum(e[4] for e in index.values()),
+        )
+
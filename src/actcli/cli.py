@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
@@ -10,18 +10,19 @@ from rich.panel import Panel
 from rich.text import Text
 
 from .version import __version__
-from .config import load_config
-from .trust import get_trust
 
-# Subcommands are loaded lazily to keep import costs low
+# Subcommands, config and trust are loaded lazily to keep import costs low;
+# `actcli doctor --startup` reports what is left
 
 app = typer.Typer(name="actcli", add_completion=False, invoke_without_command=True, help="ActCLI — actuarial CLI with multi-model roundtable chat")
 console = Console()
-_CONFIG, _CONFIG_PATH = load_config()
 
 
 def _status_header() -> str:
-    mode = (_CONFIG.defaults.mode if _CONFIG else os.environ.get("ACTCLI_MODE", "hybrid")).upper()
+    from .config import get_config
+
+    cfg, _ = get_config()
+    mode = (cfg.defaults.mode if cfg else os.environ.get("ACTCLI_MODE", "hybrid")).upper()
     return f"ActCLI • chat(roundtable) • MODE: {mode} • v{__version__}"
 
 
@@ -41,7 +42,6 @@ def _first_run_banner_if_needed() -> None:
 
 @app.callback()
 def _root(ctx: typer.Context):
-    global _CONFIG, _CONFIG_PATH
     if ctx.invoked_subcommand is None:
         # Just go straight to chat - keep it simple!
         console.print(_status_header())
@@ -56,8 +56,27 @@ def version() -> None:
 
 
 @app.command()
-def doctor() -> None:
-    """Run environment self-checks (Python, TTY, ollama, API keys)."""
+def doctor(
+    startup: bool = typer.Option(False, "--startup", help="Profile CLI startup: per-module import cost vs budget"),
+    budget_ms: Optional[int] = typer.Option(None, "--budget-ms", help="Startup budget (default ACTCLI_STARTUP_BUDGET_MS or 250)"),
+    git: bool = typer.Option(False, "--git", help="Benchmark repository reads: git forks and wall time per command"),
+) -> None:
+    """Run environment self-checks (Python, TTY, ollama, API keys), or a profile instead.
+
+    --startup profiles per-module import cost against the startup budget, and
+    --git measures git forks and wall time for common repository reads. Either
+    one replaces the self-checks; with both, --git runs.
+    """
+    if git:
+        from .commands.doctor import run_git_report
+
+        run_git_report()
+        return
+    if startup:
+        from .commands.doctor import run_startup_report
+
+        run_startup_report(budget_ms)
+        return
     from .commands.doctor import run_doctor
 
     console.print(_status_header())
@@ -86,6 +105,8 @@ def chat(
     save: Optional[str] = typer.Option(None, "--save", help="Save transcript markdown to path (e.g., out/seminar.md)"),
     audit: Optional[str] = typer.Option(None, "--audit", help="Save audit-lite JSON to path (e.g., out/seminar_audit.json)"),
     presenter_state: Optional[str] = typer.Option(None, "--presenter-state", help="Write presenter state JSON (e.g., out/presenter/state.json)"),
+    session_log: Optional[str] = typer.Option(None, "--session-log", help="Append session events as JSONL to this path instead of a new file in out/sessions (ACTCLI_SESSION_DIR)"),
+    attach: Optional[List[str]] = typer.Option(None, "--attach", help="Input file recorded in the audit with SHA-256 and size (repeatable)"),
 ) -> None:
     """Multi-model chat: interactive by default, or one-shot with --prompt."""
     from .commands.chat import run_roundtable, run_chat_repl
@@ -95,7 +116,8 @@ def chat(
     # Simple logic: if prompt given, do one-shot; otherwise interactive
     if prompt:
         run_roundtable(prompt=prompt, multi=multi, rounds=rounds, timeout_s=timeout_s,
-                      ollama_host=ollama_host, save=save, audit=audit, presenter_state=presenter_state)
+                      ollama_host=ollama_host, save=save, audit=audit, presenter_state=presenter_state,
+                      session_log=session_log, attach=attach)
     else:
         # Interactive chat (what most people want)
         run_chat_repl(initial_multi=multi, rounds=rounds, timeout_s=timeout_s, ollama_host=ollama_host)
@@ -103,21 +125,27 @@ def chat(
 
 @app.command()
 def models(
-    action: str = typer.Argument("list", help="list|pull"),
+    action: str = typer.Argument("list", help="list|pull|adapters"),
     models: Optional[str] = typer.Option(None, "--models", help="Comma-separated model tags to pull"),
     all: bool = typer.Option(False, "--all", help="Pull a default set of useful models"),
     ollama_host: Optional[str] = typer.Option(None, "--ollama-host", help="Ollama base URL (default http://127.0.0.1:11435)"),
+    concurrency: Optional[int] = typer.Option(None, "--concurrency", help="Models pulled at once (default 3, or ACTCLI_PULL_CONCURRENCY)"),
+    retries: int = typer.Option(3, "--retries", help="Retries per model; interrupted downloads resume"),
 ) -> None:
-    """List or pull models from the configured Ollama host."""
-    from .commands.models import list_models, pull_models
+    """List or pull models from the configured Ollama host, or list adapter kinds."""
+    from .commands.models import list_adapters, list_models, pull_models
 
     if action == "list":
         list_models(ollama_host)
     elif action == "pull":
         ids = [m.strip() for m in (models.split(",") if models else []) if m.strip()]
-        pull_models(ollama_host, ids, use_default=all)
+        results = pull_models(ollama_host, ids, use_default=all, concurrency=concurrency, retries=retries)
+        if any(not r.ok for r in results):
+            raise SystemExit(1)
+    elif action == "adapters":
+        list_adapters()
     else:
-        raise SystemExit("Unknown action. Use: list|pull")
+        raise SystemExit("Unknown action. Use: list|pull|adapters")
 
 
 @app.command()
@@ -156,19 +184,21 @@ def mcp(
     action: str = typer.Argument("list", help="list|add|on|off|test|log|reload|restart"),
     name: Optional[str] = typer.Argument(None, help="Server name for actions that require it"),
     url: Optional[str] = typer.Option(None, "--url", help="Server URL (for add)"),
+    command: Optional[str] = typer.Option(None, "--command", help="Launch command of a stdio server (for add)"),
     group: Optional[str] = typer.Option(None, "--group", help="Group label (for add)"),
     desc: Optional[str] = typer.Option(None, "--desc", help="Description (for add)"),
     enable: Optional[bool] = typer.Option(None, "--enable", help="Enable/disable (for log)"),
+    all_servers: bool = typer.Option(False, "--all", help="Probe every enabled server concurrently (for test)"),
 ) -> None:
     """Manage MCP servers: list/add/on/off/test/log/reload/restart."""
-    from .commands.mcp import mcp_list, mcp_add, mcp_on_off, mcp_log, mcp_test, mcp_reload, mcp_restart
+    from .commands.mcp import mcp_list, mcp_add, mcp_on_off, mcp_log, mcp_test, mcp_test_all, mcp_reload, mcp_restart
 
     if action == "list":
         mcp_list()
     elif action == "add":
-        if not name or not url:
-            raise SystemExit("mcp add <name> --url <url> [--group g] [--desc '...']")
-        mcp_add(name, url, group, desc)
+        if not name or not (url or command):
+            raise SystemExit("mcp add <name> --url <url> | --command '<cmd>' [--group g] [--desc '...']")
+        mcp_add(name, url, group, desc, command=command)
     elif action == "on":
         if not name:
             raise SystemExit("mcp on <name>")
@@ -178,9 +208,12 @@ def mcp(
             raise SystemExit("mcp off <name>")
         mcp_on_off(name, False)
     elif action == "test":
-        if not name:
-            raise SystemExit("mcp test <name>")
-        mcp_test(name)
+        if all_servers:
+            mcp_test_all()
+        elif not name:
+            raise SystemExit("mcp test <name> | --all")
+        else:
+            mcp_test(name)
     elif action == "log":
         if not name or enable is None:
             raise SystemExit("mcp log <name> --enable {true|false}")
@@ -197,18 +230,59 @@ def mcp(
         raise SystemExit("Unknown action. Use: list|add|on|off|test|log|reload|restart")
 
 
+@app.command()
+def sessions(
+    action: str = typer.Argument("list", help="list|search|show|export"),
+    arg: Optional[str] = typer.Argument(None, help="Query (search), turn id (show) or session id (export)"),
+    page: int = typer.Option(1, "--page", min=1, help="Result page"),
+    limit: int = typer.Option(20, "--limit", min=1, max=200, help="Results per page"),
+    out: Optional[str] = typer.Option(None, "--out", help="Output path (for export)"),
+) -> None:
+    """Search and browse past roundtables indexed from session logs."""
+    from .commands.sessions import sessions_list, sessions_search, sessions_show, sessions_export
+
+    if action == "list":
+        sessions_list(page=page, limit=limit)
+    elif action == "search":
+        if not arg:
+            raise SystemExit("sessions search <query> [--page N]")
+        sessions_search(arg, page=page, limit=limit)
+    elif action == "show":
+        if not arg or not arg.isdigit():
+            raise SystemExit("sessions show <turn-id>")
+        sessions_show(int(arg))
+    elif action == "export":
+        if not arg or not arg.isdigit():
+            raise SystemExit("sessions export <session-id> [--out path.md]")
+        sessions_export(int(arg), out)
+    else:
+        raise SystemExit("Unknown action. Use: list|search|show|export")
+
+
+@app.command()
+def trust(
+    action: str = typer.Argument("status", help="status|allow-here|allow-once|revoke|list"),
+    cloud_share: Optional[bool] = typer.Option(None, "--cloud-share/--no-cloud-share", help="Allow sharing context with cloud models"),
+) -> None:
+    """Show or change trust for this folder (subfolders inherit the nearest grant)."""
+    from .commands.trust import run_trust
+
+    run_trust(action=action, scope=None, cloud_share=cloud_share)
+
+
 @app.command()
 def presenter(
     action: str = typer.Argument("start", help="start|prepare"),
     port: int = typer.Option(8765, "--port", help="Presenter HTTP port"),
     open: bool = typer.Option(True, "--open/--no-open", help="Open browser on start"),
+    max_connections: int = typer.Option(512, "--max-connections", help="Concurrent viewer connections before answering 503"),
 ) -> None:
     """Serve a lightweight presenter UI that reads state.json and renders the session."""
     from .commands.presenter import start_presenter, prepare_presenter
     from pathlib import Path
 
     if action == "start":
-        start_presenter(port=port, open_browser=open)
+        start_presenter(port=port, open_browser=open, max_connections=max_connections)
     elif action == "prepare":
         root = prepare_presenter(Path("out"))
         console.print(f"Prepared presenter files at: {root}")
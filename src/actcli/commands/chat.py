@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 from typing import List
 import os
+import queue
 from pathlib import Path
 
 from rich.console import Console
@@ -10,62 +12,197 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.rule import Rule
 from rich import box
-import httpx
 
 from ..seminar.adapters.echo import EchoAdapter
-from ..seminar.adapters.ollama import OllamaAdapter
-from ..seminar.adapters.openai import OpenAIAdapter
-from ..seminar.adapters.anthropic import AnthropicAdapter
-from ..seminar.adapters.gemini import GeminiAdapter
+from ..seminar.adapters.registry import default_registry
 from ..seminar.coordinator import run_round, TurnResult
 from ..seminar.synthesizer import summarize
-from ..transcript import write_transcript_md, write_audit_json, write_presenter_state
+from ..seminar.embeddings import resolve_embedder
+from ..transcript import write_presenter_state, latest_turn, write_views
+from ..session_log import SessionLog, new_session_path, open_blob_store
+from ..presenter_feed import PresenterPublisher, combine_hooks
 from ..policy import Policy, merge_policy
+from ..attach import AttachedFile, Attacher, AttachResult, format_context, with_context
+from ..retrieval import BM25Index, context_budget, session_chunk
+from ..review import Reviewer, ReviewOutcome, run_review
+from ..globset import GlobSet
 from ..ui.select import select_one
 from ..mcp.config import load_mcp_config, save_project_mcp_config
+from ..mcp.health import HealthMonitor, current_monitor, monitor_interval, start_monitor, stop_monitor
 
 
 console = Console()
 
 
 def _resolve_adapters(multi: str, ollama_host: str | None = None, allow_cloud: bool = True):
+    """Build adapters for comma-separated model ids via the adapter registry.
+
+    Unknown ids, cloud ids the policy does not allow, plugins that fail to
+    import, and adapters that fail to initialise (no API key, Ollama down)
+    fall back to the echo adapter.
+    """
     ids = [x.strip() for x in multi.split(",") if x.strip()]
+    registry = default_registry()
     adapters = []
     for i in ids:
-        # Local models via Ollama if available; otherwise echo fallback
-        if i.startswith("llama") or i.startswith("mistral") or i.startswith("qwen") or ":" in i:
-            try:
-                adapters.append(OllamaAdapter(model=i, host=ollama_host))
-                continue
-            except Exception:
-                # Fallback to echo if Ollama not reachable
-                pass
-        # Cloud placeholders for now
-        if i == "gpt" and allow_cloud:
-            try:
-                adapters.append(OpenAIAdapter())
-                continue
-            except Exception:
-                adapters.append(EchoAdapter(name="gpt(cloud)"))
-                continue
-        if i == "claude" and allow_cloud:
-            try:
-                adapters.append(AnthropicAdapter())
-                continue
-            except Exception:
-                adapters.append(EchoAdapter(name="claude(cloud)"))
-                continue
-        if i == "gemini" and allow_cloud:
-            try:
-                adapters.append(GeminiAdapter())
-                continue
-            except Exception:
-                adapters.append(EchoAdapter(name="gemini(cloud)"))
-                continue
-        adapters.append(EchoAdapter(name=i))
+        try:
+            spec = registry.resolve(i)
+        except Exception:
+            spec = None  # a broken plugin must not stop the chat from starting
+        if spec is None or (not spec.is_local and not allow_cloud):
+            adapters.append(EchoAdapter(name=i))
+            continue
+        try:
+            adapters.append(spec.create(i, ollama_host=ollama_host))
+        except Exception:
+            adapters.append(EchoAdapter(name=i if spec.is_local else f"{i}(cloud)"))
     return adapters
 
 
+def _open_session_log() -> SessionLog:
+    """Session log for a chat run; ACTCLI_SESSION_DIR relocates it, 'off' keeps it in memory."""
+    if os.environ.get("ACTCLI_SESSION_DIR") == "off":
+        return SessionLog()
+    log = SessionLog(new_session_path(), blobs=open_blob_store())
+    atexit.register(log.close)
+    return log
+
+
+def _round_hooks(log: SessionLog, turn: int, publisher: PresenterPublisher | None):
+    """(on_event, on_chunk) for run_round: session log plus live presenter push."""
+    if publisher is None:
+        return log.adapter_hook(turn), None
+    return combine_hooks(log.adapter_hook(turn), publisher.event_hook), publisher.chunk_hook
+
+
+def attach_files(
+    policy: Policy,
+    patterns: List[str],
+    attached: dict[str, AttachedFile],
+    index: BM25Index | None = None,
+    attacher: Attacher | None = None,
+) -> AttachResult:
+    """Run the attach pipeline and merge its text files into `attached` (keyed by absolute path).
+
+    With `index`, each file's chunks replace its previous ones in the retrieval index.
+    Pass the session's `attacher` to reuse its cache connections across calls;
+    without one, a temporary attacher is used and closed.
+    """
+    if attacher is None:
+        attacher = Attacher(policy)
+        try:
+            result = attacher.attach(patterns)
+        finally:
+            attacher.close()
+    else:
+        result = attacher.attach(patterns)
+    for f in result.text_files:
+        attached[str(result.root / f.path)] = f
+        if index is not None:
+            index.update_source(f.path, f.chunks)
+    skipped: dict[str, int] = {}
+    for f in result.skipped:
+        skipped[f.kind] = skipped.get(f.kind, 0) + 1
+    lines = [
+        f"Files: {len(result.text_files)} text, {len(result.chunks)} chunks",
+        f"Read: {result.read} • cached: {len(result.files) - result.read} • {result.elapsed_s:.2f}s",
+    ]
+    if skipped:
+        lines.append("Skipped: " + ", ".join(f"{n} {kind.replace('_', ' ')}" for kind, n in sorted(skipped.items())))
+    if not result.files:
+        lines = [f"No readable files match {' '.join(patterns)} (policy read globs: {', '.join(policy.read)})"]
+    console.print(Panel("\n".join(lines), title="Attach", border_style="cyan", padding=(0, 1)))
+    return result
+
+
+def detach_files(attached: dict[str, AttachedFile], patterns: List[str], index: BM25Index | None = None) -> int:
+    """Remove attached files whose relative path matches `patterns` (all when empty)."""
+    globs = GlobSet(patterns) if patterns else None
+    drop = [k for k, f in attached.items() if globs is None or globs.matches(f.path)]
+    for k in drop:
+        if index is not None:
+            index.drop_source(attached[k].path)
+        del attached[k]
+    return len(drop)
+
+
+def show_attached(attached: dict[str, AttachedFile]) -> None:
+    if not attached:
+        console.print("[bright_black]No files attached. Use /attach <glob>.[/bright_black]")
+        return
+    table = Table(box=box.SIMPLE)
+    table.add_column("File")
+    table.add_column("Size", justify="right")
+    table.add_column("Chunks", justify="right")
+    for f in sorted(attached.values(), key=lambda f: f.path):
+        table.add_row(f.path, str(f.size), str(len(f.chunks)))
+    console.print(table)
+
+
+def review_changes(
+    reviewer: Reviewer, adapters, spec: str | None = None, *, fresh: bool = False, timeout_s: int = 60, log: SessionLog | None = None
+) -> ReviewOutcome | None:
+    """Review a commit range with the participants; hunks reviewed before are not sent again."""
+    review = reviewer.collect(spec)
+    if review is None:
+        console.print(f"[red]Cannot resolve range {spec or '(default)'}; try /review main...HEAD.[/red]")
+        return None
+    chunks = review.chunks
+    denied = [f.path for f in review.files if f.kind == "denied"]
+    lines = [
+        f"Range: {review.range} • {len(review.files)} file(s), {len(chunks)} chunk(s)",
+        f"Diffed: {review.diffed} • cached: {len(review.files) - len(denied) - review.diffed} • {review.elapsed_s:.2f}s",
+    ]
+    if denied:
+        lines.append(f"Not sent (read policy): {', '.join(denied)}")
+
+    def on_plan(batches) -> None:
+        if batches:
+            per: dict[str, int] = {}
+            for a, _ in batches:
+                per[getattr(a, "name", "unknown")] = per.get(getattr(a, "name", "unknown"), 0) + 1
+            lines.append("Batches: " + ", ".join(f"{name} ×{n}" for name, n in per.items()))
+        console.print(Panel("\n".join(lines), title="Review", border_style="cyan", padding=(0, 1)))
+
+    turn = log.begin_turn(f"/review {spec or ''}".strip()) if log else 0
+    on_event = log.adapter_hook(turn) if log else None
+    outcome = run_review(review, adapters, reviewer.cache, fresh=fresh, timeout_s=timeout_s, on_event=on_event, on_plan=on_plan)
+    for batch, res in outcome.results:
+        paths = list(dict.fromkeys(c.path for c in batch))
+        title = f"{res.info.name} • {', '.join(paths[:3])}{' …' if len(paths) > 3 else ''}"
+        console.print(Panel(res.text or f"[red]{res.error or 'no output'}[/red]", title=title, border_style="magenta"))
+    if outcome.results and log:
+        log.record_results(turn, 1, [res for _, res in outcome.results])
+    if outcome.reused:
+        seen: dict[tuple[str, str], list[str]] = {}
+        for c in chunks:
+            for note in outcome.reused.get(c.id, []):
+                seen.setdefault(note, [])
+                if c.path not in seen[note]:
+                    seen[note].append(c.path)
+        body = "\n\n".join(f"[bold]{model}[/bold] ({', '.join(paths)}):\n{text}" for (model, text), paths in seen.items())
+        console.print(Panel(body, title=f"Unchanged since last review ({len(outcome.reused)} chunk(s))", border_style="bright_black"))
+    return outcome
+
+
+def _context_prompts(index: BM25Index, attached: dict[str, AttachedFile], query: str, adapters) -> tuple[list[str], dict[int, str]]:
+    """(attached files used, prompt per context budget) from retrieval over `index`.
+
+    Each distinct adapter budget gets its own selection of the best-ranked
+    chunks, so local models receive less context than cloud ones.
+    """
+    if not len(index):
+        return [], {}
+    owner = {c.id: key for key, f in attached.items() for c in f.chunks}
+    used: dict[str, None] = {}
+    prompts: dict[int, str] = {}
+    for budget in sorted({context_budget(a) for a in adapters}):
+        chunks = index.select(query, budget)
+        prompts[budget] = with_context(query, format_context(chunks))
+        used.update((owner[c.id], None) for c in chunks if c.id in owner)
+    return list(used), prompts
+
+
 def _render_results(title: str, results: List[TurnResult]):
     """Render model responses in a clean, professional format inspired by Claude CLI."""
     from ..ui.layout import CLILayout
@@ -89,6 +226,8 @@ def run_roundtable(
     save: str | None = None,
     audit: str | None = None,
     presenter_state: str | None = None,
+    session_log: str | None = None,
+    attach: List[str] | None = None,
 ) -> None:
     policy = merge_policy()
     adapters = _resolve_adapters(multi, ollama_host=ollama_host, allow_cloud=policy.cloud_share)
@@ -97,9 +236,28 @@ def run_roundtable(
         adapters = [a for a in adapters if getattr(a, "is_local", True)]
     if not prompt:
         prompt = "Compare two reserving strategies and highlight trade-offs."
+    missing = [p for p in attach or [] if not Path(p).is_file()]
+    if missing:
+        console.print(f"[red]Attachment not found: {', '.join(missing)}[/red]")
+        raise SystemExit(2)
+
+    if session_log:
+        log = SessionLog(Path(session_log), blobs=open_blob_store(Path(session_log).parent / "blobs"))
+    else:
+        log = _open_session_log()  # one-shot runs are searchable via `actcli sessions` too
+    publisher = PresenterPublisher.from_env()
+    turn = log.begin_turn(prompt)
+    for path in attach or []:
+        log.emit("attach", turn=turn, path=path)
+    if publisher:
+        publisher.prompt(prompt)
+    on_event, on_chunk = _round_hooks(log, turn, publisher)
 
     # Round 1
-    r1 = asyncio.run(run_round(adapters, prompt, seed=42, timeout_s=timeout_s, round_index=1))
+    r1 = asyncio.run(run_round(adapters, prompt, seed=42, timeout_s=timeout_s, round_index=1, on_event=on_event, on_chunk=on_chunk))
+    log.record_results(turn, 1, r1)
+    if publisher:
+        publisher.results(1, r1)
     _render_results("Round 1 — direct answers", r1)
 
     # Create snippets for critique
@@ -114,21 +272,51 @@ def run_roundtable(
     syn = None
     disagree = None
     if rounds >= 2:
-        r2 = asyncio.run(run_round(adapters, prompt, seed=42, timeout_s=timeout_s, round_index=2, context_snippets=quoted))
+        r2 = asyncio.run(run_round(adapters, prompt, seed=42, timeout_s=timeout_s, round_index=2, context_snippets=quoted, on_event=on_event, on_chunk=on_chunk))
+        log.record_results(turn, 2, r2)
         _render_results("Round 2 — critique & next checks", r2)
-        syn, disagree = summarize(r2)
+        syn, disagree = summarize(r2, embedder=resolve_embedder(ollama_host))
+        log.record_synthesis(turn, syn, disagree)
+        if publisher:
+            publisher.results(2, r2)
+            publisher.synthesis(syn, disagree)
         console.print(Panel(f"{syn}\nDisagreement score: {disagree}", title="Synthesis", border_style="magenta", padding=(0, 1)))
         final_results = r2
-
-    # Save transcript/audit if requested
+    log.close()
+    if publisher:
+        publisher.flush()
+
+    # Transcript/audit/presenter files are views of the session log
+    record = latest_turn(log)
+    if record:
+        write_views(
+            record,
+            header="Roundtable",
+            transcript=Path(save) if save else None,
+            audit=Path(audit) if audit else None,
+            presenter_state=Path(presenter_state) if presenter_state else None,
+            blobs=log.blobs,
+        )
     if save:
-        write_transcript_md(Path(save), header="Roundtable", prompt=prompt, results=final_results, synthesis=syn)
         console.print(f"Saved transcript to {save}")
     if audit:
-        write_audit_json(Path(audit), prompt=prompt, results=final_results, disagreement=disagree)
         console.print(f"Saved audit to {audit}")
-    if presenter_state:
-        write_presenter_state(Path(presenter_state), prompt=prompt, results=final_results, synthesis=syn, disagreement=disagree)
+
+
+def _report_presenter_write(notices: queue.SimpleQueue[str], path: str, error: BaseException | None) -> None:
+    """Queue the outcome of a background presenter write; the REPL prints it before its next prompt."""
+    if error is None:
+        notices.put(f"[dim]Presenter updated: {path}[/dim]")
+    else:
+        notices.put(f"[yellow]Presenter update failed ({path}): {error}[/yellow]")
+
+
+def _print_notices(notices: queue.SimpleQueue[str]) -> None:
+    while True:
+        try:
+            console.print(notices.get_nowait())
+        except queue.Empty:
+            return
 
 
 def run_chat_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host: str | None = None) -> None:
@@ -136,6 +324,7 @@ def run_chat_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
     # Check for layout preference
     import os
     layout_style = os.environ.get("ACTCLI_LAYOUT", "vscode")  # vscode, claude, or basic
+    monitor = _start_mcp_monitor()
 
     try:
         if layout_style == "vscode":
@@ -150,6 +339,25 @@ def run_chat_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
         console.print("[yellow]Advanced layout requires prompt_toolkit. Install with: pip install '.[tui]'[/yellow]")
         console.print("[yellow]Falling back to basic REPL...[/yellow]")
         return run_basic_repl(initial_multi, rounds, timeout_s, ollama_host)
+    finally:
+        if monitor is not None:
+            stop_monitor()
+
+
+def _start_mcp_monitor() -> HealthMonitor | None:
+    """Probe enabled MCP servers in the background for the session, if there are any."""
+    interval = monitor_interval()
+    if interval <= 0:
+        return None
+    try:
+        if not HealthMonitor().servers():
+            return None
+    except Exception:
+        return None  # unreadable MCP config: nothing to monitor
+    from ..mcp.stdio import session_manager
+
+    # stdio servers are pinged over the shared session's pipe instead of being re-spawned per probe
+    return start_monitor(interval_s=interval, sessions=session_manager())
 
 
 def run_vscode_style_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host: str | None = None) -> None:
@@ -186,7 +394,11 @@ def run_vscode_style_repl(initial_multi: str, rounds: int, timeout_s: int, ollam
             return f'<error>Error: {str(e)}</error>'
 
     # Create and run the VSCode-style CLI
-    cli = create_vscode_actcli(on_input=handle_input)
+    cli = create_vscode_actcli(on_input=handle_input, monitor=current_monitor())
+    try:
+        cli.app_state.mcp_servers = {name: s.enabled for name, s in load_mcp_config().servers.items()}
+    except Exception:
+        pass  # the sidebar just lists what the monitor knows
     cli.run()
 
 
@@ -250,10 +462,15 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
     """Fallback basic REPL for when prompt_toolkit is not available."""
     models: list[str] = [x.strip() for x in initial_multi.split(",") if x.strip()] or ["llama3", "claude", "gpt"]
     policy: Policy = merge_policy()
-    last_prompt: str | None = None
-    last_results: list[TurnResult] | None = None
-    last_syn: str | None = None
-    last_disagree: float | None = None
+    embedder = resolve_embedder(ollama_host)
+    log = _open_session_log()
+    publisher = PresenterPublisher.from_env()
+    attached: dict[str, AttachedFile] = {}
+    index = BM25Index()  # attached chunks and earlier turns, for per-prompt retrieval
+    reviewer: Reviewer | None = None
+    attacher: Attacher | None = None  # one per session, so its cache connections are reused
+    # Filled from the log writer thread, printed here so it never lands mid-output
+    notices: queue.SimpleQueue[str] = queue.SimpleQueue()
     console.print("[bright_black]Type /help (or /?) for commands; enter a prompt to run.[/bright_black]")
     console.print("")
 
@@ -269,10 +486,14 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
             ("/rounds", "Set rounds (1-3)"),
             ("/ollama", "Set Ollama host (enter URL)"),
             ("/save", "Save transcript (and optional audit)"),
+            ("/attach", "Attach files by glob (no glob: list attached)"),
+            ("/detach", "Drop attached files (all, or by glob)"),
+            ("/review", "Review a commit range (default: this branch; --fresh re-reviews all)"),
             ("/trust status", "Show trust info"),
             ("/trust allow-here", "Trust this folder (persist)"),
             ("/trust allow-once", "Trust this folder (session)"),
             ("/trust revoke", "Revoke trust for this folder"),
+            ("/trust list", "List trusted folders"),
             ("/share cloud on", "Enable cloud sharing"),
             ("/share cloud off", "Disable cloud sharing"),
             ("/mcp ui", "Manage MCP servers"),
@@ -345,10 +566,9 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
         if base == "/save":
             out_path = input("Transcript path (e.g., out/seminar.md): ").strip()
             audit_path = input("Audit path (optional): ").strip()
-            if last_results and last_prompt and out_path:
-                write_transcript_md(Path(out_path), header="Roundtable(REPL)", prompt=last_prompt, results=last_results, synthesis=last_syn)
-                if audit_path:
-                    write_audit_json(Path(audit_path), prompt=last_prompt, results=last_results, disagreement=last_disagree)
+            record = latest_turn(log)
+            if record and out_path:
+                write_views(record, header="Roundtable(REPL)", transcript=Path(out_path), audit=Path(audit_path) if audit_path else None, blobs=log.blobs)
                 console.print(f"Saved transcript to {out_path}" + (f" and audit to {audit_path}" if audit_path else ""))
             else:
                 console.print("Nothing to save yet; run a prompt first.")
@@ -385,6 +605,8 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
         if not host:
             return []
         try:
+            import httpx
+
             with httpx.Client(timeout=3.0) as client:
                 r = client.get(f"{host.rstrip('/')}/api/tags")
                 r.raise_for_status()
@@ -403,6 +625,7 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
 
     show_help()
     while True:
+        _print_notices(notices)
         # Claude CLI-style persistent header
         print_persistent_header(
             mode=policy.cloud_share and "HYBRID" or "OFFLINE",
@@ -497,10 +720,9 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
                 audit_path = None
                 if len(args) >= 3 and args[1].lower() == "audit":
                     audit_path = args[2]
-                if last_results and last_prompt:
-                    write_transcript_md(Path(out_path), header="Roundtable(REPL)", prompt=last_prompt, results=last_results, synthesis=last_syn)
-                    if audit_path is not None:
-                        write_audit_json(Path(audit_path), prompt=last_prompt, results=last_results, disagreement=last_disagree)
+                record = latest_turn(log)
+                if record:
+                    write_views(record, header="Roundtable(REPL)", transcript=Path(out_path), audit=Path(audit_path) if audit_path else None, blobs=log.blobs)
                     console.print(f"Saved transcript to {out_path}" + (f" and audit to {audit_path}" if audit_path else ""))
                 else:
                     console.print("Nothing to save yet; run a prompt first.")
@@ -511,6 +733,29 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
                 trust_cli(action=sub, scope=None, cloud_share=None)
                 policy = merge_policy()
                 continue
+            if cmd == "/attach":
+                if args:
+                    if attacher is None:
+                        attacher = Attacher(policy)
+                        atexit.register(attacher.close)
+                    attacher.policy = policy
+                    attach_files(policy, args, attached, index, attacher)
+                else:
+                    show_attached(attached)
+                continue
+            if cmd == "/detach":
+                gone = detach_files(attached, args, index)
+                console.print(f"Detached {gone} file(s); {len(attached)} still attached")
+                continue
+            if cmd == "/review":
+                if reviewer is None:
+                    reviewer = Reviewer(policy=policy)
+                reviewer.policy = policy
+                adapters = _resolve_adapters(",".join(models), ollama_host=ollama_host, allow_cloud=policy.cloud_share)
+                adapters = [a for a in adapters if policy.cloud_share or getattr(a, "is_local", True)]
+                spec = next((a for a in args if not a.startswith("--")), None)
+                review_changes(reviewer, adapters, spec, fresh="--fresh" in args, timeout_s=timeout_s, log=log)
+                continue
             if cmd == "/allow" and len(args) >= 2:
                 kind = args[0].lower()
                 glob = args[1]
@@ -561,7 +806,18 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
         if not policy.cloud_share and any(not getattr(a, "is_local", True) for a in adapters):
             console.print("[yellow]Cloud sharing disabled by policy; using local adapters only.[/yellow]")
             adapters = [a for a in adapters if getattr(a, "is_local", True)]
-        r1 = asyncio.run(run_round(adapters, line, seed=42, timeout_s=timeout_s, round_index=1))
+        turn = log.begin_turn(line)
+        paths, prompts = _context_prompts(index, attached, line, adapters)
+        for path in paths:
+            log.emit("attach", turn=turn, path=path)
+        prompt_for = (lambda a: prompts[context_budget(a)]) if prompts else None
+        if publisher:
+            publisher.prompt(line)
+        on_event, on_chunk = _round_hooks(log, turn, publisher)
+        r1 = asyncio.run(run_round(adapters, line, seed=42, timeout_s=timeout_s, round_index=1, prompt_for=prompt_for, on_event=on_event, on_chunk=on_chunk))
+        log.record_results(turn, 1, r1)
+        if publisher:
+            publisher.results(1, r1)
         _render_results("Round 1 — direct answers", r1)
         snippets = []
         for res in r1:
@@ -573,18 +829,22 @@ def run_basic_repl(initial_multi: str, rounds: int, timeout_s: int, ollama_host:
         syn = None
         disagree = None
         if rounds >= 2:
-            r2 = asyncio.run(run_round(adapters, line, seed=42, timeout_s=timeout_s, round_index=2, context_snippets=quoted))
+            r2 = asyncio.run(run_round(adapters, line, seed=42, timeout_s=timeout_s, round_index=2, context_snippets=quoted, prompt_for=prompt_for, on_event=on_event, on_chunk=on_chunk))
+            log.record_results(turn, 2, r2)
             _render_results("Round 2 — critique & next checks", r2)
-            syn, disagree = summarize(r2)
+            syn, disagree = summarize(r2, embedder=embedder)
+            log.record_synthesis(turn, syn, disagree)
+            if publisher:
+                publisher.results(2, r2)
+                publisher.synthesis(syn, disagree)
             console.print(Panel(f"{syn}\nDisagreement score: {disagree}", title="Synthesis", border_style="magenta"))
             final_results = r2
-        last_prompt, last_results, last_syn, last_disagree = line, final_results, syn, disagree
-        # Presenter auto-update if configured via env
+        # Later prompts can retrieve what was concluded here
+        index.add(session_chunk(turn, line, syn or "\n".join(f"{r.info.name}: {r.text}" for r in final_results if r.text)))
+        # Presenter auto-update if configured via env; rendered on the log writer thread
         state_path = os.environ.get("ACTCLI_PRESENTER_STATE")
         if state_path:
-            try:
-                write_presenter_state(Path(state_path), prompt=line, results=final_results, synthesis=syn, disagreement=disagree)
-                console.print(f"[dim]Presenter updated: {state_path}[/dim]")
-            except Exception:
-                pass
+            state = dict(prompt=line, results=final_results, synthesis=syn, disagreement=disagree)
+            written = log.call_soon(lambda: write_presenter_state(Path(state_path), **state))
+            written.add_done_callback(lambda f: _report_presenter_write(notices, state_path, f.exception()))
         # Keep output area clean; no bottom divider to avoid visual confusion
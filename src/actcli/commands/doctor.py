@@ -4,10 +4,13 @@ import os
 import platform
 import shutil
 import subprocess
+import sys
+import time
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -15,6 +18,8 @@ from rich.text import Text
 
 console = Console()
 
+STARTUP_BUDGET_MS = 250
+
 
 @dataclass
 class Check:
@@ -92,3 +97,149 @@ def build_doctor_lite_panel() -> Panel:
         txt.append("• ", style="bright_black")
         txt.append(line + ("\n" if i < len(items) - 1 else ""), style=style)
     return Panel(txt, title="Health Check", border_style="cyan")
+
+
+@dataclass
+class ImportCost:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+def parse_importtime(text: str) -> List[ImportCost]:
+    """Parse `python -X importtime` output (stderr) into per-module costs."""
+    costs: List[ImportCost] = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        name = parts[2].rstrip()
+        costs.append(ImportCost(
+            module=name.strip(),
+            self_ms=int(parts[0]) / 1000,
+            cumulative_ms=int(parts[1]) / 1000,
+            depth=(len(name) - len(name.lstrip(" ")) - 1) // 2,
+        ))
+    return costs
+
+
+def measure_startup(args: Tuple[str, ...] = ("version",), runs: int = 3) -> Tuple[float, List[ImportCost]]:
+    """Best-of-`runs` wall time in ms for `actcli <args>` in a fresh interpreter, plus its import profile."""
+    cmd = [sys.executable, "-m", "actcli", *args]
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, timeout=60)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    profile = subprocess.run([sys.executable, "-X", "importtime", *cmd[1:]], capture_output=True, text=True, timeout=60)
+    return best, parse_importtime(profile.stderr)
+
+
+def run_startup_report(budget_ms: Optional[int] = None, top: int = 12) -> None:
+    """Show where `actcli` startup time goes, measured in subprocesses."""
+    budget = budget_ms or int(os.environ.get("ACTCLI_STARTUP_BUDGET_MS", STARTUP_BUDGET_MS))
+    wall_ms, costs = measure_startup()
+    # Self time summed per top-level package, then our own modules individually
+    packages: Dict[str, float] = {}
+    for c in costs:
+        root = c.module.split(".")[0]
+        packages[root] = packages.get(root, 0.0) + c.self_ms
+    ours = sorted((c for c in costs if c.module.startswith("actcli")), key=lambda c: c.cumulative_ms, reverse=True)
+
+    table = Table(title="Import cost of `actcli version`", show_header=True, header_style="bold")
+    table.add_column("Package / module", style="cyan")
+    table.add_column("Self ms", justify="right")
+    table.add_column("Total ms", justify="right")
+    for name, ms in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        table.add_row(name, f"{ms:.1f}", "")
+    table.add_section()
+    for c in ours:
+        table.add_row(c.module, f"{c.self_ms:.1f}", f"{c.cumulative_ms:.1f}")
+    console.print(Panel(table, border_style="cyan"))
+
+    status = "[green]OK[/green]" if wall_ms <= budget else "[yellow]OVER BUDGET[/yellow]"
+    console.print(f"Startup: {wall_ms:.0f} ms (best of 3) • budget {budget} ms • {status}")
+    if wall_ms > budget:
+        console.print("[bright_black]Tip: move heavy imports into the functions that need them.[/bright_black]")
+
+
+@dataclass
+class GitCost:
+    command: str
+    forks: int
+    ms: float
+    legacy_forks: int
+    legacy_ms: float
+
+
+def measure_git(cwd: Optional[str] = None, runs: int = 3) -> List[GitCost]:
+    """git forks and best-of-`runs` wall time for the repo reads behind common commands.
+
+    Each run starts from an empty repo-state cache, as a fresh `actcli`
+    process would; "legacy" forces the git-subprocess detection path.
+    """
+    from ..git import local as git_local
+    from ..git.repo_state import _CACHE
+    from ..mcp.git_client import GitMCPClient
+
+    def scenarios(legacy: bool) -> Dict[str, Callable[[], object]]:
+        client = GitMCPClient()
+        client.base_url = None  # local reads only
+        client.local = git_local.LocalGit(cwd)
+        if legacy:
+            client.local.detect = client.local._detect_with_git  # type: ignore[method-assign]
+
+        def prepare_reads() -> None:
+            # What `pr prepare` reads besides its writes: detect, branch check, PR link
+            info = client.repo_detect()
+            client.branch_ensure(info.get("branch") or "")
+            client.pr_link("origin", None, "title", "")
+
+        return {
+            "repo detect": client.repo_detect,
+            "status": client.local.status,
+            "pr link": lambda: (client.repo_detect(), client.pr_link("origin", None, "", "")),
+            "pr prepare (reads)": prepare_reads,
+        }
+
+    def measure(fn: Callable[[], object]) -> Tuple[int, float]:
+        best, forks = float("inf"), 0
+        for _ in range(runs):
+            _CACHE.invalidate()
+            before = git_local.GIT_CALLS
+            start = time.perf_counter()
+            fn()
+            best = min(best, (time.perf_counter() - start) * 1000)
+            forks = git_local.GIT_CALLS - before
+        return forks, best
+
+    new, old = scenarios(False), scenarios(True)
+    out = []
+    for name in new:
+        forks, ms = measure(new[name])
+        legacy_forks, legacy_ms = measure(old[name])
+        out.append(GitCost(name, forks, ms, legacy_forks, legacy_ms))
+    return out
+
+
+def run_git_report() -> None:
+    """Show git subprocess counts and wall time per command, cached vs legacy."""
+    table = Table(title="Repository reads per command", show_header=True, header_style="bold")
+    table.add_column("Command", style="cyan")
+    table.add_column("git forks", justify="right")
+    table.add_column("ms", justify="right")
+    table.add_column("legacy forks", justify="right", style="bright_black")
+    table.add_column("legacy ms", justify="right", style="bright_black")
+    from ..git.status import StatusError
+
+    try:
+        costs = measure_git()
+    except StatusError as e:
+        console.print(f"[red]git status failed:[/red] {escape(str(e))}")
+        return
+    for c in costs:
+        table.add_row(c.command, str(c.forks), f"{c.ms:.1f}", str(c.legacy_forks), f"{c.legacy_ms:.1f}")
+    console.print(Panel(table, border_style="cyan"))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import os
+import subprocess
 from typing import Optional
 
 import httpx
@@ -9,6 +9,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ..mcp.config import MCPConfig, MCPServer, load_mcp_config, save_project_mcp_config
+from ..mcp.result_cache import CacheStats, cache_stats
 
 
 console = Console()
@@ -16,22 +17,40 @@ console = Console()
 
 def mcp_list() -> None:
     cfg = load_mcp_config()
+    stats = cache_stats()
     table = Table(title="Configured MCP servers", show_header=True, header_style="bold")
     table.add_column("Name", style="cyan")
     table.add_column("URL")
     table.add_column("Enabled")
     table.add_column("Group")
     table.add_column("Log")
+    table.add_column("Cache")
     for name, s in cfg.servers.items():
-        table.add_row(name, s.url, "on" if s.enabled else "off", s.group or "", "on" if s.log else "off")
+        table.add_row(
+            name, s.url or f"stdio: {s.command}", "on" if s.enabled else "off", s.group or "", _log_label(s), _cache_label(s, stats.get(name))
+        )
     console.print(Panel(table, border_style="cyan"))
 
 
-def mcp_add(name: str, url: str, group: Optional[str], desc: Optional[str]) -> None:
+def _cache_label(s: MCPServer, stats: Optional[CacheStats]) -> str:
+    if s.cache_ttl_s <= 0:
+        return "off"
+    if stats is None or not (stats.hits or stats.misses):
+        return "no lookups yet"
+    return f"{stats.hits} hits / {stats.misses} misses ({stats.hit_rate:.0%})"
+
+
+def _log_label(s: MCPServer) -> str:
+    if not s.log:
+        return "off"
+    return "on" if s.log_sample >= 1.0 else f"on ({s.log_sample:.0%} sampled)"
+
+
+def mcp_add(name: str, url: Optional[str], group: Optional[str], desc: Optional[str], command: Optional[str] = None) -> None:
     cfg = load_mcp_config()
-    cfg.servers[name] = MCPServer(name=name, url=url, enabled=True, group=group, desc=desc)
+    cfg.servers[name] = MCPServer(name=name, url=url or "", enabled=True, group=group, desc=desc, command=command)
     save_project_mcp_config(cfg)
-    console.print(Panel(f"Added MCP: {name} → {url}", border_style="green"))
+    console.print(Panel(f"Added MCP: {name} → {url or f'stdio: {command}'}", border_style="green"))
 
 
 def mcp_on_off(name: str, enable: bool) -> None:
@@ -72,16 +91,61 @@ def _probe(url: str) -> str:
             return f"unreachable: {e}"
 
 
+def _probe_stdio(server: MCPServer, restart: bool = False) -> str:
+    """Handshake through the shared session manager, so the session is reused, not re-spawned."""
+    from ..mcp.stdio import MCPError, session_manager
+
+    sessions = session_manager()
+    try:
+        session = sessions.restart(server.name) if restart else sessions.get(server.name)
+        tools = session.list_tools()
+        label = session.server_info.get("name") or server.name
+        return f"healthy ({label}, {len(tools)} tools)"
+    except MCPError as e:
+        return f"unreachable: {e}"
+
+
 def mcp_test(name: str) -> None:
     cfg = load_mcp_config()
     s = cfg.servers.get(name)
     if not s:
         console.print(f"Unknown MCP: {name}")
         raise SystemExit(2)
-    status = _probe(s.url)
+    status = _probe_stdio(s) if s.command else _probe(s.url)
     console.print(Panel(f"{name}: {status}", border_style=("green" if status.startswith("healthy") else "yellow")))
 
 
+def mcp_test_all() -> None:
+    """Probe every enabled server at once; takes as long as the slowest probe, not their sum."""
+    import asyncio
+
+    from ..mcp.health import PROBE_TIMEOUT_S, probe_all
+    from ..mcp.stdio import session_manager
+
+    cfg = load_mcp_config()
+    servers = [s for s in cfg.servers.values() if s.enabled and (s.url or s.command)]
+    if not servers:
+        console.print("No enabled MCP servers configured.")
+        return
+    results = asyncio.run(probe_all(servers, PROBE_TIMEOUT_S, sessions=session_manager()))
+    table = Table(title="MCP health", show_header=True, header_style="bold")
+    table.add_column("Name", style="cyan")
+    table.add_column("Transport")
+    table.add_column("Status")
+    table.add_column("Latency", justify="right")
+    for s, r in zip(servers, results):
+        table.add_row(
+            s.name,
+            "stdio" if s.command else "http",
+            f"[green]{r.detail}[/green]" if r.ok else f"[red]{r.detail}[/red]",
+            f"{r.latency_ms:.0f} ms",
+        )
+    down = sum(not r.ok for r in results)
+    console.print(Panel(table, border_style=("green" if not down else "yellow")))
+    if down:
+        raise SystemExit(1)
+
+
 def mcp_reload(name: str) -> None:
     cfg = load_mcp_config()
     s = cfg.servers.get(name)
@@ -105,10 +169,22 @@ def mcp_restart(name: str) -> None:
     if not s:
         console.print(f"Unknown MCP: {name}")
         raise SystemExit(2)
+    if s.command and not s.restart_cmd:
+        # stdio servers live as long as the session using them: restart ours and check the handshake
+        status = _probe_stdio(s, restart=True)
+        console.print(Panel(f"{name}: {status}", border_style=("green" if status.startswith("healthy") else "red")))
+        return
     if not s.restart_cmd:
         console.print("No restart_cmd configured for this MCP.")
         return
-    # Fire-and-forget shell command
-    os.system(s.restart_cmd)
-    console.print(Panel(f"Restart command invoked for {name}", border_style="green"))
+    try:
+        p = subprocess.run(s.restart_cmd, shell=True, capture_output=True, text=True, timeout=120)
+    except subprocess.TimeoutExpired:
+        console.print(Panel(f"Restart command for {name} timed out after 120s", border_style="red"))
+        return
+    if p.returncode == 0:
+        console.print(Panel(f"Restart command completed for {name}", border_style="green"))
+    else:
+        detail = (p.stderr or p.stdout).strip()[:200]
+        console.print(Panel(f"Restart command failed ({p.returncode}) for {name}: {detail}", border_style="red"))
 
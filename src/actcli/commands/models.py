@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import httpx
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn
-import json
+from rich.progress import BarColumn, DownloadColumn, Progress, TaskID, TextColumn, TransferSpeedColumn
 
 
 console = Console()
@@ -19,6 +24,9 @@ DEFAULT_MODELS = [
     "llama3:8b",
     "llama3.2:3b",
 ]
+PULL_CONCURRENCY = 3  # ACTCLI_PULL_CONCURRENCY / --concurrency
+PULL_RETRIES = 3
+RETRY_BACKOFF_S = 2.0  # doubled after each failed attempt
 
 
 def _resolve_host(ollama_host: Optional[str]) -> str:
@@ -47,60 +55,176 @@ def list_models(ollama_host: Optional[str]) -> None:
     console.print(Panel(table, border_style="cyan"))
 
 
-def pull_models(ollama_host: Optional[str], ids: Optional[List[str]], use_default: bool) -> None:
+@dataclass
+class PullResult:
+    name: str
+    ok: bool = False
+    error: str = ""
+    attempts: int = 0
+    downloaded: int = 0  # bytes transferred by this run; already-present (resumed) bytes excluded
+    elapsed_s: float = 0.0
+
+
+def iter_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Decode Ollama's NDJSON stream, tolerating several objects on one line."""
+    decoder = json.JSONDecoder()
+    for line in lines:
+        pos, end = 0, len(line)
+        while pos < end:
+            while pos < end and line[pos].isspace():
+                pos += 1
+            if pos >= end:
+                break
+            try:
+                ev, pos = decoder.raw_decode(line, pos)
+            except ValueError:
+                yield {"status": line[pos:].strip()}  # plain-text noise: show it as a status
+                break
+            if isinstance(ev, dict):
+                yield ev
+
+
+class _PullBoard:
+    """Byte accounting behind the shared progress display; updated from the pull threads."""
+
+    def __init__(self, progress: Progress) -> None:
+        self.progress = progress
+        self.overall = progress.add_task("[bold]all models", total=None, status="")
+        self._lock = threading.Lock()
+        # model -> layer (digest) -> [total, completed, completed when first seen this run]
+        self.layers: Dict[str, Dict[str, List[int]]] = {}
+
+    def layer(self, model: str, task: TaskID, key: str, total: int, completed: int) -> None:
+        with self._lock:
+            layers = self.layers.setdefault(model, {})
+            entry = layers.setdefault(key, [total, completed, completed])
+            entry[0], entry[1] = total, max(entry[1], completed)
+            self.progress.update(task, total=sum(e[0] for e in layers.values()), completed=sum(e[1] for e in layers.values()))
+            every = [e for ls in self.layers.values() for e in ls.values()]
+            self.progress.update(self.overall, total=sum(e[0] - e[2] for e in every), completed=sum(e[1] - e[2] for e in every))
+
+    def downloaded(self, model: str) -> int:
+        with self._lock:
+            return sum(e[1] - e[2] for e in self.layers.get(model, {}).values())
+
+
+class _StreamEnded(Exception):
+    """The pull stream closed before Ollama reported success."""
+
+
+def _retryable(e: Exception) -> bool:
+    """Transport failures and 5xx only; 4xx and errors Ollama reports in the stream (unknown model) are final."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    return isinstance(e, (httpx.TransportError, _StreamEnded))
+
+
+def _pull_one(client: httpx.Client, host: str, name: str, board: _PullBoard, retries: int) -> PullResult:
+    """Pull one model, re-issuing the request after transient failures; Ollama resumes partially downloaded layers."""
+    result = PullResult(name)
+    task = board.progress.add_task(name, total=None, status="waiting")
+    start = time.perf_counter()
+    for attempt in range(1, retries + 2):
+        result.attempts = attempt
+        try:
+            with client.stream("POST", f"{host}/api/pull", json={"name": name, "stream": True}) as resp:
+                resp.raise_for_status()
+                for ev in iter_events(resp.iter_lines()):
+                    if ev.get("error"):
+                        raise RuntimeError(ev["error"])
+                    status = ev.get("status", "")
+                    if ev.get("total"):
+                        board.layer(name, task, ev.get("digest") or status, int(ev["total"]), int(ev.get("completed") or 0))
+                    if status:
+                        board.progress.update(task, status=status)
+                    if status == "success":
+                        result.ok = True
+                        break
+            if result.ok:
+                break
+            raise _StreamEnded("stream ended before success")
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+            if attempt > retries or not _retryable(e):
+                break
+            board.progress.update(task, status=f"retry {attempt}/{retries}: {result.error}")
+            time.sleep(RETRY_BACKOFF_S * 2 ** (attempt - 1))
+    result.elapsed_s = time.perf_counter() - start
+    result.downloaded = board.downloaded(name)
+    if result.ok:
+        result.error = ""
+        total = board.progress.tasks[task].total
+        board.progress.update(task, completed=total or 1, total=total or 1, status="[green]done[/green]")
+    else:
+        board.progress.update(task, status=f"[red]failed[/red]: {result.error}")
+    return result
+
+
+def pull_models(
+    ollama_host: Optional[str],
+    ids: Optional[List[str]],
+    use_default: bool,
+    *,
+    concurrency: Optional[int] = None,
+    retries: int = PULL_RETRIES,
+) -> List[PullResult]:
     host = _resolve_host(ollama_host)
     targets = ids if ids else (DEFAULT_MODELS if use_default else [])
     if not targets:
         console.print("Provide --models or use --all to pull defaults.")
-        return
+        return []
+    workers = max(1, min(len(targets), concurrency or int(os.environ.get("ACTCLI_PULL_CONCURRENCY", PULL_CONCURRENCY))))
+    console.print(f"Pulling {len(targets)} model(s) @ {host} ({workers} at a time) …")
     # Disable read timeout for large pulls; keep connect short
     timeout = httpx.Timeout(connect=5.0, read=None, write=None, pool=None)
-    with httpx.Client(timeout=timeout) as client:
-        for name in targets:
-            console.print(f"Pulling [cyan]{name}[/cyan] @ {host} …")
-            try:
-                with client.stream("POST", f"{host}/api/pull", json={"name": name, "stream": True}) as resp:
-                    resp.raise_for_status()
-                    # Try to render a simple progress bar if totals are provided
-                    progress = None
-                    task_id = None
-                    for raw in resp.iter_lines():
-                        if not raw:
-                            continue
-                        # Some servers send multiple JSON objects per line; split if needed
-                        parts = [p for p in raw.splitlines() if p.strip()]
-                        for part in parts:
-                            try:
-                                ev = json.loads(part)
-                            except Exception:
-                                console.print(part)
-                                continue
-                            status = ev.get("status", "")
-                            total = ev.get("total")
-                            completed = ev.get("completed")
-                            if total and completed is not None:
-                                if progress is None:
-                                    progress = Progress(
-                                        TextColumn("[progress.description]{task.description}"),
-                                        BarColumn(),
-                                        TextColumn("{task.percentage:>3.0f}%"),
-                                        console=console,
-                                    )
-                                    progress.start()
-                                    task_id = progress.add_task(f"{name}", total=total)
-                                progress.update(task_id, completed=completed)
-                            elif status:
-                                console.print(f"  {status}")
-                            # Terminal condition
-                            if status == "success":
-                                if progress is not None:
-                                    progress.update(task_id, completed=progress.tasks[0].total)
-                                    progress.stop()
-                                console.print("  → done")
-                                break
-                    else:
-                        # If we exit loop without success message
-                        if progress is not None:
-                            progress.stop()
-            except Exception as e:
-                console.print(f"  → [red]failed[/red]: {e}")
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.percentage:>3.0f}%"),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TextColumn("{task.fields[status]}", style="bright_black"),
+        console=console,
+    )
+    start = time.perf_counter()
+    with httpx.Client(timeout=timeout, limits=httpx.Limits(max_connections=workers)) as client, progress:
+        board = _PullBoard(progress)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pull") as pool:
+            results = list(pool.map(lambda name: _pull_one(client, host, name, board, retries), targets))
+    elapsed = time.perf_counter() - start
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Model", style="cyan")
+    table.add_column("Result")
+    table.add_column("Downloaded", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Attempts", justify="right")
+    for r in results:
+        table.add_row(
+            r.name,
+            "[green]ok[/green]" if r.ok else f"[red]failed[/red]: {r.error}",
+            f"{r.downloaded / 1e6:,.1f} MB",
+            f"{r.elapsed_s:.1f}s",
+            str(r.attempts),
+        )
+    total = sum(r.downloaded for r in results)
+    ok = sum(r.ok for r in results)
+    title = f"Pulled {ok}/{len(results)} models: {total / 1e6:,.1f} MB in {elapsed:.1f}s ({total / 1e6 / max(elapsed, 1e-9):,.1f} MB/s)"
+    console.print(Panel(table, title=title, border_style=("green" if ok == len(results) else "yellow")))
+    return results
+
+
+def list_adapters() -> None:
+    """Show registered adapter kinds and their declared capabilities (no adapter imports)."""
+    from ..seminar.adapters.registry import default_registry
+
+    table = Table(title="Adapters", show_header=True, header_style="bold")
+    table.add_column("ID", style="cyan")
+    table.add_column("Matches")
+    table.add_column("Where")
+    table.add_column("Capabilities")
+    table.add_column("Summary", style="bright_black")
+    for spec in default_registry().specs():
+        matches = ", ".join([*spec.aliases, *(p + "*" for p in spec.prefixes)])
+        table.add_row(spec.id, matches, "local" if spec.is_local else "cloud", ", ".join(spec.capabilities.labels()) or "-", spec.summary)
+    console.print(Panel(table, border_style="cyan"))
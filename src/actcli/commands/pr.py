@@ -14,34 +14,23 @@ console = Console()
 
 
 def prepare(message: str, files: Optional[str], branch: Optional[str], target: Optional[str], remote: str, signoff: bool) -> None:
-    client = GitMCPClient()
-    info = client.repo_detect()
-    if not info.get("is_repo"):
+    patterns = [p.strip() for p in files.split(",") if p.strip()] if files else None
+    with GitMCPClient() as client:
+        # One request to a remote Git-MCP service; LocalGit otherwise
+        result = client.pr_prepare(
+            message=message,
+            branch=branch or "feat/actcli-change",
+            remote=remote,
+            target=target,
+            paths=patterns,
+            signoff=signoff,
+            # Make sure .gitignore includes large/local artifacts
+            gitignore=["models/", ".venv/", "__pycache__/,", "out/"],
+        )
+    if not result["is_repo"]:
         console.print("[red]Not a git repository.[/red]")
         raise SystemExit(2)
-
-    # Make sure .gitignore includes large/local artifacts
-    client.ensure_gitignore(["models/", ".venv/", "__pycache__/,", "out/"])
-
-    # Branch
-    br = branch or "feat/actcli-change"
-    client.branch_ensure(br)
-
-    # Stage files if provided
-    if files:
-        patterns = [p.strip() for p in files.split(",") if p.strip()]
-        client.add(patterns)
-
-    # Commit
-    commit_hash = client.commit(message=message, signoff=signoff, allow_empty=False)
-
-    # Push
-    client.push(remote=remote, branch=br)
-
-    # PR link
-    # Title/body from message
-    title, body = (message.split("\n", 1) + [""])[:2]
-    url = client.pr_link(remote=remote, target=target, title=title, body=body)
+    url = result["url"]
     if url:
         console.print(Panel(url, title="Create PR", border_style="cyan"))
     else:
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-import http.server
+import asyncio
+import gzip
+import hashlib
+import ipaddress
+import json
 import os
-import socketserver
+import sqlite3
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 from rich.console import Console
 from rich.panel import Panel
 
+from ..presenter_feed import PresenterHistory, PresenterHub
+from ..session_log import session_dir
+
 
 console = Console()
 
@@ -27,12 +37,19 @@ INDEX_HTML = """<!doctype html>
     <header>
       <h1>ActCLI Presenter</h1>
       <div id="meta"></div>
+      <button id="live" hidden>Back to live</button>
     </header>
-    <main>
-      <section id="prompt"></section>
-      <section id="responses"></section>
-      <section id="synthesis"></section>
-    </main>
+    <div id="layout">
+      <aside id="history" hidden>
+        <div class="history-title">History <span id="history-count"></span></div>
+        <div id="history-list"><div id="history-spacer"></div></div>
+      </aside>
+      <main>
+        <section id="prompt"></section>
+        <section id="responses"></section>
+        <section id="synthesis"></section>
+      </main>
+    </div>
     <script src="app.js"></script>
   </body>
   </html>
@@ -48,33 +65,160 @@ section { margin-bottom: 16px; }
 .card { background: #111827; border: 1px solid #1f2937; border-radius: 6px; padding: 12px; margin-bottom: 12px; }
 .model { color: #93c5fd; }
 .error { color: #fca5a5; }
+.live { border-style: dashed; }
+#layout { display: flex; align-items: flex-start; }
+#layout main { flex: 1; min-width: 0; }
+#history { width: 280px; flex: none; border-right: 1px solid #1f2937; height: calc(100vh - 60px); display: flex; flex-direction: column; }
+.history-title { padding: 8px 12px; color: #9ca3af; font-size: 12px; text-transform: uppercase; }
+#history-list { flex: 1; overflow-y: auto; position: relative; }
+#history-spacer { position: relative; }
+.hrow { position: absolute; left: 0; right: 0; height: 56px; box-sizing: border-box; padding: 6px 12px; border-bottom: 1px solid #1f2937; cursor: pointer; overflow: hidden; font-size: 13px; }
+.hrow:hover, .hrow.selected { background: #111827; }
+.hrow .when { color: #6b7280; font-size: 11px; }
+#live { margin-top: 6px; }
 """
 
 APP_JS = """
+let state = { prompt: '', results: [], streams: {}, synthesis: null, disagreement: null };
+let pending = false;
+let viewing = null;  // a past turn from api/turns/<id>, or null for the live view
+function render() {
+  pending = false;
+  if (viewing) { renderTurn(viewing); return; }
+  const s = state;
+  document.getElementById('meta').textContent = s.timestamp ? new Date(s.timestamp).toLocaleString() : '';
+  document.getElementById('prompt').innerHTML = `<div class="card"><strong>Prompt</strong><div>${escapeHtml(s.prompt || '')}</div></div>`;
+  const respEl = document.getElementById('responses');
+  respEl.innerHTML = '';
+  (s.results || []).forEach(r => {
+    const div = document.createElement('div');
+    div.className = 'card';
+    const header = `<div><span class="model">${escapeHtml(r.name)}</span> • ${r.latency_ms} ms ${r.local ? '• local' : ''}</div>`;
+    const body = r.text ? `<div>${escapeHtml(r.text)}</div>` : `<div class="error">${escapeHtml(r.error || 'no output')}</div>`;
+    div.innerHTML = header + body;
+    respEl.appendChild(div);
+  });
+  Object.entries(s.streams || {}).forEach(([name, text]) => {
+    const div = document.createElement('div');
+    div.className = 'card live';
+    div.innerHTML = `<div><span class="model">${escapeHtml(name)}</span> • streaming…</div><div>${escapeHtml(text)}</div>`;
+    respEl.appendChild(div);
+  });
+  const synEl = document.getElementById('synthesis');
+  synEl.innerHTML = s.synthesis ? `<div class="card"><strong>Synthesis</strong><div>${escapeHtml(s.synthesis)}</div></div>` : '';
+}
+function schedule() { if (!pending) { pending = true; requestAnimationFrame(render); } }
+function empty() { return { timestamp: null, prompt: '', round: 0, results: [], streams: {}, synthesis: null, disagreement: null }; }
+function apply(d) {
+  if (d.type === 'snapshot') { state = Object.assign(empty(), d.state || {}); }
+  else if (d.type === 'prompt') { state = Object.assign(empty(), { timestamp: d.timestamp, prompt: d.prompt }); }
+  else if (d.type === 'adapter_start') { state.round = d.round; state.streams[d.adapter] = ''; }
+  else if (d.type === 'chunk') { state.streams[d.adapter] = (state.streams[d.adapter] || '') + d.text; }
+  else if (d.type === 'results') { state.round = d.round; state.results = d.results || []; state.streams = {}; }
+  else if (d.type === 'synthesis') { state.synthesis = d.synthesis; state.disagreement = d.disagreement; }
+  if (d.type === 'results' || d.type === 'synthesis') refreshHistory();
+  schedule();
+}
+
+// Session history: rows are fetched a page at a time (newest first) and only
+// the rows in view are in the DOM, so hundreds of rounds stay cheap.
+const ROW = 56, PAGE = 50, OVERSCAN = 6;
+const hist = { session: null, items: [], total: 0, next: undefined, loading: false, selected: null, timer: null };
+async function api(path) {
+  const res = await fetch(path);
+  if (!res.ok) throw new Error(res.status);
+  return res.json();
+}
+async function loadHistoryPage(reset) {
+  if (hist.loading || (!reset && hist.next === null)) return;
+  hist.loading = true;
+  try {
+    let q = `api/turns?limit=${PAGE}`;
+    if (!reset && hist.session) q += `&session=${hist.session}&before=${hist.next}`;
+    const page = await api(q);
+    if (reset) { hist.items = []; }
+    hist.session = page.session; hist.total = page.total; hist.next = page.next;
+    hist.items = hist.items.concat(page.items);
+    document.getElementById('history').hidden = false;
+  } catch (e) { /* history disabled or unavailable */ }
+  hist.loading = false;
+  renderHistory();
+}
+function refreshHistory() {
+  clearTimeout(hist.timer);
+  hist.timer = setTimeout(() => loadHistoryPage(true), 1200);
+}
+function renderHistory() {
+  const box = document.getElementById('history-list');
+  const spacer = document.getElementById('history-spacer');
+  document.getElementById('history-count').textContent = hist.total ? `(${hist.total})` : '';
+  spacer.style.height = (hist.total * ROW) + 'px';
+  const first = Math.max(0, Math.floor(box.scrollTop / ROW) - OVERSCAN);
+  const last = Math.min(hist.total, Math.ceil((box.scrollTop + box.clientHeight) / ROW) + OVERSCAN);
+  if (last > hist.items.length) loadHistoryPage(false);
+  spacer.innerHTML = '';
+  for (let i = first; i < Math.min(last, hist.items.length); i++) {
+    const it = hist.items[i];
+    const row = document.createElement('div');
+    row.className = 'hrow' + (hist.selected === it.id ? ' selected' : '');
+    row.style.top = (i * ROW) + 'px';
+    row.innerHTML = `<div class="when">#${it.turn} • ${it.t ? new Date(it.t).toLocaleTimeString() : ''} • ${it.responses} responses</div><div>${escapeHtml(it.prompt)}</div>`;
+    row.onclick = () => openTurn(it.id);
+    spacer.appendChild(row);
+  }
+}
+async function openTurn(id) {
+  try { viewing = await api(`api/turns/${id}`); } catch (e) { return; }
+  hist.selected = id;
+  document.getElementById('live').hidden = false;
+  renderHistory();
+  schedule();
+}
+async function expandResponse(id) {
+  const r = await api(`api/responses/${id}`);
+  viewing.rounds.forEach(rd => rd.responses.forEach(x => { if (x.id === id) { x.preview = r.text || ''; x.length = x.preview.length; } }));
+  schedule();
+}
+function renderTurn(t) {
+  document.getElementById('meta').textContent = `Turn ${t.turn} • ${t.t ? new Date(t.t).toLocaleString() : ''}`;
+  document.getElementById('prompt').innerHTML = `<div class="card"><strong>Prompt</strong><div>${escapeHtml(t.prompt)}</div></div>`;
+  const respEl = document.getElementById('responses');
+  respEl.innerHTML = '';
+  t.rounds.forEach(rd => rd.responses.forEach(r => {
+    const div = document.createElement('div');
+    div.className = 'card';
+    const more = r.length > r.preview.length ? ` <a href="#" data-id="${r.id}">show all (${r.length} chars)</a>` : '';
+    const body = r.error ? `<div class="error">${escapeHtml(r.error)}</div>` : `<div>${escapeHtml(r.preview)}${more}</div>`;
+    div.innerHTML = `<div>R${rd.round} • <span class="model">${escapeHtml(r.name)}</span> • ${r.latency_ms} ms ${r.local ? '• local' : ''}</div>` + body;
+    const link = div.querySelector('a[data-id]');
+    if (link) link.onclick = e => { e.preventDefault(); expandResponse(r.id); };
+    respEl.appendChild(div);
+  }));
+  document.getElementById('synthesis').innerHTML = t.synthesis ? `<div class="card"><strong>Synthesis</strong><div>${escapeHtml(t.synthesis)}</div></div>` : '';
+}
+document.getElementById('history-list').addEventListener('scroll', () => requestAnimationFrame(renderHistory));
+document.getElementById('live').onclick = () => {
+  viewing = null; hist.selected = null;
+  document.getElementById('live').hidden = true;
+  renderHistory(); schedule();
+};
+loadHistoryPage(true);
 async function loadState() {
   try {
     const res = await fetch('state.json', { cache: 'no-store' });
     if (!res.ok) return;
-    const s = await res.json();
-    document.getElementById('meta').textContent = new Date(s.timestamp).toLocaleString();
-    document.getElementById('prompt').innerHTML = `<div class="card"><strong>Prompt</strong><div>${escapeHtml(s.prompt || '')}</div></div>`;
-    const respEl = document.getElementById('responses');
-    respEl.innerHTML = '';
-    (s.results || []).forEach(r => {
-      const div = document.createElement('div');
-      div.className = 'card';
-      const header = `<div><span class="model">${r.name}</span> • ${r.latency_ms} ms ${r.local ? '• local' : ''}</div>`;
-      const body = r.text ? `<div>${escapeHtml(r.text)}</div>` : `<div class="error">${escapeHtml(r.error || 'no output')}</div>`;
-      div.innerHTML = header + body;
-      respEl.appendChild(div);
-    });
-    const synEl = document.getElementById('synthesis');
-    synEl.innerHTML = s.synthesis ? `<div class="card"><strong>Synthesis</strong><div>${escapeHtml(s.synthesis)}</div></div>` : '';
+    apply({ type: 'snapshot', state: await res.json() });
   } catch (e) { /* ignore */ }
 }
 function escapeHtml(str) { return (str || '').replace(/[&<>]/g, c => ({'&':'&amp;','<':'&lt;','>':'&gt;'}[c])); }
-setInterval(loadState, 1500);
-loadState();
+if (window.EventSource) {
+  // Server pushes a snapshot on connect, then small deltas
+  const es = new EventSource('events');
+  es.onmessage = e => apply(JSON.parse(e.data));
+} else {
+  setInterval(loadState, 1500);
+  loadState();
+}
 """
 
 
@@ -87,20 +231,314 @@ def prepare_presenter(out_dir: Path) -> Path:
     return root
 
 
-def start_presenter(port: int = 8765, open_browser: bool = True) -> None:
-    root = prepare_presenter(Path("out"))
-    os.chdir(root)
-    handler = http.server.SimpleHTTPRequestHandler
-    with socketserver.TCPServer(("127.0.0.1", port), handler) as httpd:
-        url = f"http://127.0.0.1:{port}/"
-        console.print(Panel(f"Presenter serving {root}\nURL: {url}", title="Presenter", border_style="cyan"))
-        if open_browser:
+@dataclass
+class _Asset:
+    body: bytes
+    gzipped: bytes
+    etag: str
+    content_type: str
+
+
+def _asset(body: bytes, content_type: str) -> _Asset:
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return _Asset(body=body, gzipped=gzip.compress(body, 6), etag=etag, content_type=content_type)
+
+
+_STATIC = {
+    "/": ("index.html", "text/html; charset=utf-8"),
+    "/index.html": ("index.html", "text/html; charset=utf-8"),
+    "/style.css": ("style.css", "text/css; charset=utf-8"),
+    "/app.js": ("app.js", "application/javascript; charset=utf-8"),
+}
+_REASONS = {200: "OK", 204: "No Content", 304: "Not Modified", 400: "Bad Request", 403: "Forbidden",
+            404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class PresenterServer:
+    """Single-threaded asyncio HTTP server for the presenter.
+
+    Static assets and each state version are encoded (and gzipped) once and
+    served to every viewer with ETags, so a 304 costs a header compare. SSE
+    viewers share the hub's pre-encoded messages. Connections beyond
+    `max_connections` get an immediate 503 instead of queueing. Session
+    history queries (`/api/...`) run on one worker thread so SQLite never
+    blocks the loop.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        hub: Optional[PresenterHub] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_connections: int = 512,
+        state_file: Optional[Path] = None,
+        ping_s: float = 15.0,
+        history: Optional[PresenterHistory] = None,
+    ) -> None:
+        self.root = root
+        self.hub = hub or PresenterHub()
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.state_file = state_file
+        self.ping_s = ping_s
+        self.active = 0
+        self.assets = {path: _asset((root / name).read_bytes(), ctype) for path, (name, ctype) in _STATIC.items()}
+        self._state_asset: Tuple[int, Optional[_Asset]] = (-1, None)
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+        self._thread: Optional[threading.Thread] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self.history = history
+        self._history_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="actcli-history") if history else None
+
+    # Lifecycle -----------------------------------------------------------
+    async def start(self) -> int:
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.state_file is not None:
+            self._tasks.append(asyncio.create_task(self._watch_state_file()))
+        return self.port
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_background(self) -> int:
+        """Run on a daemon thread with its own loop; returns the bound port."""
+        ready = threading.Event()
+
+        def _run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+            pending = asyncio.all_tasks(loop)
+            for t in pending:
+                t.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+
+        self._thread = threading.Thread(target=_run, name="actcli-presenter", daemon=True)
+        self._thread.start()
+        ready.wait(5)
+        return self.port
+
+    def stop(self) -> None:
+        """Stop listening; also stops the loop if `start_background` created it."""
+        loop = self._loop
+        if loop is None:
+            return
+
+        def _close() -> None:
+            for t in self._tasks:
+                t.cancel()
+            if self._server is not None:
+                self._server.close()
+            for w in list(self._writers):
+                w.close()
+            if self._history_pool is not None:
+                self._history_pool.submit(self.history.close)
+                self._history_pool.shutdown(wait=False)
+            if self._thread is not None:
+                loop.stop()
+
+        if self._thread is None:
+            _close()
+        else:
+            loop.call_soon_threadsafe(_close)
+            self._thread.join(5)
+
+    async def _watch_state_file(self, interval_s: float = 0.5) -> None:
+        """Push state.json rewrites (ACTCLI_PRESENTER_STATE) to viewers as snapshots."""
+        assert self.state_file is not None
+        last = None
+        while True:
             try:
-                webbrowser.open(url)
-            except Exception:
+                st = self.state_file.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                if key != last:
+                    last = key
+                    self.hub.publish({"type": "snapshot", "state": json.loads(self.state_file.read_text(encoding="utf-8"))})
+            except (OSError, ValueError):
                 pass
+            await asyncio.sleep(interval_s)
+
+    # HTTP ----------------------------------------------------------------
+    def _state(self) -> _Asset:
+        version, asset = self._state_asset
+        if asset is None or version != self.hub.version:
+            asset = _asset(json.dumps(self.hub.state).encode("utf-8"), "application/json")
+            self._state_asset = (self.hub.version, asset)
+        return asset
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self.active >= self.max_connections:
+            self._write(writer, 503, b"busy", "text/plain", keep_alive=False)
+            await self._close(writer)
+            return
+        self.active += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), timeout=30)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+                    break
+                if request is None:
+                    break
+                method, path, query, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if method == "GET" and path == "/events":
+                    await self._stream_events(writer)
+                    break
+                if method == "GET" and path.startswith("/api/"):
+                    await self._serve_history(writer, path, query, headers, keep_alive)
+                elif method == "GET":
+                    self._serve_asset(writer, path, headers, keep_alive)
+                elif method == "POST" and path == "/publish":
+                    self._publish(writer, body, keep_alive)
+                else:
+                    self._write(writer, 405, b"", "text/plain", keep_alive=keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.active -= 1
+            self._writers.discard(writer)
+            await self._close(writer)
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            raise ValueError("bad request line")
+        method, target, _ = parts
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if ":" in line:
+                k, v = line.split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+        length = int(headers.get("content-length") or 0)
+        if length > 1024 * 1024:
+            raise ValueError("body too large")
+        body = await reader.readexactly(length) if length else b""
+        url = urlsplit(target)
+        return method.upper(), url.path, url.query, headers, body
+
+    def _write(self, writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str, *,
+               keep_alive: bool = True, extra: Optional[Dict[str, str]] = None) -> None:
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}", f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+        head.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        for k, v in (extra or {}).items():
+            head.append(f"{k}: {v}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _serve_asset(self, writer: asyncio.StreamWriter, path: str, headers: Dict[str, str], keep_alive: bool) -> None:
+        asset = self._state() if path == "/state.json" else self.assets.get(path)
+        if asset is None:
+            self._write(writer, 404, b"not found", "text/plain", keep_alive=keep_alive)
+            return
+        self._send_asset(writer, asset, headers, keep_alive)
+
+    def _send_asset(self, writer: asyncio.StreamWriter, asset: _Asset, headers: Dict[str, str], keep_alive: bool) -> None:
+        extra = {"ETag": asset.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if headers.get("if-none-match") == asset.etag:
+            self._write(writer, 304, b"", asset.content_type, keep_alive=keep_alive, extra=extra)
+            return
+        if "gzip" in headers.get("accept-encoding", ""):
+            extra["Content-Encoding"] = "gzip"
+            self._write(writer, 200, asset.gzipped, asset.content_type, keep_alive=keep_alive, extra=extra)
+        else:
+            self._write(writer, 200, asset.body, asset.content_type, keep_alive=keep_alive, extra=extra)
+
+    async def _serve_history(self, writer: asyncio.StreamWriter, path: str, query: str, headers: Dict[str, str], keep_alive: bool) -> None:
+        if self.history is None:
+            self._write(writer, 404, b"history disabled", "text/plain", keep_alive=keep_alive)
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            payload = await loop.run_in_executor(self._history_pool, self.history.query, path, parse_qs(query))
+        except ValueError:
+            self._write(writer, 400, b"bad request", "text/plain", keep_alive=keep_alive)
+            return
+        except (sqlite3.Error, OSError):
+            # Locked or corrupt index, unreadable log or blob: the viewer can retry
+            self._write(writer, 500, b"history unavailable", "text/plain", keep_alive=keep_alive)
+            return
+        if payload is None:
+            self._write(writer, 404, b"not found", "text/plain", keep_alive=keep_alive)
+            return
+        self._send_asset(writer, _asset(json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json"), headers, keep_alive)
+
+    def _publish(self, writer: asyncio.StreamWriter, body: bytes, keep_alive: bool) -> None:
+        peer = writer.get_extra_info("peername")
+        # Only the local REPL may publish
+        if not peer or not ipaddress.ip_address(peer[0]).is_loopback:
+            self._write(writer, 403, b"forbidden", "text/plain", keep_alive=keep_alive)
+            return
+        try:
+            payload = json.loads(body or b"[]")
+        except ValueError:
+            self._write(writer, 400, b"bad json", "text/plain", keep_alive=keep_alive)
+            return
+        for delta in payload if isinstance(payload, list) else [payload]:
+            if isinstance(delta, dict):
+                self.hub.publish(delta)
+        self._write(writer, 204, b"", "text/plain", keep_alive=keep_alive)
+
+    async def _stream_events(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-store\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+        )
+        q = self.hub.subscribe()
+        try:
+            while True:
+                try:
+                    msg = await asyncio.wait_for(q.get(), timeout=self.ping_s)
+                except asyncio.TimeoutError:
+                    msg = b": ping\n\n"
+                if msg is None:
+                    break
+                writer.write(msg)
+                await writer.drain()
+        finally:
+            self.hub.unsubscribe(q)
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
         try:
-            httpd.serve_forever()
-        except KeyboardInterrupt:
-            console.print("Stopping presenter…")
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
 
+
+def start_presenter(port: int = 8765, open_browser: bool = True, max_connections: int = 512) -> None:
+    root = prepare_presenter(Path("out"))
+    history_dir = session_dir()
+    history = None if os.environ.get("ACTCLI_SESSION_DIR") == "off" else PresenterHistory(history_dir)
+    server = PresenterServer(root, port=port, max_connections=max_connections, state_file=root / "state.json", history=history)
+    url = f"http://127.0.0.1:{port}/"
+    console.print(Panel(f"Presenter serving {root}\nURL: {url}\nLive push from the REPL: export ACTCLI_PRESENTER_URL={url.rstrip('/')}", title="Presenter", border_style="cyan"))
+    if open_browser:
+        try:
+            webbrowser.open(url)
+        except Exception:
+            pass
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        console.print("Stopping presenter…")
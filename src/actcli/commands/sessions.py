@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from rich.console import Console
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from ..session_log import result_from_dict
+from ..session_store import SessionStore
+from ..transcript import render_transcript_md
+
+
+console = Console()
+
+
+def _open_store() -> SessionStore:
+    store = SessionStore()
+    store.sync()
+    return store
+
+
+def sessions_list(page: int, limit: int) -> None:
+    with _open_store() as store:
+        rows = store.list_sessions(limit=limit, offset=(page - 1) * limit)
+    table = Table(title=f"Sessions (page {page})", show_header=True, header_style="bold")
+    table.add_column("ID", style="cyan")
+    table.add_column("Started")
+    table.add_column("Turns")
+    table.add_column("Log", style="bright_black")
+    for s in rows:
+        table.add_row(str(s.id), s.started or "", str(s.turns), s.source)
+    console.print(Panel(table, border_style="cyan"))
+
+
+def sessions_search(query: str, page: int, limit: int) -> None:
+    with _open_store() as store:
+        hits = store.search(query, limit=limit, offset=(page - 1) * limit)
+    if not hits:
+        console.print(Text(f"No matches for: {query}"))
+        return
+    table = Table(title=f"Matches for '{escape(query)}' (page {page})", show_header=True, header_style="bold")
+    table.add_column("Turn", style="cyan")
+    table.add_column("Session")
+    table.add_column("When")
+    table.add_column("Where")
+    table.add_column("Snippet")
+    for h in hits:
+        where = h.kind + (f" • {h.adapter}" if h.adapter else "")
+        table.add_row(str(h.turn_id), str(h.session_id), h.t, where, Text(h.snippet.replace("\n", " ")))
+    console.print(Panel(table, border_style="cyan"))
+    console.print(f"[bright_black]Next page: actcli sessions search '{escape(query)}' --page {page + 1}[/bright_black]")
+
+
+def sessions_show(turn_id: int) -> None:
+    with _open_store() as store:
+        found = store.get_turn(turn_id)
+    if not found:
+        console.print(f"Unknown turn: {turn_id}")
+        raise SystemExit(2)
+    turn, responses = found
+    # Prompts and model output are plain text: "[b]" or "[/]" in them is not markup
+    console.print(Panel(Text(turn["prompt"]), title=f"Prompt • turn {turn_id} • {turn['t']}", border_style="cyan"))
+    for r in responses:
+        body = Text(r["text"]) if r["text"] else Text(f"error: {r['error'] or 'no output'}", style="red")
+        console.print(Panel(body, title=f"R{r['round']} • {r['adapter']} • {r['latency_ms']} ms", border_style="bright_black"))
+    if turn["synthesis"]:
+        console.print(Panel(Text(f"{turn['synthesis']}\nDisagreement score: {turn['disagreement']}"), title="Synthesis", border_style="magenta"))
+
+
+def sessions_export(session_id: int, out: Optional[str]) -> None:
+    """Export every turn of a session as Markdown transcripts in one file."""
+    out_path = Path(out or f"out/session-{session_id}.md")
+    with _open_store() as store:
+        turn_ids = store.session_turn_ids(session_id)
+        if not turn_ids:
+            console.print(f"Unknown or empty session: {session_id}")
+            raise SystemExit(2)
+        parts = []
+        for tid in turn_ids:
+            turn, responses = store.get_turn(tid)
+            last_round = max((r["round"] for r in responses), default=1)
+            results = [
+                result_from_dict({"id": r["adapter"], "name": r["adapter"], "local": bool(r["local"]), "version": r["version"],
+                                  "latency_ms": r["latency_ms"] or 0, "text": r["text"], "error": r["error"]})
+                for r in responses
+                if r["round"] == last_round
+            ]
+            parts.append(render_transcript_md(f"Session {session_id} • turn {turn['turn']} • {turn['t']}", turn["prompt"], results, turn["synthesis"]))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text("\n".join(parts), encoding="utf-8")
+    console.print(f"Exported session {session_id} ({len(turn_ids)} turns) to {out_path}")
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import time
+from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
-from ..trust import get_trust, set_trust, revoke_trust
+from ..trust import get_trust, list_trust, set_trust, revoke_trust
 
 
 console = Console()
 
 
+def _expiry(expires_at: Optional[float]) -> str:
+    if expires_at is None:
+        return "never"
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(expires_at))
+
+
 def run_trust(action: str, scope: Optional[str], cloud_share: Optional[bool]) -> None:
     action = action.lower()
     if action == "status":
@@ -18,7 +27,8 @@ def run_trust(action: str, scope: Optional[str], cloud_share: Optional[bool]) ->
         if not tr:
             console.print(Panel("Untrusted. Use 'actcli trust allow-here' to trust this folder.", title="Trust", border_style="yellow"))
         else:
-            lines = [f"path: {tr.path}", f"scope: {tr.scope}", f"read: {', '.join(tr.read)}", f"write: {', '.join(tr.write)}", f"cloud_share: {tr.cloud_share}"]
+            inherited = "" if Path(tr.path) == Path.cwd().resolve() else " (inherited)"
+            lines = [f"path: {tr.path}{inherited}", f"scope: {tr.scope}", f"expires: {_expiry(tr.expires_at)}", f"read: {', '.join(tr.read)}", f"write: {', '.join(tr.write)}", f"cloud_share: {tr.cloud_share}"]
             console.print(Panel("\n".join(lines), title="Trust", border_style="green"))
         return
     if action in ("allow-here", "allow-once"):
@@ -30,8 +40,22 @@ def run_trust(action: str, scope: Optional[str], cloud_share: Optional[bool]) ->
         console.print(Panel(f"Trusted this folder (scope={scope_val}, cloud_share={cs}).", border_style="green"))
         return
     if action == "revoke":
-        revoke_trust()
-        console.print(Panel("Trust revoked for this folder.", border_style="yellow"))
+        if revoke_trust():
+            console.print(Panel("Trust revoked for this folder.", border_style="yellow"))
+        else:
+            inherited = get_trust()
+            note = f" It inherits trust from {inherited.path}; revoke it there." if inherited else ""
+            console.print(Panel("This folder had no trust grant of its own." + note, border_style="yellow"))
+        return
+    if action == "list":
+        table = Table(title="Trusted folders", show_header=True, header_style="bold")
+        table.add_column("Path", style="cyan")
+        table.add_column("Scope")
+        table.add_column("Expires")
+        table.add_column("Cloud")
+        for tr in list_trust():
+            table.add_row(tr.path, tr.scope, _expiry(tr.expires_at), "yes" if tr.cloud_share else "no")
+        console.print(Panel(table, border_style="cyan"))
         return
-    console.print("Unknown action. Use: status|allow-here|allow-once|revoke")
+    console.print("Unknown action. Use: status|allow-here|allow-once|revoke|list")
 
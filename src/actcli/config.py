@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -24,6 +25,7 @@ class Defaults:
     output_dir: str = "out"
     models: str = "llama3,claude,gpt"
     ollama_host: Optional[str] = None
+    embed_model: Optional[str] = None  # e.g. nomic-embed-text; enables semantic disagreement
 
 
 @dataclass
@@ -47,6 +49,7 @@ def _parse_config(path: Path) -> Config:
             output_dir=defaults.get("output_dir", Defaults.output_dir),
             models=defaults.get("models", Defaults.models),
             ollama_host=defaults.get("ollama_host"),
+            embed_model=defaults.get("embed_model"),
         ),
     )
     return cfg
@@ -59,12 +62,21 @@ def load_config(cwd: Optional[Path] = None) -> tuple[Config, Optional[Path]]:
     if proj_path.exists():
         return _parse_config(proj_path), proj_path
     # Fallback to user config
-    udir = Path(user_config_dir("actcli", "actcli"))
-    udir.mkdir(parents=True, exist_ok=True)
-    user_path = udir / PROJECT_FILE
+    user_path = Path(user_config_dir("actcli", "actcli")) / PROJECT_FILE
     return _parse_config(user_path), (user_path if user_path.exists() else None)
 
 
+def get_config(cwd: Optional[Path] = None) -> tuple[Config, Optional[Path]]:
+    """Like `load_config`, but served from the shared snapshot (re-parsed only on change).
+
+    The config is a copy, so callers may adjust it without affecting others.
+    """
+    from .snapshot import current_snapshot
+
+    snap = current_snapshot(cwd)
+    return copy.deepcopy(snap.config), snap.config_path
+
+
 def write_project_config(path: Path, cfg: Config) -> None:
     lines = [
         "[project]",
@@ -80,5 +92,10 @@ def write_project_config(path: Path, cfg: Config) -> None:
     ]
     if cfg.defaults.ollama_host:
         lines.append(f"ollama_host = \"{cfg.defaults.ollama_host}\"")
+    if cfg.defaults.embed_model:
+        lines.append(f"embed_model = \"{cfg.defaults.embed_model}\"")
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    from .snapshot import invalidate
+
+    invalidate()
 
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from typing import IO, List, Optional, Sequence, Tuple
+
+
+# Requests up to this size are written without a helper thread (pipe buffers hold 64 KiB)
+INLINE_REQUEST_BYTES = 16 * 1024
+
+
+class BatchError(RuntimeError):
+    """The `git cat-file` helper could not be started or keeps failing."""
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    oid: str
+    type: str  # blob|tree|commit|tag
+    size: int
+
+
+@dataclass(frozen=True)
+class GitObject:
+    oid: str
+    type: str
+    size: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    mode: str
+    type: str  # blob|tree|commit (submodule)
+    oid: str
+    name: str
+
+
+@dataclass(frozen=True)
+class Commit:
+    oid: str
+    tree: str
+    parents: Tuple[str, ...]
+    author: str
+    committer: str
+    message: str
+    headers: Tuple[Tuple[str, str], ...] = field(default=(), repr=False)
+
+
+def parse_tree(data: bytes, oid_len: int = 20) -> List[TreeEntry]:
+    """Entries of a raw tree object (`<mode> <name>\\0<binary oid>` records)."""
+    out: List[TreeEntry] = []
+    i, n = 0, len(data)
+    while i < n:
+        sp = data.index(b" ", i)
+        nul = data.index(b"\0", sp)
+        mode = data[i:sp].decode("ascii")
+        oid = data[nul + 1:nul + 1 + oid_len].hex()
+        kind = "tree" if mode == "40000" else "commit" if mode == "160000" else "blob"
+        out.append(TreeEntry(mode.zfill(6), kind, oid, data[sp + 1:nul].decode("utf-8", errors="surrogateescape")))
+        i = nul + 1 + oid_len
+    return out
+
+
+def parse_commit(oid: str, data: bytes) -> Commit:
+    head, _, message = data.decode("utf-8", errors="replace").partition("\n\n")
+    headers: List[Tuple[str, str]] = []
+    for line in head.splitlines():
+        if line.startswith(" ") and headers:
+            # Continuation (e.g. gpgsig)
+            key, value = headers[-1]
+            headers[-1] = (key, value + "\n" + line[1:])
+        else:
+            key, _, value = line.partition(" ")
+            headers.append((key, value))
+    values = dict(headers)
+    return Commit(
+        oid=oid, tree=values.get("tree", ""), parents=tuple(v for k, v in headers if k == "parent"),
+        author=values.get("author", ""), committer=values.get("committer", ""), message=message, headers=tuple(headers),
+    )
+
+
+class CatFile:
+    """A long-lived `git cat-file --batch` (or `--batch-check`) helper.
+
+    Requests are object names, one per line; responses come back in
+    order, so `query` pipelines a whole list through one round trip: a
+    writer thread feeds stdin while the caller reads stdout, which keeps
+    both pipes draining however many objects are asked for. If the helper
+    exits or the pipe breaks, it is restarted and the request retried once.
+    """
+
+    def __init__(self, cwd: str, *, check: bool = False) -> None:
+        self.cwd = cwd
+        self.check = check
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self.starts = 0  # helper processes spawned, for diagnostics
+
+    def _start(self) -> subprocess.Popen:
+        from . import local
+
+        local.GIT_CALLS += 1
+        self.starts += 1
+        try:
+            return subprocess.Popen(
+                ["git", "cat-file", "--batch-check" if self.check else "--batch"],
+                cwd=self.cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise BatchError(f"cannot start git cat-file: {e}") from e
+
+    def _process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = self._start()
+        return self._proc
+
+    @staticmethod
+    def _feed(stdin: IO[bytes], revs: Sequence[str]) -> None:
+        try:
+            stdin.write("".join(f"{r}\n" for r in revs).encode("utf-8"))
+            stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            pass  # the reader sees EOF and triggers a restart
+
+    def _read_exact(self, stdout: IO[bytes], n: int) -> bytes:
+        chunks, remaining = [], n
+        while remaining:
+            chunk = stdout.read(remaining)
+            if not chunk:
+                raise EOFError("git cat-file closed its output")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def _roundtrip(self, revs: Sequence[str]) -> List[Optional[GitObject]]:
+        proc = self._process()
+        assert proc.stdin is not None and proc.stdout is not None
+        writer: Optional[threading.Thread] = None
+        if sum(len(r) + 1 for r in revs) <= INLINE_REQUEST_BYTES:
+            self._feed(proc.stdin, revs)  # fits in the pipe buffer: cannot block
+        else:
+            writer = threading.Thread(target=self._feed, args=(proc.stdin, revs), daemon=True)
+            writer.start()
+        out: List[Optional[GitObject]] = []
+        try:
+            for _ in revs:
+                header = proc.stdout.readline()
+                if not header:
+                    raise EOFError("git cat-file closed its output")
+                parts = header.decode("utf-8", errors="replace").split()
+                if len(parts) != 3 or not parts[2].isdigit():
+                    out.append(None)  # "<name> missing" or "<name> ambiguous"
+                    continue
+                oid, kind, size = parts[0], parts[1], int(parts[2])
+                data = b""
+                if not self.check:
+                    data = self._read_exact(proc.stdout, size + 1)[:-1]  # trailing LF
+                out.append(GitObject(oid, kind, size, data))
+        except BaseException:
+            self._kill()  # unblocks the writer, and the next query starts afresh
+            raise
+        finally:
+            if writer is not None:
+                writer.join()
+        return out
+
+    def query(self, revs: Sequence[str]) -> List[Optional[GitObject]]:
+        """Objects (or None when missing) for `revs`, in order, in one pipelined round trip."""
+        if any("\n" in r for r in revs):
+            raise ValueError("object names cannot contain newlines")
+        if not revs:
+            return []
+        with self._lock:
+            for attempt in (0, 1):
+                try:
+                    return self._roundtrip(revs)
+                except (EOFError, OSError) as e:
+                    if attempt:
+                        raise BatchError(f"git cat-file failed: {e}") from e
+        raise AssertionError("unreachable")
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except Exception:
+            pass
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                if pipe:
+                    pipe.close()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()  # EOF: git exits on its own
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+class ObjectReader:
+    """Blob, tree and commit reads over a pair of persistent cat-file helpers."""
+
+    def __init__(self, cwd: str) -> None:
+        self._batch = CatFile(cwd)
+        self._check = CatFile(cwd, check=True)
+
+    def info(self, revs: Sequence[str]) -> List[Optional[ObjectInfo]]:
+        return [ObjectInfo(o.oid, o.type, o.size) if o else None for o in self._check.query(revs)]
+
+    def objects(self, revs: Sequence[str]) -> List[Optional[GitObject]]:
+        return self._batch.query(revs)
+
+    def blob(self, rev: str) -> Optional[bytes]:
+        """Contents of e.g. `HEAD:path/to/file` or a blob id; None if missing or not a blob."""
+        obj = self.objects([rev])[0]
+        return obj.data if obj and obj.type == "blob" else None
+
+    def tree(self, rev: str) -> Optional[List[TreeEntry]]:
+        """Entries of a tree (`HEAD^{tree}`, `HEAD:src`, ...); None if missing."""
+        if ":" not in rev and "^{" not in rev:
+            rev = f"{rev}^{{tree}}"
+        obj = self.objects([rev])[0]
+        if obj is None or obj.type != "tree":
+            return None
+        return parse_tree(obj.data, oid_len=len(obj.oid) // 2)
+
+    def commit(self, rev: str = "HEAD") -> Optional[Commit]:
+        obj = self.objects([f"{rev}^{{commit}}"])[0]
+        return parse_commit(obj.oid, obj.data) if obj and obj.type == "commit" else None
+
+    def close(self) -> None:
+        self._batch.close()
+        self._check.close()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Pathspecs per `git diff` call, well under any command-line limit
+PATHS_PER_CALL = 500
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass(frozen=True)
+class DiffEntry:
+    status: str  # A|M|D|R|C|T (rename/copy scores dropped)
+    old_mode: str
+    new_mode: str
+    old_oid: str  # all zeros when added
+    new_oid: str  # all zeros when deleted
+    path: str  # new path (old path for deletions)
+    old_path: Optional[str] = None  # source of a rename or copy
+
+    @property
+    def blobs(self) -> Tuple[str, str]:
+        return self.old_oid, self.new_oid
+
+
+@dataclass(frozen=True)
+class Hunk:
+    old_start: int
+    old_lines: int
+    new_start: int
+    new_lines: int
+    text: str  # "@@ ... @@" header plus body lines
+
+
+def git_bytes(args: Sequence[str], cwd: Optional[str] = None) -> Tuple[int, bytes]:
+    """(exit code, raw stdout) of a git command; for NUL-separated output that must not be decoded as text."""
+    from . import local
+
+    local.GIT_CALLS += 1
+    try:
+        p = subprocess.run(["git", *args], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return 127, b""
+    return p.returncode, p.stdout
+
+
+def parse_raw(data: bytes) -> List[DiffEntry]:
+    """Entries of `git diff --raw -z --no-abbrev` output."""
+    fields = data.split(b"\0")
+    out: List[DiffEntry] = []
+    i = 0
+    while i < len(fields) and fields[i].startswith(b":"):
+        old_mode, new_mode, old_oid, new_oid, status = fields[i][1:].decode("ascii").split(" ")
+        kind = status[0]
+        if kind in "RC":
+            old, new = os.fsdecode(fields[i + 1]), os.fsdecode(fields[i + 2])
+            out.append(DiffEntry(kind, old_mode, new_mode, old_oid, new_oid, new, old))
+            i += 3
+        else:
+            out.append(DiffEntry(kind, old_mode, new_mode, old_oid, new_oid, os.fsdecode(fields[i + 1])))
+            i += 2
+    return out
+
+
+def split_patch(text: str) -> Dict[Tuple[str, str], str]:
+    """Per-file sections of a `--full-index` patch, keyed by their (old, new) blob ids.
+
+    Sections without an `index` line (pure renames, mode changes) carry no
+    hunks and are left out.
+    """
+    out: Dict[Tuple[str, str], str] = {}
+    for section in re.split(r"(?m)^(?=diff --git )", text):
+        m = re.search(r"(?m)^index ([0-9a-f]+)\.\.([0-9a-f]+)", section)
+        if m:
+            out[(m.group(1), m.group(2))] = section
+    return out
+
+
+def parse_hunks(section: str) -> List[Hunk]:
+    """Hunks of one file's patch section; binary or hunk-less sections give []."""
+    hunks: List[Hunk] = []
+    current: Optional[List[str]] = None
+    header: Optional[re.Match] = None
+
+    def flush() -> None:
+        if current is not None and header is not None:
+            hunks.append(Hunk(
+                int(header.group(1)), int(header.group(2) or 1), int(header.group(3)), int(header.group(4) or 1),
+                "".join(current),
+            ))
+
+    for line in section.splitlines(keepends=True):
+        m = _HUNK.match(line)
+        if m:
+            flush()
+            current, header = [line], m
+        elif current is not None:
+            current.append(line)
+    flush()
+    return hunks
+
+
+def diff_entries(cwd: str, base: str, head: str) -> List[DiffEntry]:
+    """Files changed between two commits, with blob ids (rename detection on)."""
+    code, out = git_bytes(["diff", "--raw", "-z", "--no-abbrev", "-M", "--no-ext-diff", base, head, "--"], cwd=cwd)
+    return parse_raw(out) if code == 0 else []
+
+
+def diff_sections(cwd: str, base: str, head: str, entries: Sequence[DiffEntry]) -> Dict[Tuple[str, str], str]:
+    """Patch sections for `entries`, keyed by (old, new) blob ids, in as few git calls as possible."""
+    out: Dict[Tuple[str, str], str] = {}
+    for k in range(0, len(entries), PATHS_PER_CALL):
+        paths: List[str] = []
+        for e in entries[k:k + PATHS_PER_CALL]:
+            paths.append(e.path)
+            if e.old_path is not None:
+                paths.append(e.old_path)  # keeps the rename pair inside the pathspec
+        code, data = git_bytes(
+            ["--literal-pathspecs", "diff", "--full-index", "--no-color", "--no-ext-diff", "--no-textconv", "-M", "-U3",
+             base, head, "--", *paths],
+            cwd=cwd,
+        )
+        if code == 0:
+            out.update(split_patch(data.decode("utf-8", errors="replace")))
+    return out
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import atexit
 import os
 import shlex
 import subprocess
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .batch import Commit, ObjectReader, TreeEntry
+from .diff import DiffEntry, diff_entries
+from .repo_state import Unsupported, repo_state
+from .status import StatusTracker
+
+
+# git subprocesses started by this process, for `actcli doctor --git`
+GIT_CALLS = 0
 
 
 def _run_git(args: List[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
+    global GIT_CALLS
+    GIT_CALLS += 1
     try:
         p = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
         return p.returncode, p.stdout.strip(), p.stderr.strip()
@@ -27,8 +39,44 @@ class RepoInfo:
 class LocalGit:
     def __init__(self, cwd: Optional[str] = None) -> None:
         self.cwd = cwd or os.getcwd()
+        self._objects: Optional[ObjectReader] = None
+        self._status: Optional[StatusTracker] = None
+
+    @property
+    def objects(self) -> ObjectReader:
+        """Persistent `git cat-file` helpers for blob/tree/commit reads without a fork per query."""
+        if self._objects is None:
+            self._objects = ObjectReader(self.cwd)
+            atexit.register(self._objects.close)
+        return self._objects
+
+    def read_blob(self, rev: str) -> Optional[bytes]:
+        return self.objects.blob(rev)
+
+    def read_tree(self, rev: str) -> Optional[List[TreeEntry]]:
+        return self.objects.tree(rev)
+
+    def read_commit(self, rev: str = "HEAD") -> Optional[Commit]:
+        return self.objects.commit(rev)
+
+    def close(self) -> None:
+        if self._objects is not None:
+            self._objects.close()
+            self._objects = None
 
     def detect(self) -> RepoInfo:
+        """Repository info read from `.git` (cached until it changes), else from git."""
+        try:
+            state = repo_state(self.cwd)
+        except (Unsupported, OSError):
+            return self._detect_with_git()
+        if state is None:
+            return RepoInfo(is_repo=False, remotes={})
+        return RepoInfo(
+            True, root=state.root, branch=state.branch or "HEAD", default_branch=state.default_branch, remotes=dict(state.remotes)
+        )
+
+    def _detect_with_git(self) -> RepoInfo:
         code, out, _ = _run_git(["rev-parse", "--is-inside-work-tree"], cwd=self.cwd)
         if code != 0 or out != "true":
             return RepoInfo(is_repo=False, remotes={})
@@ -51,22 +99,55 @@ class LocalGit:
                 remotes.setdefault(name, url)
         return RepoInfo(True, root=root, branch=branch, default_branch=default_branch, remotes=remotes)
 
-    def status(self) -> Dict:
-        info = self.detect()
-        data = {"branch": info.branch, "staged": [], "changed": [], "untracked": []}
-        _, out, _ = _run_git(["status", "--porcelain"], cwd=self.cwd)
-        for line in out.splitlines():
-            if not line:
-                continue
-            code = line[:2]
-            path = line[3:]
-            if code[0] != " " and code[0] != "?":
-                data["staged"].append(path)
-            elif code == "??":
-                data["untracked"].append(path)
+    def status(self, touched: Optional[Iterable[str]] = None) -> Dict:
+        """Branch plus staged/changed/untracked/renamed/conflicted paths (repository-relative).
+
+        With `touched`, only those paths (and ones already dirty) are
+        re-checked against the previous call; see `StatusTracker`.
+        """
+        if self._status is None:
+            self._status = StatusTracker(self.cwd)
+        return self._status.refresh(touched).as_dict()
+
+    def rev(self, rev: str) -> Optional[str]:
+        """Commit id for `rev`, resolved through the cat-file helper; None if unknown."""
+        info = self.objects.info([f"{rev}^{{commit}}"])[0]
+        return info.oid if info else None
+
+    def merge_base(self, a: str, b: str) -> Optional[str]:
+        code, out, _ = _run_git(["merge-base", a, b], cwd=self.cwd)
+        return out if code == 0 and out else None
+
+    def resolve_range(self, spec: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """(base, head) commit ids for `a..b`, `a...b` (from the merge base) or `a` (`a..HEAD`).
+
+        Without a spec: the current branch since it forked from the default
+        branch, or the last commit when on the default branch itself.
+        """
+        if spec:
+            if "..." in spec:
+                a, _, b = spec.partition("...")
+                head = self.rev(b or "HEAD")
+                base = self.merge_base(a or "HEAD", head) if head else None
             else:
-                data["changed"].append(path)
-        return data
+                a, _, b = spec.partition("..")
+                base, head = self.rev(a or "HEAD"), self.rev(b or "HEAD")
+            return (base, head) if base and head else None
+        head = self.rev("HEAD")
+        if head is None:
+            return None
+        default = self.detect().default_branch
+        for ref in (default, f"origin/{default}"):
+            tip = self.rev(ref)
+            base = self.merge_base(tip, head) if tip else None
+            if base and base != head:
+                return base, head
+        parent = self.rev("HEAD~1")
+        return (parent, head) if parent else None
+
+    def diff(self, base: str, head: str) -> List[DiffEntry]:
+        """Files changed between two commits, with their blob ids."""
+        return diff_entries(self.cwd, base, head)
 
     def add(self, paths: List[str]) -> None:
         if not paths:
@@ -84,9 +165,18 @@ class LocalGit:
         code, out, err = _run_git(args, cwd=self.cwd)
         if code != 0:
             raise RuntimeError(err or out or "commit failed")
-        # Get hash
-        _, h, _ = _run_git(["rev-parse", "HEAD"], cwd=self.cwd)
-        return h
+        return self.head() or ""
+
+    def head(self) -> Optional[str]:
+        """Current commit id, from `.git` when possible."""
+        try:
+            state = repo_state(self.cwd)
+            if state is not None and state.head:
+                return state.head
+        except (Unsupported, OSError):
+            pass
+        code, h, _ = _run_git(["rev-parse", "HEAD"], cwd=self.cwd)
+        return h if code == 0 else None
 
     def branch_create(self, name: str) -> None:
         code, _, err = _run_git(["checkout", "-b", name], cwd=self.cwd)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# (inode, mtime_ns, size) per watched file; None when it does not exist.
+# git rewrites HEAD and refs through a lockfile rename, so the inode changes too.
+Stamp = Tuple[Optional[Tuple[int, int, int]], ...]
+
+# Environment variables that relocate the repository; git has to interpret these
+_GIT_ENV = ("GIT_DIR", "GIT_WORK_TREE", "GIT_COMMON_DIR", "GIT_CONFIG", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_COUNT")
+# URL rewrites apply to `git remote -v` output from any config level
+_INSTEAD_OF = re.compile(r"insteadof", re.IGNORECASE)
+_SECTION = re.compile(r'^\s*\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]\s*$')
+
+
+class Unsupported(Exception):
+    """The repository needs git itself to interpret (see `read_state`)."""
+
+
+@dataclass(frozen=True)
+class RepoState:
+    root: str  # working tree
+    git_dir: str
+    common_dir: str  # differs from git_dir in linked worktrees
+    branch: Optional[str]  # None when HEAD is detached
+    head: Optional[str]  # commit id; None on an unborn branch
+    default_branch: str = "main"
+    remotes: Dict[str, str] = field(default_factory=dict)
+
+
+def _stamp(paths: List[Path]) -> Stamp:
+    out = []
+    for p in paths:
+        try:
+            st = p.stat()
+            out.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def find_git_dir(start: str) -> Optional[Tuple[Path, Path]]:
+    """(work tree, git dir) for the repository containing `start`, or None.
+
+    Follows `.git` files (linked worktrees, submodules). Raises
+    `Unsupported` inside a git directory or a repository owned by another
+    user, where git's own rules (safe.directory) decide.
+    """
+    here = Path(start).resolve()
+    for d in (here, *here.parents):
+        if d.name == ".git":
+            raise Unsupported("inside a git directory")
+        dot = d / ".git"
+        if dot.is_dir():
+            git_dir = dot
+        elif dot.is_file():
+            text = _read(dot) or ""
+            if not text.startswith("gitdir:"):
+                raise Unsupported("unrecognised .git file")
+            git_dir = (d / text[len("gitdir:"):].strip()).resolve()
+        else:
+            continue
+        if hasattr(os, "getuid") and git_dir.stat().st_uid != os.getuid():
+            raise Unsupported("repository owned by another user")
+        return d, git_dir
+    return None
+
+
+def parse_config(text: str) -> Dict[str, Dict[str, str]]:
+    """Minimal git-config reader: {"section" or "section.sub": {key: value}}, first value wins."""
+    out: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        m = _SECTION.match(line)
+        if m:
+            name = m.group(1).lower() + (f".{m.group(2)}" if m.group(2) is not None else "")
+            current = out.setdefault(name, {})
+            continue
+        if current is None or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        current.setdefault(key.strip().lower(), value)
+    return out
+
+
+def _user_configs() -> List[str]:
+    xdg = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    paths = (Path.home() / ".gitconfig", Path(xdg) / "git" / "config", Path("/etc/gitconfig"))
+    return [t for t in (_read(p) for p in paths) if t]
+
+
+def _packed_refs(common_dir: Path) -> Dict[str, str]:
+    refs: Dict[str, str] = {}
+    text = _read(common_dir / "packed-refs")
+    for line in (text or "").splitlines():
+        if line and line[0] not in "#^":
+            sha, _, name = line.partition(" ")
+            refs[name.strip()] = sha
+    return refs
+
+
+def resolve_ref(git_dir: Path, common_dir: Path, ref: str, packed: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Commit id for a full ref name (loose refs first, then packed-refs)."""
+    for _ in range(5):  # symbolic ref chains are short
+        base = git_dir if ref == "HEAD" or not ref.startswith("refs/") else common_dir
+        text = _read(base / ref)
+        if text is None and packed is None:
+            packed = _packed_refs(common_dir)
+        if text is None:
+            return (packed or {}).get(ref)
+        if text.startswith("ref:"):
+            ref = text[4:].strip()
+            continue
+        return text or None
+    return None
+
+
+def read_state(cwd: str) -> Optional[RepoState]:
+    """Read repository state from `.git` without running git.
+
+    Returns None outside a repository. Raises `Unsupported` for setups that
+    only git can interpret correctly: GIT_DIR-style overrides, config
+    includes, `url.*.insteadOf` rewrites, `core.worktree`, bare repos,
+    reftable refs, or cwd inside a `.git` directory.
+    """
+    if any(os.environ.get(v) for v in _GIT_ENV):
+        raise Unsupported("git environment overrides")
+    found = find_git_dir(cwd)
+    if found is None:
+        return None
+    work_tree, git_dir = found
+    common = _read(git_dir / "commondir")
+    common_dir = (git_dir / common).resolve() if common else git_dir
+    config_text = _read(common_dir / "config") or ""
+    config = parse_config(config_text)
+    core = config.get("core", {})
+    if core.get("bare", "false").lower() in ("true", "yes", "on", "1") or "worktree" in core:
+        raise Unsupported("bare repository or core.worktree")
+    if any(name == "include" or name.startswith("includeif") for name in config):
+        raise Unsupported("config includes")
+    if config.get("extensions", {}).get("refstorage", "files").lower() != "files":
+        raise Unsupported("non-file ref storage")
+    if any(_INSTEAD_OF.search(text) for text in (config_text, *_user_configs())):
+        raise Unsupported("url.*.insteadOf rewrites")
+
+    head = _read(git_dir / "HEAD")
+    if head is None:
+        raise Unsupported("unreadable HEAD")
+    packed = _packed_refs(common_dir)
+    branch = None
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    commit = resolve_ref(git_dir, common_dir, "HEAD", packed)
+
+    default_branch = "main"
+    origin_head = _read(common_dir / "refs" / "remotes" / "origin" / "HEAD")
+    if origin_head and origin_head.startswith("ref: refs/remotes/origin/"):
+        default_branch = origin_head[len("ref: refs/remotes/origin/"):]
+
+    remotes = {
+        name[len("remote."):]: values["url"]
+        for name, values in config.items()
+        if name.startswith("remote.") and "url" in values
+    }
+    return RepoState(
+        root=str(work_tree), git_dir=str(git_dir), common_dir=str(common_dir), branch=branch, head=commit,
+        default_branch=default_branch, remotes=remotes,
+    )
+
+
+def _watched(git_dir: Path, common_dir: Path, state: RepoState) -> List[Path]:
+    paths = [git_dir / "HEAD", common_dir / "config", common_dir / "packed-refs", common_dir / "refs" / "remotes" / "origin" / "HEAD"]
+    if state.branch is not None:
+        paths.append(common_dir / "refs" / "heads" / state.branch)
+    return paths
+
+
+class RepoStateCache:
+    """`read_state` results per repository, re-read only when `.git` changes.
+
+    Each lookup costs the `.git` discovery walk plus one stat per watched
+    file (HEAD, config, packed-refs, origin/HEAD and the current branch
+    ref); any changed (inode, mtime, size) triggers a re-read.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[Stamp, RepoState]] = {}
+        self.reads = 0  # for diagnostics and tests
+
+    def get(self, cwd: str) -> Optional[RepoState]:
+        found = find_git_dir(cwd)
+        if found is None:
+            return None
+        key = str(found[1])
+        cached = self._cache.get(key)
+        if cached is not None:
+            state = cached[1]
+            if _stamp(_watched(Path(state.git_dir), Path(state.common_dir), state)) == cached[0]:
+                return state
+        with self._lock:
+            self.reads += 1
+            state = read_state(cwd)
+            if state is None:
+                return None
+            stamp = _stamp(_watched(Path(state.git_dir), Path(state.common_dir), state))
+            # Re-read if a writer raced us, so the stamp never describes newer files than the state
+            if read_state(cwd) != state:
+                return state
+            self._cache[key] = (stamp, state)
+            return state
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_CACHE = RepoStateCache()
+
+
+def repo_state(cwd: str) -> Optional[RepoState]:
+    """Cached `read_state`; raises `Unsupported` when git must be asked instead."""
+    return _CACHE.get(cwd)
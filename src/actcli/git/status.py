@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .repo_state import Stamp, Unsupported, _stamp, _user_configs, find_git_dir, parse_config
+
+
+READ_BYTES = 64 * 1024
+# Beyond this many touched paths a full status is cheaper than a long pathspec
+MAX_PATHSPECS = 500
+# Built-in fsmonitor daemon: git 2.36+, macOS and Windows only
+FSMONITOR_MIN_VERSION = (2, 36)
+FSMONITOR_PLATFORMS = ("darwin", "win32")
+
+_VERSION: Optional[Tuple[int, ...]] = None
+_VERSION_LOCK = threading.Lock()
+
+
+class StatusError(RuntimeError):
+    """`git status` could not run or exited with an error (not a repository, unreadable index, ...)."""
+
+
+@dataclass(frozen=True)
+class StatusEntry:
+    kind: str  # changed|renamed|unmerged|untracked|ignored
+    xy: str  # index and worktree status, "." when unchanged ("??" for untracked)
+    path: str  # relative to the repository root
+    orig_path: Optional[str] = None  # source of a rename or copy
+
+    @property
+    def staged(self) -> bool:
+        return self.kind in ("changed", "renamed") and self.xy[0] != "."
+
+    @property
+    def modified(self) -> bool:
+        return self.kind in ("changed", "renamed") and self.xy[1] != "."
+
+
+@dataclass
+class StatusResult:
+    branch: Optional[str] = None  # "HEAD" when detached
+    oid: Optional[str] = None  # None on an unborn branch
+    upstream: Optional[str] = None
+    ahead: int = 0
+    behind: int = 0
+    entries: Dict[str, StatusEntry] = field(default_factory=dict)  # path -> entry
+
+    def as_dict(self) -> Dict:
+        """The `LocalGit.status()` shape: branch plus path lists per state."""
+        data: Dict = {
+            "branch": self.branch, "staged": [], "changed": [], "untracked": [], "renamed": [], "conflicted": [],
+            "ahead": self.ahead, "behind": self.behind,
+        }
+        for e in sorted(self.entries.values(), key=lambda e: e.path):
+            if e.kind == "untracked":
+                data["untracked"].append(e.path)
+            elif e.kind == "unmerged":
+                data["conflicted"].append(e.path)
+            elif e.kind != "ignored":
+                if e.staged:
+                    data["staged"].append(e.path)
+                if e.modified:
+                    data["changed"].append(e.path)
+                if e.orig_path is not None:
+                    data["renamed"].append({"from": e.orig_path, "to": e.path})
+        return data
+
+
+def iter_records(stream: IO[bytes], size: int = READ_BYTES) -> Iterator[bytes]:
+    """NUL-terminated records from `stream`, read in blocks as git produces them."""
+    tail = b""
+    while True:
+        block = stream.read(size)
+        if not block:
+            break
+        parts = (tail + block).split(b"\0")
+        tail = parts.pop()
+        yield from parts
+    if tail:
+        yield tail
+
+
+def parse_v2(records: Iterable[bytes], result: Optional[StatusResult] = None) -> StatusResult:
+    """Fold `git status --porcelain=v2 -z --branch` records into a `StatusResult`.
+
+    Paths are decoded like file names (undecodable bytes survive as
+    surrogates), so spaces, newlines and renames round-trip exactly.
+    """
+    out = result if result is not None else StatusResult()
+    it = iter(records)
+    for rec in it:
+        if not rec:
+            continue
+        tag = rec[:1]
+        if tag == b"#":
+            key, _, value = os.fsdecode(rec[2:]).partition(" ")
+            if key == "branch.oid":
+                out.oid = None if value == "(initial)" else value
+            elif key == "branch.head":
+                out.branch = "HEAD" if value == "(detached)" else value
+            elif key == "branch.upstream":
+                out.upstream = value
+            elif key == "branch.ab":
+                a, _, b = value.partition(" ")
+                out.ahead, out.behind = int(a.lstrip("+") or 0), int(b.lstrip("-") or 0)
+        elif tag == b"1":
+            parts = rec.split(b" ", 8)
+            path = os.fsdecode(parts[8])
+            out.entries[path] = StatusEntry("changed", parts[1].decode("ascii"), path)
+        elif tag == b"2":
+            parts = rec.split(b" ", 9)
+            path = os.fsdecode(parts[9])
+            orig = os.fsdecode(next(it, b""))  # the source path is the following record
+            out.entries[path] = StatusEntry("renamed", parts[1].decode("ascii"), path, orig)
+        elif tag == b"u":
+            parts = rec.split(b" ", 10)
+            path = os.fsdecode(parts[10])
+            out.entries[path] = StatusEntry("unmerged", parts[1].decode("ascii"), path)
+        elif tag in (b"?", b"!"):
+            path = os.fsdecode(rec[2:])
+            out.entries[path] = StatusEntry("untracked" if tag == b"?" else "ignored", "??" if tag == b"?" else "!!", path)
+    return out
+
+
+def git_version() -> Tuple[int, ...]:
+    """Installed git version (probed once per process); () if unknown."""
+    global _VERSION
+    with _VERSION_LOCK:
+        if _VERSION is None:
+            from . import local
+
+            code, out, _ = local._run_git(["version"])
+            digits: List[int] = []
+            if code == 0:
+                for part in out.replace("git version", "").strip().split("."):
+                    if not part.isdigit():
+                        break
+                    digits.append(int(part))
+            _VERSION = tuple(digits)
+        return _VERSION
+
+
+def speedup_config(common_dir: Optional[Path]) -> List[str]:
+    """`-c` options enabling the untracked cache and fsmonitor, unless configured already.
+
+    Explicit settings win: a hook-based `core.fsmonitor` (e.g. Watchman) or
+    `core.untrackedCache=false` in any config file is left alone.
+    """
+    texts = list(_user_configs())
+    if common_dir is not None:
+        try:
+            texts.append((common_dir / "config").read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            pass
+    core: Dict[str, str] = {}
+    for text in texts:
+        for key, value in parse_config(text).get("core", {}).items():
+            core.setdefault(key, value)
+    opts: List[str] = []
+    if "untrackedcache" not in core:
+        opts += ["-c", "core.untrackedCache=true"]
+    if "fsmonitor" not in core and sys.platform in FSMONITOR_PLATFORMS and git_version() >= FSMONITOR_MIN_VERSION:
+        opts += ["-c", "core.fsmonitor=true"]
+    return opts
+
+
+def run_status(
+    cwd: str,
+    pathspecs: Optional[Sequence[str]] = None,
+    *,
+    config: Sequence[str] = (),
+    optional_locks: bool = True,
+) -> StatusResult:
+    """Stream `git status --porcelain=v2 -z` into a `StatusResult`, optionally limited to `pathspecs`.
+
+    Output is parsed as it arrives rather than buffered, so memory stays
+    flat however many paths are dirty. Pathspecs are literal (no globbing).
+    With `optional_locks` git may write back the refreshed index (stat data
+    and the untracked cache), which speeds up the next run. Raises
+    `StatusError` when git is missing or exits non-zero.
+    """
+    from . import local
+
+    args = ["git", *config, "--literal-pathspecs"]
+    if not optional_locks:
+        args.append("--no-optional-locks")
+    args += ["status", "--porcelain=v2", "-z", "--branch"]
+    if pathspecs is not None:
+        args += ["--", *pathspecs]
+    local.GIT_CALLS += 1
+    # stderr goes to a file: a pipe we only drain afterwards could fill up and stall git
+    with tempfile.TemporaryFile() as err:
+        try:
+            proc = subprocess.Popen(args, cwd=cwd, stdout=subprocess.PIPE, stderr=err)
+        except FileNotFoundError:
+            raise StatusError("git not found") from None
+        assert proc.stdout is not None
+        with proc.stdout:
+            out = parse_v2(iter_records(proc.stdout))
+        if proc.wait() != 0:
+            err.seek(0)
+            message = err.read().decode("utf-8", "replace").strip()
+            raise StatusError(message or f"git status exited with code {proc.returncode}")
+    return out
+
+
+def _under(path: str, specs: Sequence[str]) -> bool:
+    return any(path == s or path.startswith(s.rstrip("/") + "/") for s in specs)
+
+
+class StatusTracker:
+    """Working-tree status for one repository, with an incremental mode.
+
+    `refresh()` runs a full status. `refresh(touched=[...])` re-checks only
+    the touched paths (plus the paths already reported dirty, which may
+    have been reverted) and merges them into the previous result. That is
+    only as complete as the caller's list of touched paths, so a full run
+    happens anyway whenever the index, HEAD or exclude rules changed (git
+    commands, checkouts, `.gitignore` edits), when too many paths were
+    touched, or when the repository cannot be located from `.git`.
+    A failed run raises `StatusError` and drops the previous result, so
+    the next refresh starts over with a full run.
+    """
+
+    def __init__(self, cwd: str) -> None:
+        self.cwd = cwd
+        self._lock = threading.Lock()
+        self._result: Optional[StatusResult] = None
+        self._stamp: Optional[Stamp] = None
+        self._root: Optional[Path] = None
+        self._watched: List[Path] = []
+        self._config: Optional[List[str]] = None
+        self.full_runs = 0  # for diagnostics and tests
+        self.incremental_runs = 0
+
+    def _locate(self) -> None:
+        if self._config is not None:
+            return
+        common_dir = None
+        try:
+            found = find_git_dir(self.cwd)
+        except (Unsupported, OSError):
+            found = None
+        if found is not None:
+            self._root, git_dir = found
+            common = git_dir / "commondir"
+            common_dir = (git_dir / common.read_text(encoding="utf-8").strip()).resolve() if common.is_file() else git_dir
+            self._watched = [git_dir / "index", git_dir / "HEAD", common_dir / "info" / "exclude", self._root / ".gitignore"]
+        self._config = speedup_config(common_dir)
+
+    def _relative(self, path: str) -> Optional[str]:
+        assert self._root is not None
+        p = Path(path)
+        if not p.is_absolute():
+            p = Path(self.cwd) / p
+        try:
+            rel = Path(os.path.normpath(p)).relative_to(self._root).as_posix()
+        except ValueError:
+            return None  # outside the work tree
+        return "" if rel == "." else rel
+
+    def refresh(self, touched: Optional[Iterable[str]] = None) -> StatusResult:
+        with self._lock:
+            self._locate()
+            stamp = _stamp(self._watched) if self._root is not None else None
+            specs = self._incremental_specs(touched, stamp)
+            try:
+                self._run(specs)
+            except StatusError:
+                self._result = None
+                raise
+            assert self._result is not None
+            return self._result
+
+    def _run(self, specs: Optional[List[str]]) -> None:
+        if specs is None:
+            self.full_runs += 1
+            self._result = run_status(self.cwd, config=self._config or ())
+            # git may have rewritten the index with refreshed stat data
+            self._stamp = _stamp(self._watched) if self._root is not None else None
+        elif specs:
+            self.incremental_runs += 1
+            # Leave the index alone so its stamp keeps describing our snapshot
+            fresh = run_status(str(self._root), specs, config=self._config or (), optional_locks=False)
+            prev = self._result
+            assert prev is not None
+            keep = {p: e for p, e in prev.entries.items() if not _under(p, specs)}
+            keep.update(fresh.entries)
+            fresh.entries = keep
+            self._result = fresh
+
+    def _incremental_specs(self, touched: Optional[Iterable[str]], stamp: Optional[Stamp]) -> Optional[List[str]]:
+        """Root-relative pathspecs to re-check, [] for none, or None when a full run is needed."""
+        if touched is None or self._result is None or self._root is None or stamp != self._stamp:
+            return None
+        specs = set()
+        for path in touched:
+            rel = self._relative(path)
+            if rel is None:
+                continue
+            if rel == "" or rel.rsplit("/", 1)[-1] == ".gitignore":
+                return None  # the whole tree, or exclude rules, changed
+            specs.add(rel)
+        if not specs:
+            return []
+        for e in self._result.entries.values():
+            specs.add(e.path)
+            if e.orig_path is not None:
+                specs.add(e.orig_path)
+        # An untracked directory is reported as "dir/": re-check it whole
+        dirs = [e.path for e in self._result.entries.values() if e.kind == "untracked" and e.path.endswith("/")]
+        specs = {next((d.rstrip("/") for d in dirs if s.startswith(d)), s) for s in specs}
+        if len(specs) > MAX_PATHSPECS:
+            return None
+        return sorted(specs)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._result = None
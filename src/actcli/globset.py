@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+DECISION_CACHE_SIZE = 65536
+
+# One compiled pattern segment: None for "**", else a regex for a single path segment
+Segment = Optional["re.Pattern[str]"]
+
+
+def _normalize(pattern: str) -> str:
+    pattern = pattern.strip().replace("\\", "/")
+    while pattern.startswith("./"):
+        pattern = pattern[2:]
+    return pattern.strip("/") or "**"
+
+
+def _translate_segment(seg: str) -> str:
+    """fnmatch-style translation for one segment: `*` and `?` never cross `/`."""
+    out, i, n = [], 0, len(seg)
+    while i < n:
+        c = seg[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and seg[j] in "!^":
+                j += 1
+            if j < n and seg[j] == "]":
+                j += 1
+            while j < n and seg[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = seg[i:j].replace("\\", "\\\\")
+                if body[:1] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _is_literal(seg: str) -> bool:
+    return not any(c in seg for c in "*?[")
+
+
+def translate(pattern: str) -> str:
+    """Regex source for a whole glob with `**` matching zero or more segments."""
+    segs = _normalize(pattern).split("/")
+    parts: List[str] = []
+    for k, seg in enumerate(segs):
+        last = k == len(segs) - 1
+        if seg == "**":
+            # "a/**" matches everything below a; "**/b" and "a/**/b" allow zero segments
+            parts.append("(?:[^/]+/)*[^/]+" if last else "(?:[^/]+/)*")
+        else:
+            parts.append(_translate_segment(seg) + ("" if last else "/"))
+    return "".join(parts)
+
+
+class _TrieNode:
+    __slots__ = ("children", "tails")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Remaining (non-literal) segments of globs whose literal prefix ends here
+        self.tails: List[Tuple[Segment, ...]] = []
+
+
+class GlobSet:
+    """A set of path globs compiled into one matcher.
+
+    Paths are relative and `/`-separated (a leading `./` is ignored).
+    `*`, `?` and `[...]` stay within one segment; `**` spans any number
+    of segments. `matches` is backed by a single alternation regex plus an
+    LRU decision cache; `may_contain` answers "could anything below this
+    directory match?" from a trie of the globs' literal leading segments,
+    which is what lets `walk` skip whole denied subtrees.
+    """
+
+    def __init__(self, patterns: Iterable[str], cache_size: int = DECISION_CACHE_SIZE) -> None:
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        sources = [translate(p) for p in self.patterns]
+        self._regex = re.compile("(?:" + "|".join(sources) + ")\\Z") if sources else None
+        self._trie = _TrieNode()
+        for p in self.patterns:
+            node = self._trie
+            segs = _normalize(p).split("/")
+            k = 0
+            while k < len(segs) and segs[k] != "**" and _is_literal(segs[k]):
+                node = node.children.setdefault(segs[k], _TrieNode())
+                k += 1
+            node.tails.append(tuple(None if s == "**" else re.compile(_translate_segment(s) + "\\Z") for s in segs[k:]))
+        self.matches = lru_cache(maxsize=cache_size)(self._match)
+        self._may_contain = lru_cache(maxsize=cache_size)(self._dir_viable)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    @staticmethod
+    def _clean(path: str) -> str:
+        if os.sep != "/":
+            path = path.replace(os.sep, "/")
+        while path.startswith("./"):
+            path = path[2:]
+        return path
+
+    def _match(self, path: str) -> bool:
+        return self._regex is not None and self._regex.match(self._clean(path)) is not None
+
+    def filter(self, paths: Iterable[str]) -> List[str]:
+        """Bulk form of `matches`; order is preserved."""
+        match = self.matches
+        return [p for p in paths if match(p)]
+
+    # Directory pruning -----------------------------------------------------
+    @staticmethod
+    def _tail_viable(tail: Tuple[Segment, ...], segs: Sequence[str]) -> bool:
+        # Segment-wise NFA: can `segs` be a proper directory prefix of a match of `tail`?
+        states = {0}
+        for seg in segs:
+            nxt = set()
+            for i in states:
+                while i < len(tail) and tail[i] is None:
+                    nxt.add(i)  # "**" absorbs this segment
+                    i += 1
+                if i < len(tail) and tail[i].match(seg):  # type: ignore[union-attr]
+                    nxt.add(i + 1)
+            if not nxt:
+                return False
+            states = nxt
+        # Something must still be able to match below the directory
+        return any(i < len(tail) for i in states)
+
+    def _dir_viable(self, directory: str) -> bool:
+        segs = [s for s in self._clean(directory).split("/") if s]
+        node = self._trie
+        for k, seg in enumerate(segs):
+            if any(self._tail_viable(t, segs[k:]) for t in node.tails):
+                return True
+            child = node.children.get(seg)
+            if child is None:
+                return False
+            node = child
+        # The directory is on (or at the end of) a literal prefix
+        return bool(node.children) or any(len(t) > 0 for t in node.tails)
+
+    def may_contain(self, directory: str) -> bool:
+        """False only if no path below `directory` can match; `""` is the root."""
+        return self._may_contain(directory)
+
+    def walk(
+        self,
+        root: os.PathLike | str,
+        *,
+        follow_symlinks: bool = False,
+        within: Optional["GlobSet"] = None,
+        skip_dirs: Collection[str] = (),
+    ) -> Iterator[str]:
+        """Yield matching file paths (relative, `/`-separated) under `root`.
+
+        Uses `os.scandir` and never descends into a directory that cannot
+        contain a match. Symlinked directories are not followed by default,
+        so the walk cannot leave `root`. With `within`, a path must match
+        both sets and both prune; directories named in `skip_dirs` are
+        never entered.
+        """
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                it = os.scandir(os.path.join(root, rel_dir) if rel_dir else root)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name in skip_dirs:
+                            continue
+                        if self.may_contain(rel) and (within is None or within.may_contain(rel)):
+                            stack.append(rel)
+                    elif self.matches(rel) and (within is None or within.matches(rel)):
+                        yield rel
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from platformdirs import user_config_dir
+
+
+CHUNK_SIZE = 8 * 1024 * 1024
+CACHE_FILE = "hash-cache.db"
+
+# (path, inode, size, mtime_ns)
+CacheKey = Tuple[str, int, int, int]
+
+
+@dataclass(frozen=True)
+class FileDigest:
+    path: str
+    sha256: str
+    size: int
+
+
+def sha256_file(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """Stream a file through SHA-256, via mmap when the platform allows it.
+
+    hashlib releases the GIL on large updates, so several files hash in
+    parallel on a thread pool.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return h.hexdigest()
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for off in range(0, len(mm), chunk_size):
+                        h.update(view[off:off + chunk_size])
+                finally:
+                    view.release()
+            return h.hexdigest()
+        except (OSError, ValueError):
+            # Pipes, special files or exotic filesystems: plain buffered reads
+            f.seek(0)
+            buf = bytearray(min(chunk_size, max(size, 1)))
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
+            return h.hexdigest()
+
+
+def cache_key(path: Path, st: os.stat_result) -> CacheKey:
+    """The `HashCache` key for `path` as described by `st`; any change to the file changes it."""
+    return (str(path), st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class HashCache:
+    """Persistent digest cache keyed by (path, inode, size, mtime_ns).
+
+    Any change to the file changes the key, so stale entries are never
+    returned; a path's row is replaced when it is re-hashed.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or (Path(user_config_dir("actcli", "actcli")) / CACHE_FILE)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._memo: Dict[CacheKey, str] = {}
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS digests (path TEXT PRIMARY KEY, inode INTEGER, size INTEGER, mtime_ns INTEGER, sha256 TEXT)"
+            )
+        return self._conn
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        if key in self._memo:
+            return self._memo[key]
+        with self._lock:
+            row = self._db().execute(
+                "SELECT sha256 FROM digests WHERE path = ? AND inode = ? AND size = ? AND mtime_ns = ?", key
+            ).fetchone()
+        if row:
+            self._memo[key] = row[0]
+            return row[0]
+        return None
+
+    def put(self, key: CacheKey, digest: str) -> None:
+        self._memo[key] = digest
+        with self._lock:
+            with self._db():
+                self._db().execute("INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?)", (*key, digest))
+
+    def put_many(self, items: Iterable[Tuple[CacheKey, str]]) -> None:
+        """Like `put` for many files, in one transaction."""
+        rows = [(*key, digest) for key, digest in items]
+        for row in rows:
+            self._memo[row[:4]] = row[4]
+        with self._lock:
+            with self._db():
+                self._db().executemany("INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?)", rows)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class FileHasher:
+    """Hash files on a thread pool, consulting the persistent cache first."""
+
+    def __init__(self, cache: Optional[HashCache] = None, max_workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> None:
+        self.cache = cache if cache is not None else HashCache()
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.hashed = 0  # files actually read, for diagnostics
+
+    def _hash_one(self, path: Path, st: os.stat_result) -> Tuple[str, bool]:
+        digest = sha256_file(path, self.chunk_size)
+        after = path.stat()
+        # Only cache if the file did not change while we were reading it
+        stable = (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns)
+        return digest, stable
+
+    def hash_files(self, paths: Iterable[Path]) -> List[FileDigest]:
+        items = []
+        for p in paths:
+            path = Path(p).resolve()
+            st = path.stat()
+            items.append((path, st, cache_key(path, st)))
+        results: Dict[int, FileDigest] = {}
+        misses = []
+        for i, (path, st, key) in enumerate(items):
+            cached = self.cache.get(key)
+            if cached:
+                results[i] = FileDigest(path=str(path), sha256=cached, size=st.st_size)
+            else:
+                misses.append(i)
+        if misses:
+            workers = min(self.max_workers, len(misses))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="actcli-hash") as pool:
+                futures = {i: pool.submit(self._hash_one, items[i][0], items[i][1]) for i in misses}
+                for i, fut in futures.items():
+                    path, st, key = items[i]
+                    digest, stable = fut.result()
+                    self.hashed += 1
+                    if stable:
+                        self.cache.put(key, digest)
+                    results[i] = FileDigest(path=str(path), sha256=digest, size=st.st_size)
+        return [results[i] for i in range(len(items))]
+
+    def hash_file(self, path: Path) -> FileDigest:
+        return self.hash_files([path])[0]
+
+
+_DEFAULT_HASHER: Optional[FileHasher] = None
+
+
+def default_hasher() -> FileHasher:
+    global _DEFAULT_HASHER
+    if _DEFAULT_HASHER is None:
+        _DEFAULT_HASHER = FileHasher()
+    return _DEFAULT_HASHER
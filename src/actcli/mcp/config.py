@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from platformdirs import user_config_dir
 
@@ -14,28 +15,44 @@ except Exception:  # pragma: no cover
 
 GLOBAL_DIR = Path(user_config_dir("actcli", "actcli")) / "mcp"
 GLOBAL_FILE = GLOBAL_DIR / "servers.toml"
+CACHE_TTL_S = 300.0
 
 
-def get_project_dir() -> Path:
-    """Get the project .actcli directory based on current working directory."""
-    return Path.cwd() / ".actcli"
+def get_project_dir(root: Optional[Path] = None) -> Path:
+    """Get the project .actcli directory of `root` (default: current working directory)."""
+    return (root or Path.cwd()) / ".actcli"
 
 
-def get_project_file() -> Path:
-    """Get the project mcp.toml file path based on current working directory."""
-    return get_project_dir() / "mcp.toml"
+def get_project_file(root: Optional[Path] = None) -> Path:
+    """Get the project mcp.toml file path of `root` (default: current working directory)."""
+    return get_project_dir(root) / "mcp.toml"
+
+
+def config_files(root: Optional[Path] = None) -> Tuple[Path, Path]:
+    """(global, project) files that `load_servers` reads, lowest precedence first."""
+    return GLOBAL_FILE, get_project_file(root)
 
 
 @dataclass
 class MCPServer:
     name: str
-    url: str
+    url: str  # HTTP endpoint; empty for stdio servers
     enabled: bool = True
     group: Optional[str] = None
     desc: Optional[str] = None
     log: bool = False
+    log_sample: float = 1.0  # fraction of successful calls logged when `log` is on (failures always are)
     reload_url: Optional[str] = None
     restart_cmd: Optional[str] = None
+    command: Optional[str] = None  # stdio server: launched and spoken to over JSON-RPC (see mcp.stdio)
+    # Ops/tools whose results may be cached (see mcp.result_cache), e.g. `read_only = ["repo_detect"]` for
+    # Git-MCP. Nothing is cached unless listed here; stdio tools may also declare readOnlyHint.
+    read_only: List[str] = field(default_factory=list)
+    cache_ttl_s: float = CACHE_TTL_S  # 0 disables the result cache
+
+    @property
+    def transport(self) -> str:
+        return "stdio" if self.command else "http"
 
 
 @dataclass
@@ -56,19 +73,27 @@ def _load_file(path: Path) -> Dict[str, MCPServer]:
             group=cfg.get("group"),
             desc=cfg.get("desc"),
             log=bool(cfg.get("log", False)),
+            log_sample=float(cfg.get("log_sample", 1.0)),
             reload_url=cfg.get("reload_url"),
             restart_cmd=cfg.get("restart_cmd"),
+            command=cfg.get("command"),
+            read_only=[str(op) for op in cfg.get("read_only", [])],
+            cache_ttl_s=float(cfg.get("cache_ttl_s", CACHE_TTL_S)),
         )
     return servers
 
 
+def load_servers(root: Optional[Path] = None) -> Dict[str, MCPServer]:
+    """Global servers overridden by the project's, parsed afresh."""
+    merged: Dict[str, MCPServer] = {}
+    for path in config_files(root):
+        merged.update(_load_file(path))
+    return merged
+
+
 def load_mcp_config() -> MCPConfig:
-    GLOBAL_DIR.mkdir(parents=True, exist_ok=True)
-    get_project_dir().mkdir(parents=True, exist_ok=True)
-    global_servers = _load_file(GLOBAL_FILE)
-    project_servers = _load_file(get_project_file())
-    merged = {**global_servers, **project_servers}
-    return MCPConfig(servers=merged)
+    """Fresh, mutable config for editing; read-only callers use `current_snapshot().servers`."""
+    return MCPConfig(servers=load_servers())
 
 
 def save_project_mcp_config(cfg: MCPConfig) -> None:
@@ -84,12 +109,23 @@ def save_project_mcp_config(cfg: MCPConfig) -> None:
         if s.desc is not None:
             lines.append(f"desc = \"{s.desc}\"")
         lines.append(f"log = {str(bool(s.log)).lower()}")
+        if s.log_sample != 1.0:
+            lines.append(f"log_sample = {s.log_sample}")
         if s.reload_url is not None:
             lines.append(f"reload_url = \"{s.reload_url}\"")
         if s.restart_cmd is not None:
             lines.append(f"restart_cmd = \"{s.restart_cmd}\"")
+        if s.command is not None:
+            lines.append(f"command = {json.dumps(s.command)}")  # JSON string escapes are valid TOML
+        if s.read_only:
+            lines.append(f"read_only = {json.dumps(s.read_only)}")
+        if s.cache_ttl_s != CACHE_TTL_S:
+            lines.append(f"cache_ttl_s = {s.cache_ttl_s}")
         lines.append("")
     get_project_file().write_text("\n".join(lines), encoding="utf-8")
+    from ..snapshot import invalidate
+
+    invalidate()
 
 
 def get_server_by_url(cfg: MCPConfig, url: str) -> Optional[MCPServer]:
@@ -1,53 +1,165 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
 from ..git.local import LocalGit
-from .config import load_mcp_config, get_server_by_url
+from .result_cache import ResultCache, result_cache
+from .traffic_log import TrafficLog, traffic_log
+
+
+# (op, params) as sent to the Git-MCP service
+Op = Tuple[str, Dict[str, Any]]
+
+TIMEOUT_S = 10
+POOL_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=30)
+
+
+def batch_request(ops: Sequence[Op], stop_on_error: bool = True) -> Dict[str, Any]:
+    """Body of a `batch` request: the ops run in order on the server.
+
+    With `stop_on_error`, the server skips everything after the first op
+    that fails; skipped ops are absent from the results.
+    """
+    return {
+        "op": "batch",
+        "params": {"ops": [{"op": op, "params": params} for op, params in ops], "stop_on_error": stop_on_error},
+    }
+
+
+def batch_results(response: Dict[str, Any], expected: int) -> List[Dict[str, Any]]:
+    """Per-op `{"ok", "data", "error"}` results of a `batch` response.
+
+    Raises ValueError when the server does not understand `batch` (so the
+    caller can fall back to one request per op).
+    """
+    results = (response.get("data") or {}).get("results") if response.get("ok") else None
+    if not isinstance(results, list) or len(results) > expected:
+        raise ValueError(response.get("error") or "batch not supported by this server")
+    return [r if isinstance(r, dict) else {"ok": False, "error": "malformed result"} for r in results]
+
+
+class _ServerHooks:
+    """Traffic log and result cache for the server at `base_url`, resolved once per client."""
+
+    def __init__(self, base_url: Optional[str]) -> None:
+        self.log: Optional[TrafficLog] = None
+        self.cache: Optional[ResultCache] = None
+        self.read_only: Tuple[str, ...] = ()  # only ops the server config declares (`read_only`) are cached
+        if not base_url:
+            return
+        server = None
+        try:
+            from ..snapshot import current_snapshot
+
+            server = current_snapshot().server_by_url(base_url)
+        except Exception:
+            pass
+        if server is None:
+            return  # not in the MCP config: plain requests
+        if server.log:
+            self.log = traffic_log(server.name, server.log_sample)
+        self.read_only = tuple(server.read_only)
+        if server.read_only and server.cache_ttl_s > 0:
+            self.cache = result_cache(server.name, server.cache_ttl_s)
+
+    def record(self, op: str, params: Dict, data: Any, error: Optional[Exception], start: float) -> None:
+        if self.log is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            if error is not None:
+                self.log.record(op, params, error=str(error) or type(error).__name__, elapsed_ms=elapsed)
+            else:
+                self.log.record(op, params, data, elapsed_ms=elapsed)
+
+
+def _ok(response: Any) -> bool:
+    return isinstance(response, dict) and bool(response.get("ok", True))
 
 
 class GitMCPClient:
     """Client for the Git-MCP service with a safe LocalGit fallback.
 
     If ACTCLI_GIT_MCP_URL is set, HTTP requests are used; otherwise LocalGit.
+    Requests share one pooled keep-alive connection, and `batch` sends an
+    ordered list of ops in a single round trip.
     """
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         self.base_url = base_url or os.environ.get("ACTCLI_GIT_MCP_URL")
         self.local = LocalGit()
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+        self._hooks: Optional[_ServerHooks] = None
+        self.batch_supported = True  # cleared when the server rejects `batch`
+        self.requests = 0  # HTTP round trips, for diagnostics and tests
+
+    def _client(self) -> httpx.Client:
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(timeout=TIMEOUT_S, limits=POOL_LIMITS)
+            return self._http
+
+    def close(self) -> None:
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def __enter__(self) -> "GitMCPClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def _post(self, op: str, params: Dict) -> Dict:
         if not self.base_url:
             raise RuntimeError("No MCP URL configured")
-        # Enable logging if configured for this server
-        log_enabled = False
-        server_name = None
+        if self._hooks is None:
+            self._hooks = _ServerHooks(self.base_url)
+        hooks = self._hooks
+        if hooks.cache is None:
+            return self._send(op, params)
+        return hooks.cache.call(op, params, lambda: self._send(op, params), read_only=op in hooks.read_only, cacheable=_ok)
+
+    def _send(self, op: str, params: Dict) -> Dict:
+        assert self._hooks is not None and self.base_url
+        self.requests += 1
+        start = time.perf_counter()
         try:
-            cfg = load_mcp_config()
-            s = get_server_by_url(cfg, self.base_url)
-            if s:
-                log_enabled = s.log
-                server_name = s.name
-        except Exception:
-            pass
-        with httpx.Client(timeout=10) as client:
-            r = client.post(self.base_url, json={"op": op, "params": params})
+            r = self._client().post(self.base_url, json={"op": op, "params": params})
             r.raise_for_status()
             data = r.json()
-            if log_enabled and server_name:
-                try:
-                    from pathlib import Path
-                    log_dir = Path("out/mcp-logs")
-                    log_dir.mkdir(parents=True, exist_ok=True)
-                    (log_dir / f"{server_name}.log").write_text(
-                        f"op={op}\nparams={params}\nresponse={data}\n\n", encoding="utf-8"
-                    )
-                except Exception:
-                    pass
-            return data
+        except Exception as e:
+            self._hooks.record(op, params, None, e, start)
+            raise
+        self._hooks.record(op, params, data, None, start)
+        return data
+
+    def batch(self, ops: Sequence[Op], stop_on_error: bool = True) -> List[Dict[str, Any]]:
+        """Run `ops` in order on the server in one request; one result per op that ran.
+
+        Servers without `batch` support get one request per op instead (over
+        the same connection), and are remembered as such.
+        """
+        if not ops:
+            return []
+        if self.batch_supported:
+            body = batch_request(ops, stop_on_error)
+            try:
+                return batch_results(self._post("batch", body["params"]), len(ops))
+            except (ValueError, httpx.HTTPStatusError):
+                self.batch_supported = False
+        results: List[Dict[str, Any]] = []
+        for op, params in ops:
+            res = self._post(op, params)
+            results.append(res)
+            if stop_on_error and not res.get("ok"):
+                break
+        return results
 
     # High-level operations with fallback
     def repo_detect(self) -> Dict:
@@ -82,6 +194,8 @@ class GitMCPClient:
                 self.local.branch_switch(name)
             except Exception:
                 self.local.branch_create(name)
+            if self._hooks is not None and self._hooks.cache is not None:
+                self._hooks.cache.invalidate()  # cached repo_detect still names the old branch
 
     def add(self, paths: List[str]) -> None:
         if self.base_url:
@@ -111,18 +225,159 @@ class GitMCPClient:
                 pass
         self.local.push(remote, branch, set_upstream=True)
 
-    def pr_link(self, remote: str, target: Optional[str], title: str, body: str) -> Optional[str]:
+    def _link_params(self, remote: str, target: Optional[str], title: str, body: str) -> Tuple[Optional[str], Dict]:
         info = self.local.detect()
         remote_url = info.remotes.get(remote) if info.remotes else None
-        branch = info.branch or ""
-        target_branch = target or info.default_branch
+        params = {"remote": remote, "target": target or info.default_branch, "branch": info.branch or "", "title": title, "body": body}
+        return remote_url, params
+
+    def _local_link(self, remote_url: Optional[str], params: Dict) -> Optional[str]:
+        if remote_url:
+            return self.local.pr_url(remote_url, params["target"], params["branch"], title=params["title"], body=params["body"])
+        return None
+
+    def pr_link(self, remote: str, target: Optional[str], title: str, body: str) -> Optional[str]:
+        remote_url, params = self._link_params(remote, target, title, body)
         if self.base_url:
             try:
-                res = self._post("pr_link", {"remote": remote, "target": target_branch, "branch": branch, "title": title, "body": body})
+                res = self._post("pr_link", params)
                 if res.get("ok") and res.get("data", {}).get("url"):
                     return res["data"]["url"]
             except Exception:
                 pass
-        if remote_url:
-            return self.local.pr_url(remote_url, target_branch, branch, title=title, body=body)
-        return None
+        return self._local_link(remote_url, params)
+
+    def pr_prepare(
+        self,
+        *,
+        message: str,
+        branch: str,
+        remote: str,
+        target: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        signoff: bool = False,
+        gitignore: Sequence[str] = (),
+    ) -> Dict[str, Any]:
+        """The whole `pr prepare` sequence; a single request when a Git-MCP URL is set.
+
+        The repository check and branch switch are local (no git fork is
+        needed to read them). gitignore, add, commit, push and the PR link
+        then go out as one `batch`; whatever the server did not complete
+        runs through the per-op methods, which fall back to LocalGit.
+        Returns {"is_repo", "commit", "url"}.
+        """
+        if not self.local.detect().is_repo:
+            return {"is_repo": False, "commit": None, "url": None}
+        self.branch_ensure(branch)
+        title, body = (message.split("\n", 1) + [""])[:2]
+        remote_url, link = self._link_params(remote, target, title, body)
+        ops: List[Op] = []
+        if gitignore:
+            ops.append(("ensure_gitignore", {"entries": list(gitignore)}))
+        if paths:
+            ops.append(("add", {"paths": paths}))
+        ops.append(("commit", {"message": message, "signoff": signoff, "allow_empty": False}))
+        ops.append(("push", {"remote": remote, "branch": branch, "set_upstream": True}))
+        ops.append(("pr_link", link))
+
+        results: List[Dict[str, Any]] = []
+        if self.base_url:
+            try:
+                results = self.batch(ops)
+            except Exception:
+                results = []
+        out: Dict[str, Any] = {"is_repo": True, "commit": None, "url": None}
+        for i, (op, params) in enumerate(ops):
+            res = results[i] if i < len(results) else None
+            data = (res or {}).get("data") or {}
+            ok = bool(res and res.get("ok"))
+            if op == "commit":
+                if ok and data.get("hash"):
+                    out["commit"] = data["hash"]
+                else:
+                    out["commit"] = self.commit(message, signoff=signoff) if res is None else self.local.commit(message, signoff=signoff)
+            elif op == "pr_link":
+                if ok and data.get("url"):
+                    out["url"] = data["url"]
+                else:
+                    out["url"] = self.pr_link(remote, target, title, body) if res is None else self._local_link(remote_url, params)
+            elif res is None:
+                # Not run remotely (no URL, failed batch, or skipped after an error)
+                if op == "ensure_gitignore":
+                    self.ensure_gitignore(params["entries"])
+                elif op == "add":
+                    self.add(params["paths"])
+                elif op == "push":
+                    self.push(remote, branch)
+        return out
+
+
+class AsyncGitMCPClient:
+    """asyncio counterpart of `GitMCPClient`'s transport: pooled `post` and single-request `batch`."""
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        self.base_url = base_url or os.environ.get("ACTCLI_GIT_MCP_URL")
+        self._http: Optional[httpx.AsyncClient] = None
+        self._hooks = _ServerHooks(self.base_url)
+        self.batch_supported = True
+        self.requests = 0
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=TIMEOUT_S, limits=POOL_LIMITS)
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            http, self._http = self._http, None
+            await http.aclose()
+
+    async def __aenter__(self) -> "AsyncGitMCPClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def post(self, op: str, params: Dict) -> Dict:
+        if not self.base_url:
+            raise RuntimeError("No MCP URL configured")
+        cache = self._hooks.cache
+        read_only = op in self._hooks.read_only
+        if cache is not None and read_only:
+            hit, value = cache.get(op, params)
+            if hit:
+                return value
+        self.requests += 1
+        start = time.perf_counter()
+        try:
+            r = await self._client().post(self.base_url, json={"op": op, "params": params})
+            r.raise_for_status()
+            data = r.json()
+        except Exception as e:
+            self._hooks.record(op, params, None, e, start)
+            raise
+        finally:
+            if cache is not None and not read_only:
+                cache.invalidate()
+        self._hooks.record(op, params, data, None, start)
+        if cache is not None and read_only and _ok(data):
+            cache.put(op, params, data)
+        return data
+
+    async def batch(self, ops: Sequence[Op], stop_on_error: bool = True) -> List[Dict[str, Any]]:
+        """As `GitMCPClient.batch`."""
+        if not ops:
+            return []
+        if self.batch_supported:
+            body = batch_request(ops, stop_on_error)
+            try:
+                return batch_results(await self.post("batch", body["params"]), len(ops))
+            except (ValueError, httpx.HTTPStatusError):
+                self.batch_supported = False
+        results: List[Dict[str, Any]] = []
+        for op, params in ops:
+            res = await self.post(op, params)
+            results.append(res)
+            if stop_on_error and not res.get("ok"):
+                break
+        return results
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List, Mapping, Optional
+
+import httpx
+
+from .config import MCPServer
+
+
+PROBE_TIMEOUT_S = 5
+INTERVAL_S = 30
+HISTORY = 100  # latency samples kept per server
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    name: str
+    ok: bool
+    latency_ms: float
+    detail: str  # "healthy", "reachable (404)", "unreachable: ..."
+
+
+@dataclass
+class ServerHealth:
+    name: str
+    up: Optional[bool] = None  # None until the first probe
+    detail: str = "not probed yet"
+    checked_at: float = 0.0  # time.time() of the last probe
+    failures: int = 0  # consecutive failed probes
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=HISTORY))
+
+    def record(self, result: ProbeResult) -> None:
+        self.up = result.ok
+        self.detail = result.detail
+        self.checked_at = time.time()
+        self.failures = 0 if result.ok else self.failures + 1
+        if result.ok:
+            self.latencies.append(result.latency_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Nearest-rank percentile of successful probe latencies (ms)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+    def summary(self) -> str:
+        if self.up is None:
+            return self.detail
+        if not self.up:
+            return f"down ({self.detail})"
+        return f"{self.percentile(50):.0f} ms p50 • {self.percentile(95):.0f} ms p95"
+
+
+async def probe_http(client: httpx.AsyncClient, server: MCPServer, timeout_s: float = PROBE_TIMEOUT_S) -> ProbeResult:
+    """GET <url>/health, falling back to HEAD <url>; any non-5xx answer counts as up."""
+    url = server.url.rstrip("/")
+    start = time.perf_counter()
+
+    def done(ok: bool, detail: str) -> ProbeResult:
+        return ProbeResult(server.name, ok, (time.perf_counter() - start) * 1000, detail)
+
+    try:
+        r = await client.get(url + "/health", timeout=timeout_s)
+        if r.status_code == 200:
+            return done(True, "healthy")
+    except Exception:
+        pass
+    try:
+        r = await client.head(url, timeout=timeout_s)
+        return done(r.status_code < 500, f"reachable ({r.status_code})")
+    except Exception as e:
+        return done(False, f"unreachable: {e or type(e).__name__}")
+
+
+async def probe_stdio(server: MCPServer, timeout_s: float = PROBE_TIMEOUT_S, sessions=None) -> ProbeResult:
+    """JSON-RPC ping over a running managed session, or a one-off handshake.
+
+    Servers nobody has used yet are not kept running just to be probed.
+    """
+    from .stdio import MCPError, StdioSession
+
+    start = time.perf_counter()
+    try:
+        session = sessions.live(server.name) if sessions is not None else None
+        if session is not None:
+            await session.arequest("ping", timeout_s=timeout_s)
+        else:
+            session = StdioSession.from_server(server)
+            try:
+                await asyncio.to_thread(session.start, timeout_s)
+            finally:
+                await asyncio.to_thread(session.close, 2)
+        return ProbeResult(server.name, True, (time.perf_counter() - start) * 1000, "healthy")
+    except (MCPError, asyncio.TimeoutError, ValueError) as e:
+        return ProbeResult(server.name, False, (time.perf_counter() - start) * 1000, f"unreachable: {e or 'timeout'}")
+
+
+async def probe_all(servers: Iterable[MCPServer], timeout_s: float = PROBE_TIMEOUT_S, sessions=None) -> List[ProbeResult]:
+    """Probe every server concurrently; total time is that of the slowest one."""
+    servers = list(servers)
+    async with httpx.AsyncClient(timeout=timeout_s) as client:
+        return list(await asyncio.gather(*(
+            probe_stdio(s, timeout_s, sessions) if s.command else probe_http(client, s, timeout_s) for s in servers
+        )))
+
+
+class HealthMonitor:
+    """Background prober for the enabled MCP servers.
+
+    Every `interval_s` all servers are probed concurrently on a daemon
+    thread; the REPL sidebar reads `snapshot()`, and `is_down` reports the
+    last probe, which makes `SessionManager.call_tool` fail fast. With
+    `sessions` (a stdio SessionManager) stdio servers already running are
+    pinged over their session rather than spawned per probe. Servers
+    come from the config snapshot on each cycle, so edits apply without a
+    restart.
+    """
+
+    def __init__(
+        self,
+        servers: Optional[Mapping[str, MCPServer]] = None,
+        *,
+        interval_s: float = INTERVAL_S,
+        timeout_s: float = PROBE_TIMEOUT_S,
+        sessions=None,
+    ) -> None:
+        self._servers = servers
+        self.interval_s = interval_s
+        self.timeout_s = timeout_s
+        self.sessions = sessions
+        self._health: Dict[str, ServerHealth] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def servers(self) -> List[MCPServer]:
+        servers = self._servers
+        if servers is None:
+            from ..snapshot import current_snapshot
+
+            servers = current_snapshot().servers
+        return [s for s in servers.values() if s.enabled and (s.url or s.command)]
+
+    def check_now(self) -> Dict[str, ServerHealth]:
+        """Probe all servers once, synchronously; returns the updated snapshot."""
+        servers = self.servers()
+        results = asyncio.run(probe_all(servers, self.timeout_s, self.sessions)) if servers else []
+        with self._lock:
+            for name in [n for n in self._health if n not in {s.name for s in servers}]:
+                del self._health[name]  # removed or disabled since the last cycle
+            for r in results:
+                self._health.setdefault(r.name, ServerHealth(r.name)).record(r)
+        return self.snapshot()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check_now()
+            except Exception:
+                pass  # a broken config or probe must not kill the monitor
+            self._stop.wait(self.interval_s)
+
+    def start(self) -> "HealthMonitor":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="mcp-health", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout_s + 1)
+            self._thread = None
+
+    def snapshot(self) -> Dict[str, ServerHealth]:
+        with self._lock:
+            return {
+                n: ServerHealth(h.name, h.up, h.detail, h.checked_at, h.failures, deque(h.latencies, maxlen=HISTORY))
+                for n, h in self._health.items()
+            }
+
+    def is_down(self, name: str) -> bool:
+        """True only when the last probe failed; unknown servers are given the benefit of the doubt."""
+        with self._lock:
+            h = self._health.get(name)
+            return h is not None and h.up is False
+
+
+_MONITOR: Optional[HealthMonitor] = None
+
+
+def monitor_interval() -> float:
+    """Seconds between background probes (ACTCLI_MCP_HEALTH_INTERVAL_S); 0 turns the monitor off."""
+    return float(os.environ.get("ACTCLI_MCP_HEALTH_INTERVAL_S", INTERVAL_S))
+
+
+def start_monitor(**kw) -> HealthMonitor:
+    """Start (or return) the process-wide monitor used by the REPL."""
+    global _MONITOR
+    if _MONITOR is None:
+        _MONITOR = HealthMonitor(**kw)
+    return _MONITOR.start()
+
+
+def current_monitor() -> Optional[HealthMonitor]:
+    return _MONITOR
+
+
+def stop_monitor() -> None:
+    global _MONITOR
+    if _MONITOR is not None:
+        _MONITOR.stop()
+        _MONITOR = None
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from platformdirs import user_config_dir
+
+
+TTL_S = 300
+MAX_ENTRIES = 256
+MAX_BYTES = 4 * 1024 * 1024  # approximate, from the JSON size of cached results
+STATS_FILE = "cache-stats.json"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Results of idempotent calls to one MCP server, keyed by (op, params).
+
+    Entries expire after `ttl_s` and the least recently used are evicted
+    beyond `max_entries` or `max_bytes`. Any mutating call against the
+    server clears the whole cache: ops cannot tell which reads a write
+    affects. Hits return a copy so callers may modify what they get.
+    """
+
+    def __init__(self, name: str, *, ttl_s: float = TTL_S, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES) -> None:
+        self.name = name
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()  # key -> (expires, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(op: str, params: Any) -> str:
+        return op + "\0" + json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, op: str, params: Any) -> Tuple[bool, Any]:
+        k = self.key(op, params)
+        with self._lock:
+            entry = self._entries.get(k)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(k)
+                self.stats.hits += 1
+                return True, copy.deepcopy(entry[2])
+            if entry is not None:
+                self._drop(k)
+            self.stats.misses += 1
+            return False, None
+
+    def put(self, op: str, params: Any, value: Any) -> None:
+        if self.ttl_s <= 0:
+            return
+        k = self.key(op, params)
+        size = len(k) + len(json.dumps(value, separators=(",", ":"), default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if k in self._entries:
+                self._drop(k)
+            self._entries[k] = (time.monotonic() + self.ttl_s, size, copy.deepcopy(value))
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def _drop(self, k: str) -> None:
+        _, size, _ = self._entries.pop(k)
+        self._bytes -= size
+
+    def invalidate(self) -> None:
+        with self._lock:
+            if self._entries:
+                self.stats.invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def call(
+        self,
+        op: str,
+        params: Any,
+        fetch: Callable[[], Any],
+        *,
+        read_only: bool,
+        cacheable: Callable[[Any], bool] = lambda _: True,
+    ) -> Any:
+        """Run `fetch` for (op, params) through the cache.
+
+        Read-only ops are served from memory when possible; results that
+        `cacheable` rejects (errors) are returned but not kept. Any other op
+        runs and then invalidates the cache, even if it failed part-way.
+        """
+        if not read_only:
+            try:
+                return fetch()
+            finally:
+                self.invalidate()
+        hit, value = self.get(op, params)
+        if hit:
+            return value
+        value = fetch()
+        if cacheable(value):
+            self.put(op, params, value)
+        return value
+
+
+_CACHES: Dict[str, ResultCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def result_cache(name: str, ttl_s: Optional[float] = None) -> ResultCache:
+    """The process-wide cache for server `name`, shared by every client of it."""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(name)
+        if cache is None:
+            cache = _CACHES[name] = ResultCache(name, ttl_s=TTL_S if ttl_s is None else ttl_s)
+        elif ttl_s is not None:
+            cache.ttl_s = ttl_s  # follows config edits
+        return cache
+
+
+def stats_path() -> Path:
+    return Path(user_config_dir("actcli", "actcli")) / "mcp" / STATS_FILE
+
+
+def load_stats() -> Dict[str, CacheStats]:
+    """Counters accumulated by earlier processes (see `save_stats`)."""
+    try:
+        data = json.loads(stats_path().read_text(encoding="utf-8"))
+        return {name: CacheStats(**{k: int(v) for k, v in s.items() if k in CacheStats.__dataclass_fields__}) for name, s in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Saved counters plus those of this process, per server."""
+    totals = load_stats()
+    with _CACHES_LOCK:
+        live = {name: c.stats for name, c in _CACHES.items()}
+    for name, s in live.items():
+        t = totals.setdefault(name, CacheStats())
+        t.hits += s.hits
+        t.misses += s.misses
+        t.invalidations += s.invalidations
+        t.evictions += s.evictions
+    return totals
+
+
+def save_stats() -> None:
+    """Fold this process's counters into the stats file, so `actcli mcp list` can report them."""
+    with _CACHES_LOCK:
+        if not any(c.stats.hits or c.stats.misses for c in _CACHES.values()):
+            return
+    totals = cache_stats()
+    try:
+        path = stats_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({n: asdict(s) for n, s in totals.items()}, indent=2), encoding="utf-8")
+    except OSError:
+        return
+    with _CACHES_LOCK:
+        for c in _CACHES.values():
+            c.stats = CacheStats()  # now part of the saved totals
+
+
+atexit.register(save_stats)
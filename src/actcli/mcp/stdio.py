@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import itertools
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..version import __version__
+from .config import MCPServer
+from .result_cache import result_cache
+
+
+PROTOCOL_VERSION = "2024-11-05"
+REQUEST_TIMEOUT_S = 30
+# Restarts allowed per server within RESTART_WINDOW_S before giving up
+MAX_RESTARTS = 3
+RESTART_WINDOW_S = 60
+
+
+class MCPError(RuntimeError):
+    """A JSON-RPC error response, or a session that cannot serve requests."""
+
+    def __init__(self, message: str, code: Optional[int] = None, data: Any = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class StdioSession:
+    """One MCP server run as a subprocess, speaking JSON-RPC 2.0 over stdin/stdout.
+
+    Messages are newline-delimited JSON. Every request gets an id and a
+    future; a reader thread resolves futures as responses arrive in any
+    order, so concurrent tool calls share the one pipe. `tools/list` is
+    cached until the server sends `notifications/tools/list_changed`.
+    """
+
+    def __init__(
+        self, argv: Sequence[str], *, name: str = "", env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None
+    ) -> None:
+        if not argv:
+            raise ValueError("MCP stdio server needs a command")
+        self.argv = list(argv)
+        self.name = name or os.path.basename(self.argv[0])
+        self.env = env
+        self.cwd = cwd
+        self.server_info: Dict[str, Any] = {}
+        self.capabilities: Dict[str, Any] = {}
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._pending: Dict[int, Future] = {}
+        self._ids = itertools.count(1)
+        self._write_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._tools: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def from_server(cls, server: MCPServer) -> "StdioSession":
+        if not server.command:
+            raise ValueError(f"MCP server {server.name} has no command")
+        return cls(shlex.split(server.command), name=server.name)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self, timeout_s: float = REQUEST_TIMEOUT_S) -> "StdioSession":
+        """Launch the server and run the `initialize` handshake."""
+        env = {**os.environ, **self.env} if self.env else None
+        try:
+            self._proc = subprocess.Popen(
+                self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=self.cwd, env=env
+            )
+        except OSError as e:
+            raise MCPError(f"cannot start {self.name}: {e}") from e
+        self._reader = threading.Thread(target=self._read_loop, args=(self._proc,), name=f"mcp-{self.name}", daemon=True)
+        self._reader.start()
+        result = self.request(
+            "initialize",
+            {"protocolVersion": PROTOCOL_VERSION, "capabilities": {}, "clientInfo": {"name": "actcli", "version": __version__}},
+            timeout_s=timeout_s,
+        )
+        self.server_info = result.get("serverInfo") or {}
+        self.capabilities = result.get("capabilities") or {}
+        self.notify("notifications/initialized")
+        return self
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        proc = self._proc
+        if proc is None or proc.stdin is None or proc.poll() is not None:
+            raise MCPError(f"{self.name} is not running")
+        data = (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._write_lock:
+            try:
+                proc.stdin.write(data)
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError) as e:
+                raise MCPError(f"{self.name} closed its input: {e}") from e
+
+    def _read_loop(self, proc: subprocess.Popen) -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue  # stray output: not part of the protocol
+            if not isinstance(msg, dict):
+                continue
+            if "method" in msg:
+                self._on_message(msg)
+                continue
+            fut = self._pending.pop(msg.get("id"), None) if isinstance(msg.get("id"), int) else None
+            if fut is None:
+                continue
+            try:
+                if "error" in msg:
+                    err = msg["error"] or {}
+                    fut.set_exception(MCPError(str(err.get("message", "error")), err.get("code"), err.get("data")))
+                else:
+                    fut.set_result(msg.get("result") or {})
+            except InvalidStateError:
+                pass  # the caller gave up (timeout) while the response was in flight
+        # EOF: the server exited; nothing pending can complete any more
+        with self._state_lock:
+            pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(MCPError(f"{self.name} exited"))
+
+    def _on_message(self, msg: Dict[str, Any]) -> None:
+        """Server-initiated traffic: answer pings, track tool list changes, refuse the rest."""
+        method = msg.get("method")
+        if method == "notifications/tools/list_changed":
+            self._tools = None
+        if "id" not in msg:
+            return  # notification
+        reply: Dict[str, Any] = {"jsonrpc": "2.0", "id": msg["id"]}
+        if method == "ping":
+            reply["result"] = {}
+        else:
+            reply["error"] = {"code": -32601, "message": f"method not supported by client: {method}"}
+        try:
+            self._send(reply)
+        except MCPError:
+            pass
+
+    def submit(self, method: str, params: Optional[Dict[str, Any]] = None) -> Future:
+        """Send a request without waiting; the future resolves to its `result`."""
+        fut: Future = Future()
+        rid = next(self._ids)
+        with self._state_lock:
+            self._pending[rid] = fut
+        fut.add_done_callback(lambda _, rid=rid: self._pending.pop(rid, None))  # also drops timed-out requests
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "id": rid, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            self._send(message)
+        except MCPError:
+            fut.cancel()
+            raise
+        return fut
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None, *, timeout_s: float = REQUEST_TIMEOUT_S) -> Dict[str, Any]:
+        fut = self.submit(method, params)
+        try:
+            return fut.result(timeout=timeout_s)
+        except TimeoutError:
+            fut.cancel()
+            raise MCPError(f"{self.name}: {method} timed out after {timeout_s}s")
+
+    async def arequest(self, method: str, params: Optional[Dict[str, Any]] = None, *, timeout_s: float = REQUEST_TIMEOUT_S) -> Dict[str, Any]:
+        """`request` for asyncio callers; waits on the same future without blocking the loop."""
+        return await asyncio.wait_for(asyncio.wrap_future(self.submit(method, params)), timeout_s)
+
+    def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        self._send(message)
+
+    def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Tools the server offers (all pages), cached until the server says they changed."""
+        if self._tools is not None and not refresh:
+            return self._tools
+        tools: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            result = self.request("tools/list", {"cursor": cursor} if cursor else {})
+            tools.extend(result.get("tools") or [])
+            cursor = result.get("nextCursor")
+            if not cursor:
+                break
+        self._tools = tools
+        return tools
+
+    def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None, *, timeout_s: float = REQUEST_TIMEOUT_S) -> Dict[str, Any]:
+        return self.request("tools/call", {"name": name, "arguments": arguments or {}}, timeout_s=timeout_s)
+
+    async def acall_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None, *, timeout_s: float = REQUEST_TIMEOUT_S) -> Dict[str, Any]:
+        return await self.arequest("tools/call", {"name": name, "arguments": arguments or {}}, timeout_s=timeout_s)
+
+    def close(self, timeout_s: float = 5) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()  # EOF asks a stdio server to exit
+            proc.wait(timeout=timeout_s)
+        except Exception:
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+        if self._reader is not None:
+            self._reader.join(timeout=timeout_s)
+
+
+class SessionManager:
+    """Long-lived stdio sessions per configured server, started on first use.
+
+    A session whose process has died is restarted on the next call, up to
+    `max_restarts` times per `window_s`; beyond that the server is treated
+    as broken until `restart` is called explicitly. In-flight requests on a
+    dying session fail rather than being retried, since tool calls may
+    have side effects.
+    """
+
+    def __init__(self, servers: Optional[Dict[str, MCPServer]] = None, *, max_restarts: int = MAX_RESTARTS, window_s: float = RESTART_WINDOW_S) -> None:
+        self._servers = servers
+        self._sessions: Dict[str, StdioSession] = {}
+        self._starts: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self.max_restarts = max_restarts
+        self.window_s = window_s
+        atexit.register(self.close_all)
+
+    def _server(self, name: str) -> MCPServer:
+        servers = self._servers
+        if servers is None:
+            from ..snapshot import current_snapshot
+
+            servers = current_snapshot().servers  # type: ignore[assignment]
+        server = (servers or {}).get(name)
+        if server is None:
+            raise MCPError(f"unknown MCP server: {name}")
+        if not server.command:
+            raise MCPError(f"MCP server {name} is not a stdio server (no command configured)")
+        return server
+
+    def get(self, name: str) -> StdioSession:
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is not None and session.alive:
+                return session
+            now = time.monotonic()
+            recent = [t for t in self._starts.get(name, []) if now - t < self.window_s]
+            if len(recent) > self.max_restarts:
+                raise MCPError(f"{name} keeps exiting; not restarting (use `actcli mcp restart {name}`)")
+            if session is not None:
+                session.close(timeout_s=1)
+            session = StdioSession.from_server(self._server(name))
+            self._starts[name] = [*recent, now]
+            try:
+                session.start()
+            except MCPError:
+                session.close(timeout_s=1)
+                raise
+            self._sessions[name] = session
+            return session
+
+    def live(self, name: str) -> Optional[StdioSession]:
+        """The running session for `name`, if any; never starts one."""
+        with self._lock:
+            session = self._sessions.get(name)
+        return session if session is not None and session.alive else None
+
+    def restart(self, name: str) -> StdioSession:
+        """Stop the server (if running) and start it afresh, resetting the restart budget."""
+        with self._lock:
+            session = self._sessions.pop(name, None)
+            self._starts.pop(name, None)
+        if session is not None:
+            session.close()
+        result_cache(name).invalidate()  # a fresh process may answer differently
+        return self.get(name)
+
+    def read_only(self, server: str, tool: str) -> bool:
+        """Whether `tool` only reads: listed in the server's `read_only`, or annotated `readOnlyHint`."""
+        if tool in self._server(server).read_only:
+            return True
+        try:
+            tools = self.list_tools(server)
+        except MCPError:
+            return False
+        meta = next((t for t in tools if t.get("name") == tool), None)
+        return bool(meta and (meta.get("annotations") or {}).get("readOnlyHint"))
+
+    def call_tool(self, server: str, tool: str, arguments: Optional[Dict[str, Any]] = None, **kw: Any) -> Dict[str, Any]:
+        """Call `tool`; results of read-only tools come from the server's result cache when fresh.
+
+        Fails at once if the health monitor saw the server down on its last probe.
+        """
+        from .health import current_monitor
+
+        config = self._server(server)
+        monitor = current_monitor()
+        if monitor is not None and monitor.is_down(server):
+            raise MCPError(f"MCP server {server} is down (last health probe failed)")
+        session = self.get(server)
+        if config.cache_ttl_s <= 0:
+            return session.call_tool(tool, arguments, **kw)
+        return result_cache(server, config.cache_ttl_s).call(
+            tool,
+            arguments or {},
+            lambda: session.call_tool(tool, arguments, **kw),
+            read_only=self.read_only(server, tool),
+            cacheable=lambda r: not r.get("isError"),
+        )
+
+    def list_tools(self, server: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        return self.get(server).list_tools(refresh)
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for s in sessions:
+            s.close(timeout_s=2)
+
+
+_MANAGER: Optional[SessionManager] = None
+
+
+def session_manager() -> SessionManager:
+    """The process-wide manager (servers from the config snapshot), created on first use."""
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = SessionManager()
+    return _MANAGER
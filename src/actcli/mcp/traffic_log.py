@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import random
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+
+LOG_DIR = Path("out/mcp-logs")
+MAX_BYTES = 10 * 1024 * 1024  # rotate the active segment beyond this size...
+MAX_AGE_S = 24 * 3600  # ...or once its first record is this old
+KEEP = 10  # rotated segments kept per server
+QUEUE_MAX = 10_000  # records waiting for the writer; beyond this they are dropped, not waited on
+
+
+class TrafficLog:
+    """Append-only JSONL log of one MCP server's traffic, written off the request path.
+
+    `record` only enqueues; a daemon thread serialises and appends to
+    `<dir>/<name>.jsonl`, rotating it to `<name>-<UTC stamp>.jsonl[.gz]` by
+    size or age and pruning old segments. With `sample` < 1 only that
+    fraction of successful calls is kept (failures always are); each line
+    carries the rate so counts can be scaled back up. When the queue is full
+    records are dropped and a `{"dropped": n}` line notes the gap.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        directory: Path = LOG_DIR,
+        max_bytes: int = MAX_BYTES,
+        max_age_s: float = MAX_AGE_S,
+        compress: bool = True,
+        keep: int = KEEP,
+        sample: float = 1.0,
+    ) -> None:
+        self.name = name
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.compress = compress
+        self.keep = keep
+        self.sample = sample
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(QUEUE_MAX)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._fh: Optional[IO[bytes]] = None
+        self._size = 0
+        self._opened_at = 0.0
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"{self.name}.jsonl"
+
+    def record(self, op: str, params: Any, response: Any = None, *, error: Optional[str] = None, elapsed_ms: Optional[float] = None) -> None:
+        """Queue one request/response pair; never blocks on disk."""
+        if error is None and self.sample < 1.0 and random.random() >= self.sample:
+            return
+        entry: Dict[str, Any] = {"ts": time.time(), "server": self.name, "op": op, "params": params}
+        if error is not None:
+            entry["error"] = error
+        else:
+            entry["response"] = response
+        if elapsed_ms is not None:
+            entry["elapsed_ms"] = round(elapsed_ms, 2)
+        if self.sample < 1.0:
+            entry["sample"] = self.sample
+        self._start()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=f"mcp-log-{self.name}", daemon=True)
+                    self._thread.start()
+
+    def flush(self, timeout_s: float = 5) -> None:
+        """Wait until everything queued so far is on disk (for shutdown and tests)."""
+        deadline = time.monotonic() + timeout_s
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            try:
+                self._queue.put(None, timeout=5)
+            except queue.Full:
+                pass
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    # Writer thread
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is None:
+                    break
+                self._write(entry)
+                if self._queue.empty() and self._fh is not None:
+                    self._fh.flush()  # once per burst, not per record
+            except Exception:
+                pass  # logging must never take the client down
+            finally:
+                self._queue.task_done()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            self._append({"ts": entry["ts"], "server": self.name, "dropped": dropped})
+        self._append(entry)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        line = (json.dumps(entry, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        if self._fh is None:
+            self._open()
+        elif self._size + len(line) > self.max_bytes or time.time() - self._opened_at > self.max_age_s:
+            self._rotate()
+        assert self._fh is not None
+        self._fh.write(line)
+        self._size += len(line)
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._opened_at = time.time()
+        if self.path.exists():
+            # Carry on with an existing segment; its age is that of its first record
+            try:
+                with self.path.open("rb") as fh:
+                    self._opened_at = float(json.loads(fh.readline())["ts"])
+            except Exception:
+                pass
+        self._fh = self.path.open("ab")
+        self._size = self._fh.tell()
+        if self._size and (self._size >= self.max_bytes or time.time() - self._opened_at > self.max_age_s):
+            self._rotate()
+
+    def _rotate(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        # Several rotations within a second are numbered after the newest one (never a pruned name)
+        taken = [n for st, n, _ in self._segments() if st == stamp]
+        suffix = f"-{max(taken) + 1}" if taken else ""
+        target = self.directory / f"{self.name}-{stamp}{suffix}.jsonl"
+        os.replace(self.path, target)
+        if self.compress:
+            with target.open("rb") as src, gzip.open(target.with_suffix(".jsonl.gz"), "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            target.unlink()
+        self._prune()
+        self._fh = self.path.open("ab")
+        self._size = 0
+        self._opened_at = time.time()
+
+    def _segments(self) -> List[Tuple[str, int, Path]]:
+        pattern = re.compile(re.escape(self.name) + r"-(\d{8}T\d{6})(?:-(\d+))?\.jsonl(?:\.gz)?")
+        found = []
+        for p in self.directory.glob(f"{self.name}-*"):
+            m = pattern.fullmatch(p.name)  # not another server whose name starts with ours
+            if m:
+                found.append((m.group(1), int(m.group(2) or 0), p))
+        return sorted(found)
+
+    def segments(self) -> List[Path]:
+        """Rotated segments, oldest first."""
+        return [p for _, _, p in self._segments()]
+
+    def _prune(self) -> None:
+        old = self.segments()
+        for p in old[: max(0, len(old) - self.keep)]:
+            p.unlink(missing_ok=True)
+
+
+_LOGS: Dict[str, TrafficLog] = {}
+_LOGS_LOCK = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def traffic_log(name: str, sample: float = 1.0) -> TrafficLog:
+    """The shared log for server `name`; rotation settings come from ACTCLI_MCP_LOG_* variables."""
+    with _LOGS_LOCK:
+        log = _LOGS.get(name)
+        if log is None:
+            log = _LOGS[name] = TrafficLog(
+                name,
+                directory=Path(os.environ.get("ACTCLI_MCP_LOG_DIR", LOG_DIR)),
+                max_bytes=int(_env_float("ACTCLI_MCP_LOG_MAX_BYTES", MAX_BYTES)),
+                max_age_s=_env_float("ACTCLI_MCP_LOG_MAX_AGE_S", MAX_AGE_S),
+                compress=os.environ.get("ACTCLI_MCP_LOG_COMPRESS", "1") not in ("0", "false", "off"),
+                keep=int(_env_float("ACTCLI_MCP_LOG_KEEP", KEEP)),
+                sample=sample,
+            )
+        log.sample = sample  # follows config edits
+        return log
+
+
+def close_all() -> None:
+    with _LOGS_LOCK:
+        logs = list(_LOGS.values())
+    for log in logs:
+        log.close()
+
+
+atexit.register(close_all)
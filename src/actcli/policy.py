@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import fnmatch
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
-from .trust import TrustRecord, get_trust
-from .config import Config, load_config
+from .globset import GlobSet
+
+from .snapshot import current_snapshot
 
 
 @dataclass
@@ -14,6 +14,8 @@ class Policy:
     read: List[str] = field(default_factory=lambda: ["./**"])  # globs relative to project root
     write: List[str] = field(default_factory=lambda: ["./out/**"])  # globs relative to project root
     cloud_share: bool = False
+    root: Optional[Path] = None  # folder the globs are relative to; defaults to cwd
+    _compiled: Dict[str, GlobSet] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def allow_read(self, glob: str) -> None:
         if glob not in self.read:
@@ -29,20 +31,39 @@ class Policy:
         if kind == "write" and glob in self.write:
             self.write.remove(glob)
 
+    def globs(self, kind: str) -> GlobSet:
+        """Compiled matcher for `read` or `write`; rebuilt only when that list changes."""
+        patterns = self.read if kind == "read" else self.write
+        compiled = self._compiled.get(kind)
+        if compiled is None or compiled.patterns != tuple(patterns):
+            compiled = self._compiled[kind] = GlobSet(patterns)
+        return compiled
+
+    def _relative(self, path: Path, root: Path | None) -> Optional[str]:
+        root = (root or self.root or Path.cwd()).resolve()
+        try:
+            return Path(path).resolve().relative_to(root).as_posix()
+        except ValueError:
+            return None  # outside the project root
+
     def can_read(self, path: Path, root: Path | None = None) -> bool:
-        root = root or Path.cwd()
-        rel = "./" + str(Path(path).resolve().relative_to(root))
-        return any(fnmatch.fnmatch(rel, g) for g in self.read)
+        rel = self._relative(path, root)
+        return rel is not None and self.globs("read").matches(rel)
 
     def can_write(self, path: Path, root: Path | None = None) -> bool:
-        root = root or Path.cwd()
-        rel = "./" + str(Path(path).resolve().relative_to(root))
-        return any(fnmatch.fnmatch(rel, g) for g in self.write)
+        rel = self._relative(path, root)
+        return rel is not None and self.globs("write").matches(rel)
+
+    def readable_files(self, root: Path | None = None) -> Iterator[Path]:
+        """Every readable file under `root`, skipping directories the read globs exclude."""
+        root = root or self.root or Path.cwd()
+        for rel in self.globs("read").walk(root):
+            yield root / rel
 
 
 def merge_policy() -> Policy:
-    cfg, _ = load_config()
-    trust = get_trust()
+    """A new, session-mutable Policy built from the cached config/trust snapshot."""
+    trust = current_snapshot().trust
     p = Policy()
     # From config defaults (future: allow explicit policy in config)
     # From trust store
@@ -50,5 +71,6 @@ def merge_policy() -> Policy:
         p.read = trust.read[:]
         p.write = trust.write[:]
         p.cloud_share = trust.cloud_share
+        p.root = Path(trust.path)
     return p
 
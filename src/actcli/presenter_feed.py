@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .seminar.coordinator import TurnResult
+from .session_log import result_to_dict
+from .session_store import SessionStore
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def empty_state() -> Dict[str, Any]:
+    return {"timestamp": None, "prompt": "", "round": 0, "results": [], "streams": {}, "synthesis": None, "disagreement": None}
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Fold one presenter delta into `state` (the same shape as state.json)."""
+    kind = delta.get("type")
+    if kind == "snapshot":
+        state.clear()
+        state.update(empty_state())
+        state.update(delta.get("state") or {})
+    elif kind == "prompt":
+        state.clear()
+        state.update(empty_state())
+        state.update(timestamp=delta.get("timestamp"), prompt=delta.get("prompt", ""))
+    elif kind == "adapter_start":
+        state["round"] = delta.get("round", state.get("round", 0))
+        state["streams"][delta.get("adapter", "")] = ""
+    elif kind == "chunk":
+        name = delta.get("adapter", "")
+        state["streams"][name] = state["streams"].get(name, "") + delta.get("text", "")
+    elif kind == "results":
+        state["round"] = delta.get("round", state.get("round", 0))
+        state["results"] = delta.get("results", [])
+        state["streams"] = {}
+    elif kind == "synthesis":
+        state["synthesis"] = delta.get("synthesis")
+        state["disagreement"] = delta.get("disagreement")
+
+
+class PresenterHub:
+    """Server-side presenter state plus fan-out of deltas to subscribers.
+
+    Lives on the presenter's event loop: `publish` folds the delta into the
+    current state once, encodes it once, and hands the same bytes to every
+    subscriber queue. A viewer whose queue is full is disconnected (its
+    EventSource reconnects and receives a fresh snapshot) rather than
+    slowing everyone else down.
+    """
+
+    def __init__(self, max_queue: int = 1000) -> None:
+        self.state: Dict[str, Any] = empty_state()
+        self._subscribers: List["asyncio.Queue[Optional[bytes]]"] = []
+        self._max_queue = max_queue
+        self.version = 0
+        self._snapshot_cache: Tuple[int, bytes] = (-1, b"")
+
+    def subscribe(self) -> "asyncio.Queue[Optional[bytes]]":
+        q: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=self._max_queue)
+        q.put_nowait(self.snapshot_message())
+        self._subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q: "asyncio.Queue[Optional[bytes]]") -> None:
+        if q in self._subscribers:
+            self._subscribers.remove(q)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @staticmethod
+    def encode(delta: Dict[str, Any]) -> bytes:
+        return f"data: {json.dumps(delta, ensure_ascii=False)}\n\n".encode("utf-8")
+
+    def snapshot_message(self) -> bytes:
+        version, msg = self._snapshot_cache
+        if version != self.version:
+            msg = self.encode({"type": "snapshot", "state": self.state})
+            self._snapshot_cache = (self.version, msg)
+        return msg
+
+    def publish(self, delta: Dict[str, Any]) -> None:
+        apply_delta(self.state, delta)
+        self.version += 1
+        msg = self.encode(delta)
+        for q in list(self._subscribers):
+            try:
+                q.put_nowait(msg)
+            except asyncio.QueueFull:
+                self._subscribers.remove(q)
+                while not q.empty():
+                    q.get_nowait()
+                q.put_nowait(None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return json.loads(json.dumps(self.state))
+
+
+class PresenterHistory:
+    """Read-only session history for the presenter, backed by the session store.
+
+    Answers the presenter's `/api/...` routes with small JSON documents:
+    a newest-first page of turn summaries, one turn with response previews,
+    or one full response. Not thread-safe; the server calls it from a single
+    worker thread, which also owns the SQLite connection.
+    """
+
+    PREVIEW_CHARS = 400
+    MAX_PAGE = 200
+
+    def __init__(self, session_dir: Path, sync_interval_s: float = 1.0) -> None:
+        self.session_dir = session_dir
+        self.sync_interval_s = sync_interval_s
+        self._store: Optional[SessionStore] = None
+        self._synced_at = 0.0
+
+    def _fresh_store(self) -> SessionStore:
+        if self._store is None:
+            self._store = SessionStore(session_dir=self.session_dir)
+        now = time.monotonic()
+        if now - self._synced_at >= self.sync_interval_s:
+            # Incremental: unchanged logs cost a stat, the live log only its new tail
+            self._store.sync()
+            self._synced_at = now
+        return self._store
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def query(self, path: str, params: Dict[str, List[str]]) -> Optional[Dict[str, Any]]:
+        """Dispatch `/api/sessions`, `/api/turns[/<id>]` or `/api/responses/<id>`; None means not found."""
+        parts = [p for p in path.split("/") if p][1:]
+        store = self._fresh_store()
+
+        def _int(name: str, default: Optional[int] = None) -> Optional[int]:
+            values = params.get(name)
+            return int(values[0]) if values and values[0] != "" else default
+
+        limit = max(1, min(self.MAX_PAGE, _int("limit", 50) or 50))
+        if parts == ["sessions"]:
+            page = max(1, _int("page", 1) or 1)
+            rows = store.list_sessions(limit=limit, offset=(page - 1) * limit)
+            return {"items": [{"id": r.id, "started": r.started, "turns": r.turns} for r in rows]}
+        if parts == ["turns"]:
+            session_id = _int("session") or store.latest_session_id()
+            if session_id is None:
+                return {"session": None, "total": 0, "items": [], "next": None}
+            items = store.list_turns(session_id, before=_int("before"), limit=limit)
+            return {
+                "session": session_id,
+                "total": store.count_turns(session_id),
+                "items": [vars(i) for i in items],
+                "next": items[-1].turn if len(items) == limit else None,
+            }
+        if len(parts) == 2 and parts[0] == "turns":
+            found = store.get_turn(int(parts[1]))
+            if found is None:
+                return None
+            turn, responses = found
+            rounds: Dict[int, List[Dict[str, Any]]] = {}
+            for r in responses:
+                text = r["text"] or ""
+                rounds.setdefault(r["round"], []).append({
+                    "id": r["id"], "name": r["adapter"], "local": bool(r["local"]), "latency_ms": r["latency_ms"],
+                    "error": r["error"], "length": len(text), "preview": text[:self.PREVIEW_CHARS],
+                })
+            return {
+                "id": turn["id"], "turn": turn["turn"], "t": turn["t"], "prompt": turn["prompt"],
+                "synthesis": turn["synthesis"], "disagreement": turn["disagreement"],
+                "rounds": [{"round": n, "responses": rs} for n, rs in sorted(rounds.items())],
+            }
+        if len(parts) == 2 and parts[0] == "responses":
+            r = store.get_response(int(parts[1]))
+            if r is None:
+                return None
+            return {"id": r["id"], "round": r["round"], "name": r["adapter"], "text": r["text"], "error": r["error"]}
+        return None
+
+
+class PresenterPublisher:
+    """Pushes presenter deltas from the REPL to a running presenter.
+
+    Calls only enqueue; a background thread coalesces pending deltas and POSTs
+    them to `<url>/publish` over one keep-alive connection. If the presenter
+    is unreachable, deltas are dropped so the REPL never waits on it.
+    """
+
+    def __init__(self, url: str, max_pending: int = 10_000) -> None:
+        self.url = url.rstrip("/")
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="actcli-presenter-push", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls) -> Optional["PresenterPublisher"]:
+        url = os.environ.get("ACTCLI_PRESENTER_URL")
+        return cls(url) if url else None
+
+    def send(self, delta: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(delta)
+        except queue.Full:
+            pass
+
+    # Convenience producers ------------------------------------------------
+    def prompt(self, text: str) -> None:
+        self.send({"type": "prompt", "prompt": text, "timestamp": _now()})
+
+    def results(self, round_index: int, results: List[TurnResult]) -> None:
+        self.send({"type": "results", "round": round_index, "results": [result_to_dict(r) for r in results]})
+
+    def synthesis(self, text: Optional[str], disagreement: Optional[float]) -> None:
+        self.send({"type": "synthesis", "synthesis": text, "disagreement": disagreement})
+
+    def event_hook(self, type: str, data: Dict[str, Any]) -> None:
+        """`run_round(on_event=...)` compatible; forwards adapter starts."""
+        if type == "adapter_start":
+            self.send({"type": "adapter_start", "adapter": data.get("adapter"), "round": data.get("round")})
+
+    def chunk_hook(self, adapter: str, round_index: int, text: str) -> None:
+        """`run_round(on_chunk=...)` compatible."""
+        self.send({"type": "chunk", "adapter": adapter, "round": round_index, "text": text})
+
+    def flush(self, timeout_s: float = 2.0) -> None:
+        done = threading.Event()
+        self.send({"type": "_flush", "event": done})
+        done.wait(timeout_s)
+
+    # Background sender ----------------------------------------------------
+    @staticmethod
+    def _coalesce(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        for d in batch:
+            prev = out[-1] if out else None
+            if prev and d["type"] == "chunk" and prev["type"] == "chunk" and prev["adapter"] == d["adapter"]:
+                out[-1] = {**prev, "text": prev["text"] + d["text"]}
+            else:
+                out.append(d)
+        return out
+
+    def _run(self) -> None:
+        import httpx
+
+        with httpx.Client(timeout=2.0) as client:
+            while True:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                flushes = [d["event"] for d in batch if d["type"] == "_flush"]
+                deltas = self._coalesce([d for d in batch if d["type"] != "_flush"])
+                if deltas:
+                    try:
+                        client.post(f"{self.url}/publish", json=deltas)
+                    except Exception:
+                        pass
+                for ev in flushes:
+                    ev.set()
+
+
+def combine_hooks(*hooks: Optional[Callable[..., None]]) -> Optional[Callable[..., None]]:
+    active = [h for h in hooks if h is not None]
+    if not active:
+        return None
+    if len(active) == 1:
+        return active[0]
+
+    def _hook(*args: Any) -> None:
+        for h in active:
+            h(*args)
+    return _hook
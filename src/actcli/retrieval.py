@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .attach import Chunk, render_chunk
+
+
+K1 = 1.2
+B = 0.75
+BIGRAM_WEIGHT = 0.5
+# Postings above which a term counts as common and is no longer scanned in full
+COMMON_DF = 10_000
+# Strongest postings kept per common term for candidate generation
+TOP_POSTINGS = 2_000
+# Partially scored candidates rescored exactly, per requested result
+RESCORE = 10
+LOCAL_CONTEXT_CHARS = 8_000  # local models: smaller windows, CPU prefill
+CLOUD_CONTEXT_CHARS = 24_000
+
+_TOKEN = re.compile(r"[a-z0-9_]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it its of on or that the their then there these "
+    "this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _terms(tokens: Sequence[str], bigrams: bool) -> List[str]:
+    if not bigrams:
+        return list(tokens)
+    # "a b" can never collide with a unigram, which has no spaces
+    return [*tokens, *(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))]
+
+
+def context_budget(adapter: object) -> int:
+    """Characters of retrieved context to send to one adapter.
+
+    Adapters may declare `context_chars`; otherwise local models get a
+    smaller budget than cloud ones.
+    """
+    declared = getattr(adapter, "context_chars", None)
+    if isinstance(declared, int) and declared > 0:
+        return declared
+    return LOCAL_CONTEXT_CHARS if getattr(adapter, "is_local", False) else CLOUD_CONTEXT_CHARS
+
+
+class BM25Index:
+    """In-memory inverted index over chunks with Okapi BM25 ranking.
+
+    Chunks are grouped by source (a file path, or a session turn), and
+    `update_source` swaps one source's chunks incrementally: unchanged
+    chunk ids are kept, so re-attaching a tree touches only edited files.
+    Adjacent-word bigrams are indexed as extra terms and, with
+    `bigram_weight`, reward chunks that contain the query's phrases.
+
+    Queries use MaxScore-style pruning. The rarest query terms, up to
+    `common_df` postings in total (shared across the query's terms), are
+    scored exhaustively to find candidates; the other terms add exact scores to those candidates and,
+    only if their upper bound could still change the top `k`, contribute
+    their strongest `top_postings` postings (for common terms, from a
+    bounded heap maintained as chunks are added). Query cost therefore depends on the query, not on
+    the corpus size; for common terms the ranking is approximate.
+    """
+
+    def __init__(
+        self,
+        *,
+        k1: float = K1,
+        b: float = B,
+        bigrams: bool = True,
+        bigram_weight: float = BIGRAM_WEIGHT,
+        common_df: int = COMMON_DF,
+        top_postings: int = TOP_POSTINGS,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.bigrams = bigrams
+        self.bigram_weight = bigram_weight
+        self.common_df = common_df
+        self.top_postings = top_postings
+        self._ids: Dict[str, int] = {}  # chunk id -> doc number (never reused)
+        self._docs: Dict[int, Tuple[Chunk, int]] = {}  # doc number -> (chunk, length in tokens)
+        self._postings: Dict[str, Dict[int, int]] = {}  # term -> {doc number: tf}
+        self._sources: Dict[str, Set[str]] = {}
+        self._total_len = 0
+        self._next = 0
+        # Common terms, and others once a query needed them: term -> (avgdl used, min-heap of the strongest (impact, doc))
+        self._top: Dict[str, Tuple[float, List[Tuple[float, int]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, chunk_id: str) -> bool:
+        return chunk_id in self._ids
+
+    @property
+    def avgdl(self) -> float:
+        return self._total_len / len(self._docs) if self._docs else 0.0
+
+    def _term_counts(self, text: str) -> Tuple[Dict[str, int], int]:
+        tokens = tokenize(text)
+        tf: Dict[str, int] = {}
+        for t in _terms(tokens, self.bigrams):
+            tf[t] = tf.get(t, 0) + 1
+        return tf, len(tokens)
+
+    def _impact(self, tf: int, length: int, avgdl: float) -> float:
+        k1 = self.k1
+        return tf * (k1 + 1.0) / (tf + k1 * (1.0 - self.b + self.b * length / avgdl))
+
+    def _build_top(self, term: str, avgdl: float) -> List[Tuple[float, int]]:
+        docs = self._docs
+        heap = heapq.nlargest(
+            self.top_postings, ((self._impact(tf, docs[d][1], avgdl), d) for d, tf in self._postings[term].items())
+        )
+        heapq.heapify(heap)
+        self._top[term] = (avgdl, heap)
+        return heap
+
+    def add(self, chunk: Chunk) -> None:
+        if chunk.id in self._ids:
+            return
+        tf, length = self._term_counts(chunk.text)
+        doc = self._next
+        self._next += 1
+        self._ids[chunk.id] = doc
+        self._docs[doc] = (chunk, length)
+        self._sources.setdefault(chunk.path, set()).add(chunk.id)
+        self._total_len += length
+        cap = self.top_postings
+        for t, n in tf.items():
+            postings = self._postings.setdefault(t, {})
+            postings[doc] = n
+            top = self._top.get(t)
+            if top is not None:
+                heap = top[1]
+                entry = (self._impact(n, length, top[0]), doc)
+                if len(heap) < cap:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            elif len(postings) > self.common_df:
+                self._build_top(t, self.avgdl)
+
+    def remove(self, chunk_id: str) -> None:
+        doc = self._ids.pop(chunk_id, None)
+        if doc is None:
+            return
+        chunk, length = self._docs.pop(doc)
+        # Terms are recomputed from the text rather than stored per chunk; heap
+        # entries for the removed doc are skipped at query time
+        for t in self._term_counts(chunk.text)[0]:
+            postings = self._postings.get(t)
+            if postings is not None:
+                postings.pop(doc, None)
+                if len(postings) <= self.common_df:
+                    self._top.pop(t, None)
+                if not postings:
+                    del self._postings[t]
+        ids = self._sources.get(chunk.path)
+        if ids is not None:
+            ids.discard(chunk_id)
+            if not ids:
+                del self._sources[chunk.path]
+        self._total_len -= length
+
+    def update_source(self, source: str, chunks: Iterable[Chunk]) -> Tuple[int, int]:
+        """Make `source`'s chunks exactly `chunks`; returns (added, removed)."""
+        new = {c.id: c for c in chunks}
+        old = self._sources.get(source, set())
+        stale = [i for i in old if i not in new]
+        fresh = [c for i, c in new.items() if i not in old]
+        for i in stale:
+            self.remove(i)
+        for c in fresh:
+            self.add(c)
+        return len(fresh), len(stale)
+
+    def drop_source(self, source: str) -> int:
+        return self.update_source(source, [])[1]
+
+    def sources(self) -> List[str]:
+        return sorted(self._sources)
+
+    # Ranking ----------------------------------------------------------------
+    def _idf(self, term: str) -> float:
+        n = len(self._docs)
+        df = len(self._postings.get(term, ()))
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def _top_postings(self, term: str, avgdl: float) -> List[Tuple[float, int]]:
+        built, heap = self._top[term]
+        if abs(built - avgdl) > 0.1 * built:
+            heap = self._build_top(term, avgdl)  # lengths drifted: stored impacts are stale
+        return heap
+
+    def search(self, query: str, k: int = 8) -> List[Tuple[float, Chunk]]:
+        """Top `k` chunks for `query`, best first, as (score, chunk)."""
+        tokens = tokenize(query)
+        weights: Dict[str, float] = {}
+        for t in tokens:
+            weights[t] = weights.get(t, 0.0) + 1.0
+        if self.bigrams and self.bigram_weight > 0:
+            for a, b in zip(tokens, tokens[1:]):
+                key = f"{a} {b}"
+                weights[key] = weights.get(key, 0.0) + self.bigram_weight
+        postings = self._postings
+        terms = sorted((t for t in weights if t in postings), key=lambda t: len(postings[t]))
+        if not terms:
+            return []
+        k1, docs = self.k1, self._docs
+        avgdl = self.avgdl or 1.0
+        norm = k1 * (1.0 - self.b)
+        scale = k1 * self.b / avgdl
+        weight = {t: weights[t] * self._idf(t) for t in terms}
+        # The rarest terms are scored exhaustively; every other term costs one
+        # lookup per candidate, so long queries get a smaller candidate budget
+        rare: List[str] = []
+        rest: List[str] = []
+        budget = self.common_df // len(terms)
+        for t in terms:
+            n = len(postings[t])
+            if t not in self._top and n <= budget:
+                rare.append(t)
+                budget -= n
+            else:
+                rest.append(t)
+        scores: Dict[int, float] = {}
+        for t in rare:
+            w, get = weight[t], scores.get
+            for d, tf in postings[t].items():
+                scores[d] = get(d, 0.0) + w * tf * (k1 + 1.0) / (tf + norm + scale * docs[d][1])
+        if rest:
+            candidates = list(scores)
+            for t in rest:
+                w, tfs = weight[t], postings[t]
+                for d in candidates:
+                    tf = tfs.get(d)
+                    if tf:
+                        scores[d] += w * tf * (k1 + 1.0) / (tf + norm + scale * docs[d][1])
+            # Any other chunk scores at most the sum of the remaining terms' bounds
+            bound = sum(weight[t] * (k1 + 1.0) for t in rest)
+            kth = heapq.nlargest(k, scores.values())[-1] if len(scores) >= k else 0.0
+            if bound > kth:
+                exact = set(candidates)
+                for t in rest:
+                    w, get = weight[t], scores.get
+                    top = self._top_postings(t, avgdl) if t in self._top else self._build_top(t, avgdl)
+                    for impact, d in top:
+                        if d not in exact and d in docs:
+                            scores[d] = get(d, 0.0) + w * impact
+                # Chunks found through the heaps hold partial scores: rescore the front-runners exactly
+                for d in heapq.nlargest(RESCORE * k, scores, key=scores.__getitem__):
+                    scores[d] = sum(
+                        weight[t] * tf * (k1 + 1.0) / (tf + norm + scale * docs[d][1])
+                        for t in terms if (tf := postings[t].get(d))
+                    )
+        best = heapq.nlargest(k, scores, key=scores.__getitem__)
+        return [(scores[d], docs[d][0]) for d in best]
+
+    def select(self, query: str, budget_chars: int, k: int = 32) -> List[Chunk]:
+        """Best-ranked chunks whose rendered context fits in `budget_chars`."""
+        out: List[Chunk] = []
+        used = 0
+        for _, chunk in self.search(query, k=k):
+            size = len(render_chunk(chunk)) + 1
+            if used + size > budget_chars:
+                continue  # a smaller, lower-ranked chunk may still fit
+            out.append(chunk)
+            used += size
+        return out
+
+
+def session_chunk(turn: int, prompt: str, answer: Optional[str]) -> Chunk:
+    """An earlier turn of the current REPL as a retrievable chunk (source `session/turn-<n>`)."""
+    text = f"Q: {prompt}\nA: {answer or ''}"
+    return Chunk(
+        id=f"session-turn-{turn}", path=f"session/turn-{turn}", ordinal=0,
+        start_line=1, end_line=text.count("\n") + 1, text=text,
+    )
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from platformdirs import user_config_dir
+
+from .attach import Chunk, RawChunk, chunk_text, format_context, render_chunk
+from .git.diff import DiffEntry, diff_sections, parse_hunks
+from .git.local import LocalGit
+from .policy import Policy
+from .retrieval import context_budget
+from .seminar.coordinator import ChunkHook, EventHook, TurnResult, run_round
+
+
+CACHE_FILE = "review-cache.db"
+HUNK_CHARS = 6000  # hunks of one file are grouped into chunks of at most this size
+REVIEW_PROMPT = (
+    "Review this code change ({range}). For each problem, name the file and line, say how serious it is and "
+    "suggest a concrete fix. Keep to the hunks shown; say so briefly if they look fine."
+)
+
+# (old blob, new blob, path): a file's diff depends on nothing else
+DiffKey = Tuple[str, str, str]
+_HUNK_NUMBERS = re.compile(r"^@@ -\d+(?:,\d+)? \+\d+(?:,\d+)? @@", re.MULTILINE)
+
+
+@dataclass
+class ReviewFile:
+    entry: DiffEntry
+    kind: str  # text|binary|meta (rename or mode change only)|denied
+    chunks: List[Chunk] = field(default_factory=list)
+
+    @property
+    def path(self) -> str:
+        return self.entry.path
+
+
+@dataclass
+class ReviewSet:
+    base: str
+    head: str
+    files: List[ReviewFile]
+    diffed: int = 0  # files run through `git diff`; the rest came from the cache
+    elapsed_s: float = 0.0
+
+    @property
+    def range(self) -> str:
+        return f"{self.base[:10]}..{self.head[:10]}"
+
+    @property
+    def chunks(self) -> List[Chunk]:
+        return [c for f in self.files for c in f.chunks]
+
+
+@dataclass
+class ReviewOutcome:
+    results: List[Tuple[List[Chunk], TurnResult]]  # one per batch sent
+    reused: Dict[str, List[Tuple[str, str]]]  # chunk id -> [(model, note)] from earlier reviews
+
+
+def review_chunk_id(path: str, text: str) -> str:
+    """Stable across line shifts: hunk headers' line numbers are left out of the id."""
+    body = _HUNK_NUMBERS.sub("@@", text)
+    return hashlib.sha256(f"{path}\0{body}".encode("utf-8")).hexdigest()[:16]
+
+
+def hunk_chunks(section: str, max_chars: int = HUNK_CHARS) -> List[RawChunk]:
+    """Group a file's hunks into chunks of at most `max_chars`; oversized hunks are split by lines.
+
+    Line ranges refer to the new version of the file.
+    """
+    out: List[RawChunk] = []
+    buf: List[str] = []
+    start = end = 0
+
+    def flush() -> None:
+        nonlocal buf
+        if buf:
+            out.append((len(out), start, end, "".join(buf)))
+        buf = []
+
+    for h in parse_hunks(section):
+        h_end = max(h.new_start, h.new_start + h.new_lines - 1)
+        if len(h.text) > max_chars:
+            flush()
+            for _, _, _, part in chunk_text(h.text, max_chars):
+                out.append((len(out), h.new_start, h_end, part))
+            continue
+        if buf and sum(map(len, buf)) + len(h.text) > max_chars:
+            flush()
+        if not buf:
+            start = h.new_start
+        buf.append(h.text)
+        end = h_end
+    flush()
+    return out
+
+
+def _chunks(path: str, raw: Sequence[RawChunk]) -> List[Chunk]:
+    return [Chunk(review_chunk_id(path, text), path, o, a, b, text) for o, a, b, text in raw]
+
+
+class ReviewCache:
+    """Persistent diff chunks keyed by (old blob, new blob, path), and review notes per chunk and model.
+
+    A follow-up commit changes the blob ids of the files it touches only,
+    so every other file's chunks are reused without running `git diff`;
+    chunk ids ignore hunk line numbers, so notes survive edits elsewhere
+    in the same file.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or (Path(user_config_dir("actcli", "actcli")) / CACHE_FILE)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS files (old TEXT, new TEXT, path TEXT, chunk_chars INTEGER, kind TEXT,"
+                " PRIMARY KEY (old, new, path, chunk_chars));"
+                "CREATE TABLE IF NOT EXISTS chunks (old TEXT, new TEXT, path TEXT, chunk_chars INTEGER, ordinal INTEGER,"
+                " start_line INTEGER, end_line INTEGER, text TEXT, PRIMARY KEY (old, new, path, chunk_chars, ordinal));"
+                "CREATE TABLE IF NOT EXISTS notes (chunk_id TEXT, model TEXT, text TEXT, PRIMARY KEY (chunk_id, model));"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: Iterable[DiffKey], chunk_chars: int) -> Dict[DiffKey, Tuple[str, List[RawChunk]]]:
+        """(kind, chunks) for each cached key; unknown keys are left out."""
+        out: Dict[DiffKey, Tuple[str, List[RawChunk]]] = {}
+        with self._lock:
+            conn = self._db()
+            for key in dict.fromkeys(keys):
+                row = conn.execute(
+                    "SELECT kind FROM files WHERE old = ? AND new = ? AND path = ? AND chunk_chars = ?", (*key, chunk_chars)
+                ).fetchone()
+                if row is None:
+                    continue
+                raw = conn.execute(
+                    "SELECT ordinal, start_line, end_line, text FROM chunks "
+                    "WHERE old = ? AND new = ? AND path = ? AND chunk_chars = ? ORDER BY ordinal",
+                    (*key, chunk_chars),
+                ).fetchall()
+                out[key] = (row[0], [tuple(r) for r in raw])  # type: ignore[misc]
+        return out
+
+    def put_many(self, items: Iterable[Tuple[DiffKey, int, str, Sequence[RawChunk]]]) -> None:
+        """Store (key, chunk_chars, kind, chunks) rows in one transaction."""
+        with self._lock:
+            conn = self._db()
+            with conn:
+                for key, chunk_chars, kind, raw in items:
+                    conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", (*key, chunk_chars, kind))
+                    conn.execute(
+                        "DELETE FROM chunks WHERE old = ? AND new = ? AND path = ? AND chunk_chars = ?", (*key, chunk_chars)
+                    )
+                    conn.executemany(
+                        "INSERT INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [(*key, chunk_chars, *c) for c in raw]
+                    )
+
+    def notes(self, chunk_ids: Iterable[str], models: Sequence[str]) -> Dict[str, List[Tuple[str, str]]]:
+        """Earlier notes by any of `models`, per chunk id."""
+        out: Dict[str, List[Tuple[str, str]]] = {}
+        wanted = list(dict.fromkeys(chunk_ids))
+        with self._lock:
+            conn = self._db()
+            for k in range(0, len(wanted), 500):
+                batch = wanted[k:k + 500]
+                marks = ",".join("?" * len(batch))
+                for chunk_id, model, text in conn.execute(
+                    f"SELECT chunk_id, model, text FROM notes WHERE chunk_id IN ({marks}) ORDER BY chunk_id, model", batch
+                ):
+                    if model in models:
+                        out.setdefault(chunk_id, []).append((model, text))
+        return out
+
+    def put_notes(self, items: Iterable[Tuple[str, str, str]]) -> None:
+        """Store (chunk id, model, note) rows."""
+        with self._lock:
+            conn = self._db()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO notes VALUES (?, ?, ?)", list(items))
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class Reviewer:
+    """Turns a commit range into per-file, per-hunk review chunks.
+
+    The file list and blob ids come from one `git diff --raw`; only files
+    whose (old, new, path) key is not cached are diffed, together, in one
+    more git call. Files outside the read policy are listed but not sent.
+    """
+
+    def __init__(
+        self,
+        git: Optional[LocalGit] = None,
+        policy: Optional[Policy] = None,
+        *,
+        cache: Optional[ReviewCache] = None,
+        chunk_chars: int = HUNK_CHARS,
+    ) -> None:
+        self.git = git or LocalGit()
+        self.policy = policy
+        self.cache = cache or ReviewCache()
+        self.chunk_chars = chunk_chars
+
+    def _readable(self, root: Path, path: str) -> bool:
+        return self.policy is None or self.policy.can_read(root / path)
+
+    def collect(self, spec: Optional[str] = None) -> Optional[ReviewSet]:
+        """Chunks for `spec` (see `LocalGit.resolve_range`); None if the range does not resolve."""
+        started = time.perf_counter()
+        resolved = self.git.resolve_range(spec)
+        if resolved is None:
+            return None
+        base, head = resolved
+        root = Path(self.git.detect().root or self.git.cwd)
+        files = [ReviewFile(e, "denied") for e in self.git.diff(base, head)]
+        wanted = [f for f in files if self._readable(root, f.path)]
+        cached = self.cache.get_many(((*f.entry.blobs, f.path) for f in wanted), self.chunk_chars)
+        misses = [f for f in wanted if (*f.entry.blobs, f.path) not in cached]
+        sections = diff_sections(self.git.cwd, base, head, [f.entry for f in misses]) if misses else {}
+        fresh: List[Tuple[DiffKey, int, str, Sequence[RawChunk]]] = []
+        for f in misses:
+            section = sections.get(f.entry.blobs)
+            raw = hunk_chunks(section, self.chunk_chars) if section else []
+            kind = "text" if raw else "binary" if section else "meta"
+            fresh.append(((*f.entry.blobs, f.path), self.chunk_chars, kind, raw))
+            cached[(*f.entry.blobs, f.path)] = (kind, raw)
+        if fresh:
+            self.cache.put_many(fresh)
+        for f in wanted:
+            f.kind, raw = cached[(*f.entry.blobs, f.path)]
+            f.chunks = _chunks(f.path, raw)
+        return ReviewSet(base, head, files, diffed=len(misses), elapsed_s=time.perf_counter() - started)
+
+
+def review_prompt(review: ReviewSet, batch: Sequence[Chunk]) -> str:
+    return f"{REVIEW_PROMPT.format(range=review.range)}\n\n{format_context(batch)}"
+
+
+def plan_batches(chunks: Sequence[Chunk], adapters: Sequence[object]) -> List[Tuple[object, List[Chunk]]]:
+    """Assign chunks to participants as (adapter, batch) pairs within each one's context budget.
+
+    A diff that fits every budget goes to everyone, as a normal roundtable
+    turn. Larger diffs are dealt out in file order: participants take turns
+    filling a batch up to their own budget, so cloud models take bigger
+    batches and each chunk is reviewed once.
+    """
+    if not chunks or not adapters:
+        return []
+    sizes = [len(render_chunk(c)) + 1 for c in chunks]
+    budgets = [context_budget(a) for a in adapters]
+    if sum(sizes) <= min(budgets):
+        return [(a, list(chunks)) for a in adapters]
+    out: List[Tuple[object, List[Chunk]]] = []
+    i = 0
+    while i < len(chunks):
+        for adapter, budget in zip(adapters, budgets):
+            batch: List[Chunk] = []
+            used = 0
+            while i < len(chunks) and (not batch or used + sizes[i] <= budget):
+                batch.append(chunks[i])
+                used += sizes[i]
+                i += 1
+            if batch:
+                out.append((adapter, batch))
+    return out
+
+
+async def review_batches(
+    review: ReviewSet,
+    batches: Sequence[Tuple[object, List[Chunk]]],
+    *,
+    timeout_s: int = 60,
+    on_event: Optional[EventHook] = None,
+    on_chunk: Optional[ChunkHook] = None,
+) -> List[Tuple[List[Chunk], TurnResult]]:
+    """Send all batches concurrently, one request in flight per participant."""
+    gates: Dict[int, asyncio.Semaphore] = {id(a): asyncio.Semaphore(1) for a, _ in batches}
+
+    async def one(adapter: object, batch: List[Chunk]) -> Tuple[List[Chunk], TurnResult]:
+        async with gates[id(adapter)]:
+            results = await run_round(
+                [adapter], review_prompt(review, batch), seed=42, timeout_s=timeout_s, on_event=on_event, on_chunk=on_chunk  # type: ignore[list-item]
+            )
+        return batch, results[0]
+
+    return list(await asyncio.gather(*(one(a, b) for a, b in batches)))
+
+
+def run_review(
+    review: ReviewSet,
+    adapters: Sequence[object],
+    cache: ReviewCache,
+    *,
+    fresh: bool = False,
+    timeout_s: int = 60,
+    on_event: Optional[EventHook] = None,
+    on_chunk: Optional[ChunkHook] = None,
+    on_plan: Optional[Callable[[List[Tuple[object, List[Chunk]]]], None]] = None,
+) -> ReviewOutcome:
+    """Review the chunks no participant has reviewed before (all with `fresh`) and remember the notes."""
+    chunks = review.chunks
+    names = [getattr(a, "name", "unknown") for a in adapters]
+    reused = {} if fresh else cache.notes((c.id for c in chunks), names)
+    batches = plan_batches([c for c in chunks if c.id not in reused], adapters)
+    if on_plan:
+        on_plan(batches)
+    results = asyncio.run(review_batches(review, batches, timeout_s=timeout_s, on_event=on_event, on_chunk=on_chunk)) if batches else []
+    cache.put_notes(
+        (c.id, res.info.name, res.text) for batch, res in results if res.text and not res.error for c in batch
+    )
+    return ReviewOutcome(results, reused)
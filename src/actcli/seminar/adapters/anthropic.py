@@ -6,9 +6,12 @@ from typing import Optional
 import httpx
 
 from .base import ModelAdapter
+from .registry import builtin_capabilities
 
 
 class AnthropicAdapter:
+    capabilities = builtin_capabilities("claude")
+
     def __init__(self, model: str = "claude-3-haiku-20240307") -> None:
         self.model = model
         self.name = f"{model}(cloud)"
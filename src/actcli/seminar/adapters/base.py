@@ -1,7 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol, Optional
+from typing import Any, Callable, Protocol, Optional
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """What an adapter supports, declared up front so callers can pick code paths.
+
+    `async_native` adapters provide `agenerate` (same arguments as
+    `generate`) and are awaited directly instead of running on a thread.
+    """
+
+    streaming: bool = False
+    async_native: bool = False
+    embeddings: bool = False
+    prompt_caching: bool = False
+    seed: bool = False
+
+    def labels(self) -> list[str]:
+        return [name for name, on in vars(self).items() if on]
 
 
 class ModelAdapter(Protocol):
@@ -21,6 +39,28 @@ class ModelAdapter(Protocol):
     ) -> str: ...
 
 
+class StreamingModelAdapter(ModelAdapter, Protocol):
+    """Adapter that can also report text incrementally.
+
+    Adapters set `streaming = True` and accept an `on_chunk` keyword in
+    `generate`; the full text is still returned at the end.
+    """
+
+    streaming: bool
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        seed: Optional[int] = None,
+        timeout_s: int = 30,
+        round_index: int = 1,
+        context_snippets: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> str: ...
+
+
 @dataclass
 class AdapterInfo:
     id: str
@@ -28,3 +68,11 @@ class AdapterInfo:
     is_local: bool
     model_version: str
 
+
+
+def capabilities_of(adapter: Any) -> Capabilities:
+    """Declared capabilities, or what can be inferred from an older adapter."""
+    caps = getattr(adapter, "capabilities", None)
+    if isinstance(caps, Capabilities):
+        return caps
+    return Capabilities(streaming=bool(getattr(adapter, "streaming", False)), async_native=hasattr(adapter, "agenerate"))
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import random
 import textwrap
-from typing import Optional
+from typing import Callable, Optional
 
 from .base import ModelAdapter
+from .registry import builtin_capabilities
 
 
 class EchoAdapter:
@@ -13,6 +14,8 @@ class EchoAdapter:
     It simulates latency and returns a short, deterministic response.
     """
 
+    capabilities = builtin_capabilities("echo")
+
     def __init__(self, name: str = "echo", version: str = "0.1") -> None:
         self.name = name
         self.is_local = True
@@ -27,6 +30,7 @@ class EchoAdapter:
         timeout_s: int = 30,
         round_index: int = 1,
         context_snippets: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
     ) -> str:
         if seed is not None:
             random.seed(seed + round_index)
@@ -41,5 +45,9 @@ class EchoAdapter:
                 quoted = textwrap.shorten(context_snippets.replace("\n", " "), width=160, placeholder="…")
                 parts.append(f"Considering: \"{quoted}\"")
             parts.append("One next check: validate assumptions with a small sample.")
-        return "\n".join(parts)
+        text = "\n".join(parts)
+        if on_chunk is not None:
+            for i, part in enumerate(parts):
+                on_chunk(part if i == 0 else "\n" + part)
+        return text
 
@@ -6,9 +6,12 @@ from typing import Optional
 import httpx
 
 from .base import ModelAdapter
+from .registry import builtin_capabilities
 
 
 class GeminiAdapter:
+    capabilities = builtin_capabilities("gemini")
+
     def __init__(self, model: str = "gemini-1.5-flash-latest") -> None:
         self.model = model
         self.name = f"{model}(cloud)"
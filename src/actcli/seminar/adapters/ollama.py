@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 import httpx
 
 from .base import ModelAdapter
+from .registry import builtin_capabilities
 
 
 class OllamaAdapter:
@@ -15,6 +17,8 @@ class OllamaAdapter:
     defaults to http://127.0.0.1:11434.
     """
 
+    capabilities = builtin_capabilities("ollama")
+
     def __init__(self, model: str = "llama3", host: Optional[str] = None) -> None:
         self.model = model
         self.name = f"{model}(local)"
@@ -31,6 +35,7 @@ class OllamaAdapter:
         timeout_s: int = 30,
         round_index: int = 1,
         context_snippets: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
     ) -> str:
         # Compose a minimal round-aware prompt
         if round_index == 1:
@@ -46,7 +51,7 @@ class OllamaAdapter:
         payload = {
             "model": self.model,
             "prompt": effective_prompt,
-            "stream": False,
+            "stream": on_chunk is not None,
         }
         options = {}
         if seed is not None:
@@ -56,9 +61,31 @@ class OllamaAdapter:
         if system:
             payload["system"] = system
 
+        if on_chunk is not None:
+            return self._generate_stream(payload, timeout_s, on_chunk)
+
         with httpx.Client(timeout=timeout_s) as client:
             resp = client.post(f"{self._host}/api/generate", json=payload)
             resp.raise_for_status()
             data = resp.json()
             text = data.get("response") or data.get("message") or ""
             return text.strip()
+
+    def _generate_stream(self, payload: dict, timeout_s: int, on_chunk: Callable[[str], None]) -> str:
+        parts = []
+        with httpx.Client(timeout=timeout_s) as client:
+            with client.stream("POST", f"{self._host}/api/generate", json=payload) as resp:
+                resp.raise_for_status()
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get("error"):
+                        raise RuntimeError(str(data["error"]))
+                    piece = data.get("response") or ""
+                    if piece:
+                        parts.append(piece)
+                        on_chunk(piece)
+                    if data.get("done"):
+                        break
+        return "".join(parts).strip()
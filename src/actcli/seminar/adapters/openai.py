@@ -6,9 +6,12 @@ from typing import Optional
 import httpx
 
 from .base import ModelAdapter
+from .registry import builtin_capabilities
 
 
 class OpenAIAdapter:
+    capabilities = builtin_capabilities("gpt")
+
     def __init__(self, model: str = "gpt-4o-mini") -> None:
         self.model = model
         self.name = f"{model}(cloud)"
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import Capabilities
+
+
+ENTRY_POINT_GROUP = "actcli.adapters"
+
+# factory(model, **options) -> adapter; `model` is the model id without its
+# `<adapter>/` prefix ("" for the adapter's default). Options currently: ollama_host
+AdapterFactory = Callable[..., Any]
+
+
+@dataclass
+class AdapterSpec:
+    """How to recognise and build one kind of adapter, without importing it.
+
+    `target` is a "module:callable" path imported on first `create`, so a
+    spec costs nothing until the adapter is actually used. Model ids match
+    the spec's `id`, any of its `aliases`, any id starting with one of
+    `prefixes`, or `<id|alias>/<model>` for gateway-style adapters.
+    """
+
+    id: str
+    target: str
+    is_local: bool = False
+    capabilities: Capabilities = field(default_factory=Capabilities)
+    aliases: Tuple[str, ...] = ()
+    prefixes: Tuple[str, ...] = ()
+    summary: str = ""
+    _factory: Optional[AdapterFactory] = field(default=None, repr=False, compare=False)
+
+    def names(self) -> Tuple[str, ...]:
+        return (self.id, *self.aliases)
+
+    def matches(self, model_id: str) -> bool:
+        if model_id in self.names() or any(model_id.startswith(n + "/") for n in self.names()):
+            return True
+        return any(model_id.startswith(p) for p in self.prefixes)
+
+    def model_name(self, model_id: str) -> str:
+        """The model to ask the adapter for: `gpt/gpt-4o` -> `gpt-4o`, bare `gpt` -> "" (its default)."""
+        if model_id in self.names():
+            return ""
+        for n in self.names():
+            if model_id.startswith(n + "/"):
+                return model_id[len(n) + 1:]
+        return model_id
+
+    def load(self) -> AdapterFactory:
+        if self._factory is None:
+            module, _, attr = self.target.partition(":")
+            self._factory = getattr(importlib.import_module(module), attr)
+        return self._factory
+
+    def create(self, model_id: str, **options: Any) -> Any:
+        return self.load()(self.model_name(model_id), **options)
+
+
+# Built-in factories; each imports its adapter module (and httpx) only when called
+def _ollama(model: str, *, ollama_host: Optional[str] = None, **_: Any) -> Any:
+    from .ollama import OllamaAdapter
+
+    return OllamaAdapter(model=model, host=ollama_host) if model else OllamaAdapter(host=ollama_host)
+
+
+def _openai(model: str, **_: Any) -> Any:
+    from .openai import OpenAIAdapter
+
+    return OpenAIAdapter(model) if model else OpenAIAdapter()
+
+
+def _anthropic(model: str, **_: Any) -> Any:
+    from .anthropic import AnthropicAdapter
+
+    return AnthropicAdapter(model) if model else AnthropicAdapter()
+
+
+def _gemini(model: str, **_: Any) -> Any:
+    from .gemini import GeminiAdapter
+
+    return GeminiAdapter(model) if model else GeminiAdapter()
+
+
+def _echo(model: str, **_: Any) -> Any:
+    from .echo import EchoAdapter
+
+    return EchoAdapter(name=model or "echo")
+
+
+_HERE = __name__
+BUILTIN_SPECS: Tuple[AdapterSpec, ...] = (
+    AdapterSpec(
+        id="ollama", target=f"{_HERE}:_ollama", is_local=True,
+        capabilities=Capabilities(streaming=True, embeddings=True, seed=True),
+        prefixes=("llama", "mistral", "qwen"), summary="Local models via the Ollama HTTP API",
+    ),
+    AdapterSpec(id="gpt", target=f"{_HERE}:_openai", capabilities=Capabilities(seed=True), aliases=("openai",), summary="OpenAI chat completions"),
+    AdapterSpec(id="claude", target=f"{_HERE}:_anthropic", aliases=("anthropic",), summary="Anthropic messages API"),
+    AdapterSpec(id="gemini", target=f"{_HERE}:_gemini", aliases=("google",), summary="Google Gemini"),
+    AdapterSpec(id="echo", target=f"{_HERE}:_echo", is_local=True, capabilities=Capabilities(streaming=True, seed=True), summary="Offline simulated responses"),
+)
+
+
+def builtin_capabilities(adapter_id: str) -> Capabilities:
+    """Capabilities of a built-in adapter, declared once in `BUILTIN_SPECS`."""
+    return next(s.capabilities for s in BUILTIN_SPECS if s.id == adapter_id)
+
+
+class AdapterRegistry:
+    """Built-in adapter specs plus plugins from the `actcli.adapters` entry point group.
+
+    A plugin's entry point names an `AdapterSpec` (preferred: keep it in a
+    light module and point `target` at the heavy one) or a bare factory.
+    Entry point metadata is read only when an id misses the built-ins or
+    all specs are listed, and a plugin module is imported only when one of
+    its ids is requested.
+    """
+
+    def __init__(self, specs: Tuple[AdapterSpec, ...] = BUILTIN_SPECS, *, entry_points: bool = True) -> None:
+        self._specs: List[AdapterSpec] = list(specs)
+        self._pending: Optional[Dict[str, Any]] = None if entry_points else {}
+
+    def register(self, spec: AdapterSpec) -> None:
+        # Later registrations win, so a plugin can override a built-in id
+        self._specs.insert(0, spec)
+
+    def _entry_points(self) -> Dict[str, Any]:
+        if self._pending is None:
+            from importlib.metadata import entry_points
+
+            self._pending = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+        return self._pending
+
+    def _load_entry_point(self, name: str) -> Optional[AdapterSpec]:
+        ep = self._entry_points().pop(name, None)
+        if ep is None:
+            return None
+        obj = ep.load()
+        if isinstance(obj, AdapterSpec):
+            spec = obj
+        else:
+            caps = getattr(obj, "capabilities", None)
+            spec = AdapterSpec(
+                id=name, target=ep.value, is_local=bool(getattr(obj, "is_local", False)),
+                capabilities=caps if isinstance(caps, Capabilities) else Capabilities(), _factory=obj,
+            )
+        self.register(spec)
+        return spec
+
+    def resolve(self, model_id: str) -> Optional[AdapterSpec]:
+        # Exact ids and aliases first, so "echo" is never shadowed by a prefix
+        for spec in self._specs:
+            if model_id == spec.id or model_id in spec.aliases:
+                return spec
+        for spec in self._specs:
+            if spec.matches(model_id):
+                return spec
+        base = model_id.split("/", 1)[0]
+        if base in self._entry_points():
+            return self._load_entry_point(base)
+        # Tagged ids such as "phi3:mini" are Ollama models
+        if ":" in model_id:
+            return self.resolve("ollama")
+        return None
+
+    def specs(self) -> List[AdapterSpec]:
+        """All specs, importing any plugins not yet loaded."""
+        for name in list(self._entry_points()):
+            try:
+                self._load_entry_point(name)
+            except Exception:
+                continue  # a broken plugin must not hide the others
+        return list(self._specs)
+
+
+_REGISTRY: Optional[AdapterRegistry] = None
+
+
+def default_registry() -> AdapterRegistry:
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = AdapterRegistry()
+    return _REGISTRY
@@ -3,9 +3,15 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from .adapters.base import ModelAdapter, AdapterInfo
+from .adapters.base import ModelAdapter, AdapterInfo, capabilities_of
+
+
+# Receives (event_type, data) for adapter_start / adapter_first_token / adapter_finish events
+EventHook = Callable[[str, Dict[str, Any]], None]
+# Receives (adapter_name, round_index, text) for each streamed chunk
+ChunkHook = Callable[[str, int, str], None]
 
 
 @dataclass
@@ -24,22 +30,50 @@ async def _call_adapter(
     timeout_s: int,
     round_index: int,
     context_snippets: Optional[str],
+    on_event: Optional[EventHook] = None,
+    on_chunk: Optional[ChunkHook] = None,
 ) -> TurnResult:
     start = time.perf_counter()
+    name = getattr(adapter, "name", "unknown")
+    if on_event:
+        on_event("adapter_start", {"round": round_index, "adapter": name})
+    caps = capabilities_of(adapter)
+    kwargs: Dict[str, Any] = {}
+    if on_chunk and caps.streaming:
+        first = []
+
+        def _chunk(text: str) -> None:
+            if not first:
+                first.append(True)
+                if on_event:
+                    on_event("adapter_first_token", {"round": round_index, "adapter": name, "latency_ms": int((time.perf_counter() - start) * 1000)})
+            on_chunk(name, round_index, text)
+
+        kwargs["on_chunk"] = _chunk
     try:
-        loop = asyncio.get_running_loop()
-        text = await loop.run_in_executor(
-            None,
-            lambda: adapter.generate(
-                prompt, seed=seed, timeout_s=timeout_s, round_index=round_index, context_snippets=context_snippets
-            ),
-        )
+        if caps.async_native:
+            # Native coroutine: no worker thread, cancels cleanly on timeout
+            text = await adapter.agenerate(  # type: ignore[attr-defined]
+                prompt, seed=seed, timeout_s=timeout_s, round_index=round_index, context_snippets=context_snippets, **kwargs
+            )
+        else:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                None,
+                lambda: adapter.generate(
+                    prompt, seed=seed, timeout_s=timeout_s, round_index=round_index, context_snippets=context_snippets, **kwargs
+                ),
+            )
         latency = int((time.perf_counter() - start) * 1000)
         info = AdapterInfo(id=getattr(adapter, "name", "unknown"), name=getattr(adapter, "name", "unknown"), is_local=getattr(adapter, "is_local", False), model_version=getattr(adapter, "model_version", ""))
+        if on_event:
+            on_event("adapter_finish", {"round": round_index, "adapter": name, "latency_ms": latency, "ok": bool(text), "error": None})
         return TurnResult(info=info, text=text, latency_ms=latency)
     except Exception as e:
         latency = int((time.perf_counter() - start) * 1000)
         info = AdapterInfo(id=getattr(adapter, "name", "unknown"), name=getattr(adapter, "name", "unknown"), is_local=getattr(adapter, "is_local", False), model_version=getattr(adapter, "model_version", ""))
+        if on_event:
+            on_event("adapter_finish", {"round": round_index, "adapter": name, "latency_ms": latency, "ok": False, "error": str(e)})
         return TurnResult(info=info, text="", latency_ms=latency, error=str(e))
 
 
@@ -51,11 +85,15 @@ async def run_round(
     timeout_s: int = 25,
     round_index: int = 1,
     context_snippets: Optional[str] = None,
+    on_event: Optional[EventHook] = None,
+    on_chunk: Optional[ChunkHook] = None,
+    prompt_for: Optional[Callable[[ModelAdapter], str]] = None,
 ) -> List[TurnResult]:
+    """Ask every adapter concurrently; `prompt_for` tailors the prompt per adapter (e.g. context budget)."""
     tasks = [
         asyncio.create_task(
             asyncio.wait_for(
-                _call_adapter(a, prompt, seed=seed, timeout_s=timeout_s, round_index=round_index, context_snippets=context_snippets),
+                _call_adapter(a, prompt_for(a) if prompt_for else prompt, seed=seed, timeout_s=timeout_s, round_index=round_index, context_snippets=context_snippets, on_event=on_event, on_chunk=on_chunk),
                 timeout=timeout_s,
             )
         )
@@ -71,5 +109,7 @@ async def run_round(
             adapter = adapters[tasks.index(t)]
             info = AdapterInfo(id=getattr(adapter, "name", "unknown"), name=getattr(adapter, "name", "unknown"), is_local=getattr(adapter, "is_local", False), model_version=getattr(adapter, "model_version", ""))
             results.append(TurnResult(info=info, text="", latency_ms=timeout_s * 1000, error="timeout"))
+            if on_event:
+                on_event("adapter_finish", {"round": round_index, "adapter": info.name, "latency_ms": timeout_s * 1000, "ok": False, "error": "timeout"})
     return results
 
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from platformdirs import user_config_dir
+
+
+CACHE_DIR = Path(user_config_dir("actcli", "actcli")) / "embeddings"
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(vec: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vec))
+    if not norm:
+        return [0.0 for _ in vec]
+    return [x / norm for x in vec]
+
+
+class OllamaEmbedder:
+    """Batched embeddings from a local Ollama host, cached by text hash.
+
+    All texts missing from the cache are sent in a single `/api/embed` call.
+    Vectors are stored normalized, in memory and in an append-only JSONL file
+    per model, so repeated runs (and cached responses) never hit the network.
+    Any failure marks the embedder unavailable for the rest of the process so
+    callers fall back to the lexical scorer without paying repeated timeouts.
+    """
+
+    def __init__(self, model: str, host: Optional[str] = None, timeout_s: float = 10.0, cache_dir: Optional[Path] = None) -> None:
+        self.model = model
+        self._host = (host or os.environ.get("OLLAMA_HOST", "http://127.0.0.1:11434")).rstrip("/")
+        self._timeout_s = timeout_s
+        self._cache_path = (cache_dir or CACHE_DIR) / f"{_text_key(model)[:16]}.jsonl"
+        self._cache: Optional[Dict[str, List[float]]] = None
+        self.available = True
+        self.calls = 0
+
+    def _load_cache(self) -> Dict[str, List[float]]:
+        if self._cache is None:
+            self._cache = {}
+            if self._cache_path.exists():
+                for line in self._cache_path.read_text(encoding="utf-8").splitlines():
+                    try:
+                        rec = json.loads(line)
+                        self._cache[rec["h"]] = rec["v"]
+                    except Exception:
+                        continue
+        return self._cache
+
+    def _persist(self, items: Dict[str, List[float]]) -> None:
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path, "a", encoding="utf-8") as f:
+                for h, v in items.items():
+                    f.write(json.dumps({"h": h, "v": v}) + "\n")
+        except OSError:
+            pass
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        import httpx
+
+        with httpx.Client(timeout=self._timeout_s) as client:
+            r = client.post(f"{self._host}/api/embed", json={"model": self.model, "input": texts})
+            r.raise_for_status()
+            data = r.json()
+        vectors = data.get("embeddings") or []
+        if len(vectors) != len(texts):
+            raise RuntimeError(f"expected {len(texts)} embeddings, got {len(vectors)}")
+        return vectors
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return normalized vectors for `texts`, fetching all misses in one call."""
+        if not self.available:
+            raise RuntimeError(f"embedding model {self.model} unavailable")
+        cache = self._load_cache()
+        keys = [_text_key(t) for t in texts]
+        missing: Dict[str, str] = {}
+        for k, t in zip(keys, texts):
+            if k not in cache and k not in missing:
+                missing[k] = t
+        if missing:
+            try:
+                vectors = self._request(list(missing.values()))
+            except Exception:
+                self.available = False
+                raise
+            fresh = {k: _normalize(v) for k, v in zip(missing.keys(), vectors)}
+            cache.update(fresh)
+            self._persist(fresh)
+        return [cache[k] for k in keys]
+
+
+def mean_pairwise_similarity(vectors: List[List[float]]) -> float:
+    """Mean cosine similarity over all pairs of normalized vectors."""
+    n = len(vectors)
+    if n < 2:
+        return 1.0
+    # Sum of pairwise dots = (|sum v|^2 - sum |v|^2) / 2, one pass over the vectors
+    dim = len(vectors[0])
+    total = [0.0] * dim
+    self_dots = 0.0
+    for v in vectors:
+        self_dots += sum(x * x for x in v)
+        for i, x in enumerate(v):
+            total[i] += x
+    pair_sum = (sum(x * x for x in total) - self_dots) / 2
+    return pair_sum / (n * (n - 1) / 2)
+
+
+def resolve_embedder(host: Optional[str] = None, model: Optional[str] = None) -> Optional[OllamaEmbedder]:
+    """Build an embedder from `ACTCLI_EMBED_MODEL` or config; None disables semantic scoring."""
+    if model is None:
+        model = os.environ.get("ACTCLI_EMBED_MODEL")
+    if model is None:
+        try:
+            from ..config import get_config
+
+            cfg, _ = get_config()
+            model = cfg.defaults.embed_model
+        except Exception:
+            model = None
+    if not model:
+        return None
+    return OllamaEmbedder(model=model, host=host)
@@ -1,25 +1,43 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .coordinator import TurnResult
+from .embeddings import OllamaEmbedder, mean_pairwise_similarity
 
 
 def _tokenize(s: str) -> set[str]:
     return set(re.findall(r"[a-zA-Z0-9_]+", s.lower()))
 
 
-def summarize(results: List[TurnResult]) -> Tuple[str, float]:
-    """Return a brief synthesis and a naive disagreement score."""
+def semantic_disagreement(texts: List[str], embedder: OllamaEmbedder) -> float:
+    """1 - mean pairwise cosine similarity of the texts' embeddings."""
+    similarity = mean_pairwise_similarity(embedder.embed(texts))
+    return min(1.0, max(0.0, 1.0 - similarity))
+
+
+def summarize(results: List[TurnResult], embedder: Optional[OllamaEmbedder] = None) -> Tuple[str, float]:
+    """Return a brief synthesis and a disagreement score.
+
+    The score is semantic when an embedder is given and reachable, otherwise
+    the naive lexical (Jaccard) score.
+    """
     texts = [r.text for r in results if r.text]
     if not texts:
         return ("No responses.", 0.0)
     vocab = [_tokenize(t) for t in texts]
     inter = set.intersection(*vocab) if len(vocab) > 1 else vocab[0]
     union = set.union(*vocab) if len(vocab) > 1 else vocab[0]
-    jaccard = len(inter) / max(1, len(union))
-    disagreement = 1.0 - jaccard
+    disagreement = None
+    if embedder is not None and embedder.available:
+        try:
+            disagreement = semantic_disagreement(texts, embedder)
+        except Exception:
+            disagreement = None
+    if disagreement is None:
+        jaccard = len(inter) / max(1, len(union))
+        disagreement = 1.0 - jaccard
     points = list(inter)[:5]
     synthesis = "Agreements: " + (", ".join(points) if points else "(few)")
     return (synthesis, round(disagreement, 2))
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .blobstore import BlobStore, make_ref
+from .seminar.adapters.base import AdapterInfo
+from .seminar.coordinator import TurnResult
+from .version import __version__
+
+
+SESSION_DIR = Path("out") / "sessions"
+
+_STOP = object()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def result_to_dict(r: TurnResult) -> Dict[str, Any]:
+    return {
+        "id": r.info.id,
+        "name": r.info.name,
+        "local": r.info.is_local,
+        "version": r.info.model_version,
+        "latency_ms": r.latency_ms,
+        "text": r.text,
+        "error": r.error,
+    }
+
+
+def result_from_dict(d: Dict[str, Any], blobs: Optional[BlobStore] = None) -> TurnResult:
+    info = AdapterInfo(id=d.get("id", ""), name=d.get("name", ""), is_local=bool(d.get("local")), model_version=d.get("version", ""))
+    text = d.get("text")
+    if text is None and d.get("text_ref") and blobs is not None:
+        text = blobs.get(d["text_ref"])
+    return TurnResult(info=info, text=text or "", latency_ms=int(d.get("latency_ms", 0)), error=d.get("error"))
+
+
+class SessionLog:
+    """Append-only JSONL event log for a chat session.
+
+    `emit` only enqueues; a background thread appends events in batches and
+    fsyncs once per batch, so a crash loses at most the batch in flight.
+    The current turn's events are also kept in memory so transcript/audit/
+    presenter views can be derived without re-reading the file; earlier
+    turns live only on disk. With `path=None` nothing is written.
+    With a blob store, the writer thread archives response texts there and
+    the file carries `text_ref` hashes instead of the text.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        blobs: Optional[BlobStore] = None,
+        batch_size: int = 64,
+        flush_interval_s: float = 0.05,
+    ) -> None:
+        self.path = path
+        self.blobs = blobs
+        self.events: List[Dict[str, Any]] = []
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._seq = 0
+        self._turn = 0
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="actcli-session-log", daemon=True)
+            self._thread.start()
+        self.emit("session_start", actcli_version=__version__)
+
+    # Producer side -------------------------------------------------------
+    def emit(self, type: str, **data: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._seq += 1
+            event = {"seq": self._seq, "t": _now(), "type": type, "data": data}
+            if type == "prompt":
+                self.events = []  # a new turn: views only ever need the latest one
+            self.events.append(event)
+        if self._thread is not None:
+            self._queue.put(event)
+        return event
+
+    def begin_turn(self, prompt: str) -> int:
+        with self._lock:
+            self._turn += 1
+            turn = self._turn
+        self.emit("prompt", turn=turn, text=prompt)
+        return turn
+
+    def adapter_hook(self, turn: int) -> Callable[[str, Dict[str, Any]], None]:
+        """Callback for `run_round(on_event=...)` tagging adapter events with the turn."""
+        def _hook(type: str, data: Dict[str, Any]) -> None:
+            self.emit(type, turn=turn, **data)
+        return _hook
+
+    def record_results(self, turn: int, round_index: int, results: List[TurnResult]) -> None:
+        self.emit("results", turn=turn, round=round_index, results=[result_to_dict(r) for r in results])
+
+    def record_synthesis(self, turn: int, text: Optional[str], disagreement: Optional[float]) -> None:
+        self.emit("synthesis", turn=turn, text=text, disagreement=disagreement)
+
+    def call_soon(self, fn: Callable[[], Any]) -> "Future[Any]":
+        """Run `fn` on the writer thread after all events emitted so far are written.
+
+        The returned future carries `fn`'s result or exception.
+        """
+        future: "Future[Any]" = Future()
+
+        def _call() -> None:
+            try:
+                future.set_result(fn())
+            except Exception as e:
+                future.set_exception(e)
+
+        if self._thread is None:
+            _call()
+        else:
+            self._queue.put(_call)
+        return future
+
+    def flush(self) -> None:
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self.emit("session_end")  # tells the session store this log is complete
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self) -> "SessionLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Writer thread -------------------------------------------------------
+    def _drain(self, first: Any) -> List[Any]:
+        batch = [first]
+        deadline = time.monotonic() + self._flush_interval_s
+        while len(batch) < self._batch_size and batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _archive(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """On-disk form of `event`: response texts go to the blob store as `text_ref`."""
+        if self.blobs is None or event["type"] != "results":
+            return event
+        items = []
+        for d in event["data"]["results"]:
+            if d.get("text"):
+                try:
+                    d = {**{k: v for k, v in d.items() if k != "text"}, "text_ref": make_ref(self.blobs.put(d["text"]))}
+                except OSError:
+                    pass  # keep the text inline rather than lose it
+            items.append(d)
+        return {**event, "data": {**event["data"], "results": items}}
+
+    def _run(self) -> None:
+        assert self.path is not None
+        with open(self.path, "a", encoding="utf-8") as f:
+            stop = False
+            while not stop:
+                batch = self._drain(self._queue.get())
+                lines = [json.dumps(self._archive(item), ensure_ascii=False) + "\n" for item in batch if isinstance(item, dict)]
+                try:
+                    if lines:
+                        f.writelines(lines)
+                        f.flush()
+                        os.fsync(f.fileno())
+                except OSError:
+                    pass
+                for item in batch:
+                    if item is _STOP:
+                        stop = True
+                    elif callable(item):
+                        try:
+                            item()
+                        except Exception:
+                            pass
+                    self._queue.task_done()
+
+
+def session_dir() -> Path:
+    """Directory holding session logs; `ACTCLI_SESSION_DIR` overrides the default."""
+    target = os.environ.get("ACTCLI_SESSION_DIR")
+    return Path(target) if target and target != "off" else SESSION_DIR
+
+
+def open_blob_store(root: Optional[Path] = None) -> BlobStore:
+    """Response archive next to the session logs; `ACTCLI_BLOB_CODEC` picks zlib|lzma|raw."""
+    return BlobStore(root or (session_dir() / "blobs"), codec=os.environ.get("ACTCLI_BLOB_CODEC", "zlib"))
+
+
+def new_session_path(root: Optional[Path] = None) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return (root or session_dir()) / f"session-{stamp}-{os.getpid()}.jsonl"
+
+
+def read_events(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield events from a session log, skipping a torn trailing line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+@dataclass
+class TurnRecord:
+    turn: int
+    prompt: str
+    timestamp: str
+    results: List[TurnResult] = field(default_factory=list)
+    round_index: int = 0
+    synthesis: Optional[str] = None
+    disagreement: Optional[float] = None
+    attachments: List[str] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def build_turns(events: List[Dict[str, Any]] | Iterator[Dict[str, Any]], blobs: Optional[BlobStore] = None) -> List[TurnRecord]:
+    """Fold events into one record per prompt; `results` holds the last round."""
+    turns: Dict[int, TurnRecord] = {}
+    for ev in events:
+        data = ev.get("data", {})
+        turn = data.get("turn")
+        if turn is None:
+            continue
+        if ev.get("type") == "prompt":
+            turns[turn] = TurnRecord(turn=turn, prompt=data.get("text", ""), timestamp=ev.get("t", ""))
+        rec = turns.get(turn)
+        if rec is None:
+            continue
+        rec.events.append(ev)
+        if ev.get("type") == "results" and data.get("round", 0) >= rec.round_index:
+            rec.round_index = data.get("round", 0)
+            rec.results = [result_from_dict(d, blobs) for d in data.get("results", [])]
+        elif ev.get("type") == "attach":
+            rec.attachments.append(data.get("path", ""))
+        elif ev.get("type") == "synthesis":
+            rec.synthesis = data.get("text")
+            rec.disagreement = data.get("disagreement")
+    return [turns[k] for k in sorted(turns)]
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .blobstore import BlobStore
+from .session_log import session_dir as default_session_dir
+
+
+STORE_FILE = Path("store") / "index.db"  # own subdir: SQLite's -wal/-shm churn must not touch the log dir's mtime
+# A directory mtime this close to "now" may still change within the filesystem's timestamp granularity
+WATERMARK_SETTLE_S = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE NOT NULL,
+    started TEXT,
+    indexed_bytes INTEGER NOT NULL DEFAULT 0,
+    mtime_ns INTEGER NOT NULL DEFAULT 0,
+    ended INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER
+);
+CREATE TABLE IF NOT EXISTS turns (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    turn INTEGER NOT NULL,
+    t TEXT,
+    prompt TEXT NOT NULL,
+    synthesis TEXT,
+    disagreement REAL,
+    UNIQUE (session_id, turn)
+);
+CREATE TABLE IF NOT EXISTS responses (
+    id INTEGER PRIMARY KEY,
+    turn_id INTEGER NOT NULL REFERENCES turns(id),
+    round INTEGER NOT NULL,
+    adapter TEXT NOT NULL,
+    local INTEGER NOT NULL,
+    version TEXT,
+    latency_ms INTEGER,
+    text TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_turn ON responses(turn_id, round);
+CREATE INDEX IF NOT EXISTS turns_time ON turns(t);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    body, kind UNINDEXED, turn_id UNINDEXED, adapter UNINDEXED, tokenize = 'porter unicode61'
+);
+"""
+
+
+@dataclass
+class SearchHit:
+    turn_id: int
+    session_id: int
+    t: str
+    kind: str  # prompt|response|synthesis
+    adapter: Optional[str]
+    snippet: str
+
+
+@dataclass
+class SessionSummary:
+    id: int
+    source: str
+    started: Optional[str]
+    turns: int
+
+
+@dataclass
+class TurnSummary:
+    id: int
+    turn: int
+    t: str
+    prompt: str  # truncated preview
+    responses: int
+    disagreement: Optional[float]
+
+
+def fts_query(text: str) -> str:
+    """Quote each term so user input never trips FTS5 query syntax."""
+    terms = [t for t in text.split() if t]
+    return " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+
+
+class SessionStore:
+    """SQLite index over session logs with an FTS5 table for full-text search.
+
+    `sync()` is incremental: each log remembers how many bytes were indexed,
+    and grown files are read from the stored offset. Logs are append-only,
+    so new events only ever insert rows. A log that recorded `session_end`
+    never changes again; while the session directory's mtime matches the
+    last sync (no log created or removed), only still-open logs are checked,
+    so a sync costs O(open sessions) rather than O(all sessions).
+    """
+
+    def __init__(self, path: Optional[Path] = None, session_dir: Optional[Path] = None, blobs: Optional[BlobStore] = None) -> None:
+        self.session_dir = session_dir or default_session_dir()
+        # Archived response texts (`text_ref` in results events)
+        self.blobs = blobs or BlobStore(self.session_dir / "blobs")
+        self.path = path or (self.session_dir / STORE_FILE)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        if "ended" not in {r["name"] for r in self.conn.execute("PRAGMA table_info(sessions)")}:
+            self.conn.execute("ALTER TABLE sessions ADD COLUMN ended INTEGER NOT NULL DEFAULT 0")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SessionStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Indexing ------------------------------------------------------------
+    def sync(self) -> int:
+        """Index new events from all logs in the session dir; returns events ingested."""
+        if not self.session_dir.exists():
+            return 0
+        mtime_ns = self.session_dir.stat().st_mtime_ns
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'dir_mtime_ns'").fetchone()
+        if row and row["value"] == mtime_ns:
+            rows = self.conn.execute("SELECT source FROM sessions WHERE ended = 0 ORDER BY id").fetchall()
+            paths = [Path(r["source"]) for r in rows]
+        else:
+            root = self.session_dir.resolve()
+            ended = {r["source"] for r in self.conn.execute("SELECT source FROM sessions WHERE ended = 1")}
+            paths = [root / p.name for p in sorted(self.session_dir.glob("*.jsonl")) if str(root / p.name) not in ended]
+        total = sum(self.sync_file(p) for p in paths if p.exists())
+        settled = time.time_ns() - mtime_ns > WATERMARK_SETTLE_S * 1e9
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('dir_mtime_ns', ?)", (mtime_ns if settled else 0,))
+        return total
+
+    def sync_file(self, log_path: Path) -> int:
+        st = log_path.stat()
+        source = str(log_path.resolve())
+        row = self.conn.execute("SELECT id, indexed_bytes, mtime_ns FROM sessions WHERE source = ?", (source,)).fetchone()
+        if row and row["indexed_bytes"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns:
+            return 0
+        offset = row["indexed_bytes"] if row else 0
+        if row and offset > st.st_size:
+            # Log was truncated or replaced; re-index it from scratch
+            self._purge(row["id"])
+            offset = 0
+        with open(log_path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        # Only consume complete lines; a torn tail is picked up on the next sync
+        end = chunk.rfind(b"\n") + 1
+        events = []
+        for line in chunk[:end].splitlines():
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        with self.conn:
+            if row is None:
+                cur = self.conn.execute("INSERT INTO sessions (source) VALUES (?)", (source,))
+                session_id = cur.lastrowid
+            else:
+                session_id = row["id"]
+            self._ingest(session_id, events)
+            self.conn.execute(
+                "UPDATE sessions SET indexed_bytes = ?, mtime_ns = ? WHERE id = ?",
+                (offset + end, st.st_mtime_ns, session_id),
+            )
+        return len(events)
+
+    def _purge(self, session_id: int) -> None:
+        with self.conn:
+            ids = "SELECT id FROM turns WHERE session_id = ?"
+            self.conn.execute(f"DELETE FROM search_fts WHERE turn_id IN ({ids})", (session_id,))
+            self.conn.execute(f"DELETE FROM responses WHERE turn_id IN ({ids})", (session_id,))
+            self.conn.execute("DELETE FROM turns WHERE session_id = ?", (session_id,))
+
+    def _turn_id(self, session_id: int, turn: int) -> Optional[int]:
+        row = self.conn.execute("SELECT id FROM turns WHERE session_id = ? AND turn = ?", (session_id, turn)).fetchone()
+        return row["id"] if row else None
+
+    def _ingest(self, session_id: int, events: Iterable[Dict[str, Any]]) -> None:
+        for ev in events:
+            etype = ev.get("type")
+            data = ev.get("data", {})
+            if etype == "session_start":
+                self.conn.execute("UPDATE sessions SET started = ? WHERE id = ? AND started IS NULL", (ev.get("t"), session_id))
+                continue
+            if etype == "session_end":
+                self.conn.execute("UPDATE sessions SET ended = 1 WHERE id = ?", (session_id,))
+                continue
+            turn = data.get("turn")
+            if turn is None:
+                continue
+            if etype == "prompt":
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO turns (session_id, turn, t, prompt) VALUES (?, ?, ?, ?)",
+                    (session_id, turn, ev.get("t"), data.get("text", "")),
+                )
+                if cur.rowcount:
+                    self._index(data.get("text", ""), "prompt", cur.lastrowid, None)
+                continue
+            turn_id = self._turn_id(session_id, turn)
+            if turn_id is None:
+                continue
+            if etype == "results":
+                for r in data.get("results", []):
+                    if r.get("text") is None and r.get("text_ref"):
+                        r = {**r, "text": self.blobs.get(r["text_ref"])}
+                    self.conn.execute(
+                        "INSERT INTO responses (turn_id, round, adapter, local, version, latency_ms, text, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (turn_id, data.get("round", 1), r.get("name", ""), int(bool(r.get("local"))), r.get("version"), r.get("latency_ms"), r.get("text"), r.get("error")),
+                    )
+                    if r.get("text"):
+                        self._index(r["text"], "response", turn_id, r.get("name"))
+            elif etype == "synthesis":
+                self.conn.execute(
+                    "UPDATE turns SET synthesis = ?, disagreement = ? WHERE id = ?",
+                    (data.get("text"), data.get("disagreement"), turn_id),
+                )
+                if data.get("text"):
+                    self._index(data["text"], "synthesis", turn_id, None)
+
+    def _index(self, body: str, kind: str, turn_id: int, adapter: Optional[str]) -> None:
+        self.conn.execute("INSERT INTO search_fts (body, kind, turn_id, adapter) VALUES (?, ?, ?, ?)", (body, kind, turn_id, adapter))
+
+    # Queries -------------------------------------------------------------
+    def search(self, query: str, *, limit: int = 20, offset: int = 0) -> List[SearchHit]:
+        q = fts_query(query)
+        if not q:
+            return []
+        rows = self.conn.execute(
+            """
+            SELECT f.turn_id, f.kind, f.adapter, snippet(search_fts, 0, '[', ']', '…', 12) AS snip, t.session_id, t.t
+            FROM search_fts f JOIN turns t ON t.id = f.turn_id
+            WHERE search_fts MATCH ?
+            ORDER BY f.rank
+            LIMIT ? OFFSET ?
+            """,
+            (q, limit, offset),
+        ).fetchall()
+        return [SearchHit(turn_id=r["turn_id"], session_id=r["session_id"], t=r["t"] or "", kind=r["kind"], adapter=r["adapter"], snippet=r["snip"]) for r in rows]
+
+    def list_sessions(self, *, limit: int = 20, offset: int = 0) -> List[SessionSummary]:
+        rows = self.conn.execute(
+            """
+            SELECT s.id, s.source, s.started, (SELECT COUNT(*) FROM turns t WHERE t.session_id = s.id) AS n
+            FROM sessions s ORDER BY s.started DESC, s.id DESC LIMIT ? OFFSET ?
+            """,
+            (limit, offset),
+        ).fetchall()
+        return [SessionSummary(id=r["id"], source=r["source"], started=r["started"], turns=r["n"]) for r in rows]
+
+    def get_turn(self, turn_id: int) -> Optional[Tuple[sqlite3.Row, List[sqlite3.Row]]]:
+        turn = self.conn.execute("SELECT * FROM turns WHERE id = ?", (turn_id,)).fetchone()
+        if turn is None:
+            return None
+        responses = self.conn.execute(
+            "SELECT * FROM responses WHERE turn_id = ? ORDER BY round, id", (turn_id,)
+        ).fetchall()
+        return turn, responses
+
+    def session_turn_ids(self, session_id: int) -> List[int]:
+        rows = self.conn.execute("SELECT id FROM turns WHERE session_id = ? ORDER BY turn", (session_id,)).fetchall()
+        return [r["id"] for r in rows]
+
+    def latest_session_id(self) -> Optional[int]:
+        row = self.conn.execute("SELECT id FROM sessions ORDER BY started DESC, id DESC LIMIT 1").fetchone()
+        return row["id"] if row else None
+
+    def count_turns(self, session_id: int) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM turns WHERE session_id = ?", (session_id,)).fetchone()[0]
+
+    def list_turns(self, session_id: int, *, before: Optional[int] = None, limit: int = 50, preview_chars: int = 160) -> List[TurnSummary]:
+        """Newest-first page of a session's turns; pass the last `turn` seen as `before` for the next page.
+
+        Keyset pagination keeps each page an index range scan no matter how
+        deep into a long session the caller has scrolled.
+        """
+        rows = self.conn.execute(
+            """
+            SELECT t.id, t.turn, t.t, substr(t.prompt, 1, ?) AS preview, t.disagreement,
+                   (SELECT COUNT(*) FROM responses r WHERE r.turn_id = t.id) AS n
+            FROM turns t
+            WHERE t.session_id = ? AND t.turn < ?
+            ORDER BY t.turn DESC LIMIT ?
+            """,
+            (preview_chars, session_id, before if before is not None else 2**62, limit),
+        ).fetchall()
+        return [
+            TurnSummary(id=r["id"], turn=r["turn"], t=r["t"] or "", prompt=r["preview"], responses=r["n"], disagreement=r["disagreement"])
+            for r in rows
+        ]
+
+    def get_response(self, response_id: int) -> Optional[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM responses WHERE id = ?", (response_id,)).fetchone()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from platformdirs import user_config_dir
+
+from . import config as config_mod
+from . import trust as trust_mod
+from .mcp import config as mcp_mod
+
+
+# (mtime_ns, size) per watched file; None when the file does not exist
+Stamp = Tuple[Optional[Tuple[int, int]], ...]
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Parsed config, trust record and MCP servers for one project root.
+
+    Built from its own parse of the files, so edits to a `load_config()` or
+    `load_mcp_config()` result never leak in, and `get_config()` hands out
+    a copy of `config`. The `MCPServer` values are shared by every consumer
+    and not copied on access: they are plain dataclasses (with `read_only`
+    as a tuple) that must be treated as read-only. Edit a
+    `load_mcp_config()` result instead and write through
+    `save_project_mcp_config`, which invalidates the snapshot.
+    """
+
+    root: Path
+    config: config_mod.Config
+    config_path: Optional[Path]
+    trust: Optional[trust_mod.TrustRecord]
+    servers: Mapping[str, mcp_mod.MCPServer]
+    version: int
+
+    def server_by_url(self, url: str) -> Optional[mcp_mod.MCPServer]:
+        want = url.rstrip("/")
+        for s in self.servers.values():
+            if s.url.rstrip("/") == want:
+                return s
+        return None
+
+
+def _watched(root: Path) -> Tuple[Path, ...]:
+    return (
+        root / config_mod.PROJECT_FILE,
+        Path(user_config_dir("actcli", "actcli")) / config_mod.PROJECT_FILE,
+        trust_mod.TRUST_DB,
+        *mcp_mod.config_files(root),
+    )
+
+
+def _stamp(paths: Tuple[Path, ...]) -> Stamp:
+    out = []
+    for p in paths:
+        try:
+            st = p.stat()
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+def _expired(snap: Snapshot) -> bool:
+    # An `allow-once` grant lapses without any file changing
+    return snap.trust is not None and snap.trust.expires_at is not None and snap.trust.expires_at <= time.time()
+
+
+class SnapshotService:
+    """Parses config, trust and MCP files once and re-parses only on change.
+
+    `current()` costs one stat per watched file; when any (mtime, size)
+    differs, or after `invalidate()`, the snapshot is rebuilt. Plain stat
+    polling works on every platform and filesystem, so there is no file
+    watcher thread to manage.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cache: Dict[Path, Tuple[Stamp, Snapshot]] = {}
+        self._version = 0
+        self.builds = 0  # for diagnostics and tests
+
+    def current(self, root: Optional[Path] = None) -> Snapshot:
+        root = root or Path.cwd()
+        stamp = _stamp(_watched(root))
+        cached = self._cache.get(root)
+        if cached and cached[0] == stamp and not _expired(cached[1]):
+            return cached[1]
+        with self._lock:
+            cached = self._cache.get(root)
+            if cached and cached[0] == stamp and not _expired(cached[1]):
+                return cached[1]
+            snap = self._build(root)
+            self._cache[root] = (stamp, snap)
+            return snap
+
+    def _build(self, root: Path) -> Snapshot:
+        self.builds += 1
+        self._version += 1
+        cfg, cfg_path = config_mod.load_config(root)
+        servers = {
+            name: dataclasses.replace(s, read_only=tuple(s.read_only))  # type: ignore[arg-type]
+            for name, s in mcp_mod.load_servers(root).items()
+        }
+        return Snapshot(
+            root=root,
+            config=cfg,
+            config_path=cfg_path,
+            trust=copy.deepcopy(trust_mod.get_trust(root)),
+            servers=MappingProxyType(servers),
+            version=self._version,
+        )
+
+    def invalidate(self, root: Optional[Path] = None) -> None:
+        with self._lock:
+            if root is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(root, None)
+
+
+_SERVICE = SnapshotService()
+
+
+def current_snapshot(root: Optional[Path] = None) -> Snapshot:
+    return _SERVICE.current(root)
+
+
+def invalidate(root: Optional[Path] = None) -> None:
+    """Drop cached snapshots (all roots by default) after writing a watched file."""
+    _SERVICE.invalidate(root)
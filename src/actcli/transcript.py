@@ -4,9 +4,16 @@ import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from .blobstore import BlobStore, text_digest
+from .hashing import FileHasher, default_hasher
 from .seminar.coordinator import TurnResult
+from .session_log import SessionLog, TurnRecord, build_turns, result_to_dict
+
+
+# Event types copied into audit JSON; prompt/response texts stay out of audits
+AUDIT_EVENT_TYPES = ("attach", "adapter_start", "adapter_first_token", "adapter_finish")
 
 
 @dataclass
@@ -16,13 +23,12 @@ class Participant:
     version: str
 
 
-def write_transcript_md(
-    path: Path,
+def render_transcript_md(
     header: str,
     prompt: str,
     results: List[TurnResult],
     synthesis: Optional[str] = None,
-) -> None:
+) -> str:
     lines = ["# ActCLI Roundtable", "", f"> {header}", "", "## Prompt", "", f"{prompt}", "", "## Responses", ""]
     for r in results:
         lines.append(f"### {r.info.name} ({'local' if r.info.is_local else 'cloud'}) — {r.latency_ms} ms")
@@ -34,8 +40,18 @@ def write_transcript_md(
         lines.append("")
     if synthesis:
         lines.extend(["## Synthesis", "", synthesis, ""])
+    return "\n".join(lines)
+
+
+def write_transcript_md(
+    path: Path,
+    header: str,
+    prompt: str,
+    results: List[TurnResult],
+    synthesis: Optional[str] = None,
+) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(lines), encoding="utf-8")
+    path.write_text(render_transcript_md(header, prompt, results, synthesis), encoding="utf-8")
 
 
 def write_audit_json(
@@ -43,7 +59,16 @@ def write_audit_json(
     prompt: str,
     results: List[TurnResult],
     disagreement: Optional[float] = None,
+    events: Optional[List[Dict[str, Any]]] = None,
+    blobs: Optional[BlobStore] = None,
+    attachments: Optional[List[str]] = None,
+    hasher: Optional[FileHasher] = None,
 ) -> None:
+    """Write audit-lite JSON; responses reference their text by SHA-256.
+
+    With a blob store the texts are archived there, so the hash resolves.
+    Attachments are hashed through the cached streaming hasher.
+    """
     data = {
         "actcli_version": "0.0.1",
         "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
@@ -56,12 +81,24 @@ def write_audit_json(
                 "id": r.info.id,
                 "latency_ms": r.latency_ms,
                 "ok": bool(r.text),
+                "sha256": (blobs.put(r.text) if blobs is not None else text_digest(r.text)) if r.text else None,
             }
             for r in results
         ],
     }
+    if attachments:
+        digests = (hasher or default_hasher()).hash_files([Path(a) for a in attachments])
+        data["attachments"] = [
+            {"path": a, "sha256": d.sha256, "size": d.size} for a, d in zip(attachments, digests)
+        ]
     if disagreement is not None:
         data["disagreement_score"] = disagreement
+    if events is not None:
+        data["events"] = [
+            {"t": ev.get("t"), "type": ev.get("type"), "data": ev.get("data", {})}
+            for ev in events
+            if ev.get("type") in AUDIT_EVENT_TYPES
+        ]
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
 
@@ -70,20 +107,32 @@ def write_presenter_state(path: Path, *, prompt: str, results: List[TurnResult],
     payload = {
         "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
         "prompt": prompt,
-        "results": [
-            {
-                "id": r.info.id,
-                "name": r.info.name,
-                "local": r.info.is_local,
-                "version": r.info.model_version,
-                "latency_ms": r.latency_ms,
-                "text": r.text,
-                "error": r.error,
-            }
-            for r in results
-        ],
+        "results": [result_to_dict(r) for r in results],
         "synthesis": synthesis,
         "disagreement": disagreement,
     }
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def latest_turn(log: SessionLog) -> Optional[TurnRecord]:
+    turns = build_turns(log.events, blobs=log.blobs)
+    return turns[-1] if turns else None
+
+
+def write_views(
+    turn: TurnRecord,
+    *,
+    header: str = "Roundtable",
+    transcript: Optional[Path] = None,
+    audit: Optional[Path] = None,
+    presenter_state: Optional[Path] = None,
+    blobs: Optional[BlobStore] = None,
+) -> None:
+    """Render one turn folded from the session log into the requested files."""
+    if transcript:
+        write_transcript_md(transcript, header=header, prompt=turn.prompt, results=turn.results, synthesis=turn.synthesis)
+    if audit:
+        write_audit_json(audit, prompt=turn.prompt, results=turn.results, disagreement=turn.disagreement, events=turn.events, blobs=blobs, attachments=turn.attachments)
+    if presenter_state:
+        write_presenter_state(presenter_state, prompt=turn.prompt, results=turn.results, synthesis=turn.synthesis, disagreement=turn.disagreement)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from platformdirs import user_config_dir
 
@@ -13,60 +17,183 @@ except Exception:  # pragma: no cover
     import tomli as toml  # type: ignore
 
 
+TRUST_DB = Path(user_config_dir("actcli", "actcli")) / "trust.db"
+# Legacy one-TOML-per-folder records, imported into the database on first use
 TRUST_DIR = Path(user_config_dir("actcli", "actcli")) / "trust.d"
-TRUST_DIR.mkdir(parents=True, exist_ok=True)
+# How long an `allow-once` grant lasts; ACTCLI_TRUST_ONCE_TTL_S overrides
+ONCE_TTL_S = 12 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trust (
+    path TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    read TEXT NOT NULL,
+    write TEXT NOT NULL,
+    cloud_share INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    expires_at REAL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
 
 
 @dataclass
 class TrustRecord:
-    path: str
+    path: str  # the trusted folder; globs are relative to it
     scope: str  # persist|once
     read: List[str]
     write: List[str]
     cloud_share: bool = False
+    expires_at: Optional[float] = None
+
+
+def _ancestors(root: Path) -> List[str]:
+    p = root.resolve()
+    return [str(p), *(str(a) for a in p.parents)]
+
+
+class TrustStore:
+    """All trust grants in one SQLite table keyed by absolute folder path.
+
+    `lookup` resolves the nearest trusted ancestor of a folder with a single
+    primary-key `IN` query over its ancestors, so trusting a monorepo root
+    covers every subdirectory. Expired `once` grants are ignored and purged
+    on the next write or listing.
+    """
+
+    def __init__(self, path: Path, legacy_dir: Optional[Path] = None) -> None:
+        self.path = path
+        self.legacy_dir = legacy_dir
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._migrate()
+        return self._conn
+
+    def _migrate(self) -> None:
+        """Import `trust.d/*.toml` once; the old files are left in place."""
+        assert self._conn is not None
+        if self.legacy_dir is None or not self.legacy_dir.is_dir():
+            return
+        if self._conn.execute("SELECT 1 FROM meta WHERE key = 'trust_d_migrated'").fetchone():
+            return
+        with self._conn:
+            for f in sorted(self.legacy_dir.glob("*.toml")):
+                try:
+                    data = toml.loads(f.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    continue
+                if not data.get("path"):
+                    continue
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO trust VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                    (
+                        str(Path(data["path"]).resolve()), data.get("scope", "persist"),
+                        json.dumps(list(data.get("read", ["./**"]))), json.dumps(list(data.get("write", ["./out/**"]))),
+                        int(bool(data.get("cloud_share", False))), f.stat().st_mtime,
+                    ),
+                )
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('trust_d_migrated', ?)", (str(time.time()),))
+
+    @staticmethod
+    def _record(row: sqlite3.Row) -> TrustRecord:
+        return TrustRecord(
+            path=row["path"], scope=row["scope"], read=json.loads(row["read"]), write=json.loads(row["write"]),
+            cloud_share=bool(row["cloud_share"]), expires_at=row["expires_at"],
+        )
+
+    def lookup(self, root: Path) -> Optional[TrustRecord]:
+        paths = _ancestors(root)
+        marks = ",".join("?" * len(paths))
+        with self._lock:
+            row = self._db().execute(
+                f"SELECT * FROM trust WHERE path IN ({marks}) AND (expires_at IS NULL OR expires_at > ?) "
+                "ORDER BY length(path) DESC LIMIT 1",
+                (*paths, time.time()),
+            ).fetchone()
+        return self._record(row) if row else None
+
+    def grant(self, root: Path, scope: str, read: List[str], write: List[str], cloud_share: bool, ttl_s: Optional[float] = None) -> TrustRecord:
+        now = time.time()
+        expires = now + (ttl_s if ttl_s is not None else _once_ttl()) if scope == "once" else None
+        path = str(root.resolve())
+        with self._lock:
+            conn = self._db()
+            with conn:
+                conn.execute("DELETE FROM trust WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO trust VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (path, scope, json.dumps(read), json.dumps(write), int(cloud_share), now, expires),
+                )
+        return TrustRecord(path=path, scope=scope, read=list(read), write=list(write), cloud_share=cloud_share, expires_at=expires)
+
+    def revoke(self, root: Path) -> bool:
+        with self._lock:
+            conn = self._db()
+            with conn:
+                cur = conn.execute("DELETE FROM trust WHERE path = ?", (str(root.resolve()),))
+        return cur.rowcount > 0
+
+    def list(self) -> List[TrustRecord]:
+        with self._lock:
+            conn = self._db()
+            with conn:
+                conn.execute("DELETE FROM trust WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+            rows = conn.execute("SELECT * FROM trust ORDER BY path").fetchall()
+        return [self._record(r) for r in rows]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _once_ttl() -> float:
+    return float(os.environ.get("ACTCLI_TRUST_ONCE_TTL_S", ONCE_TTL_S))
+
+
+_STORES: Dict[Path, TrustStore] = {}
+
+
+def trust_store() -> TrustStore:
+    """Process-wide store for the current `TRUST_DB`."""
+    store = _STORES.get(TRUST_DB)
+    if store is None:
+        store = _STORES[TRUST_DB] = TrustStore(TRUST_DB, legacy_dir=TRUST_DIR)
+    return store
 
 
-def _fingerprint(path: Path) -> str:
-    p = str(path.resolve())
-    return hashlib.sha256(p.encode("utf-8")).hexdigest()
+def get_trust(root: Optional[Path] = None) -> Optional[TrustRecord]:
+    """Grant for `root` or its nearest trusted ancestor."""
+    if not TRUST_DB.exists() and not TRUST_DIR.is_dir():
+        return None  # nothing was ever trusted: skip opening a database
+    return trust_store().lookup(root or Path.cwd())
 
 
-def _record_path(root: Path) -> Path:
-    return TRUST_DIR / f"{_fingerprint(root)}.toml"
+def set_trust(root: Optional[Path], scope: str, read: List[str], write: List[str], cloud_share: bool) -> TrustRecord:
+    record = trust_store().grant(root or Path.cwd(), scope, read, write, cloud_share)
+    _changed()
+    return record
 
 
-def get_trust(root: Optional[Path] = None) -> Optional[TrustRecord]:
-    root = root or Path.cwd()
-    path = _record_path(root)
-    if not path.exists():
-        return None
-    data = toml.loads(path.read_text(encoding="utf-8"))
-    return TrustRecord(
-        path=data.get("path", str(root)),
-        scope=data.get("scope", "persist"),
-        read=list(data.get("read", ["./**"])),
-        write=list(data.get("write", ["./out/**"])),
-        cloud_share=bool(data.get("cloud_share", False)),
-    )
-
-
-def set_trust(root: Optional[Path], scope: str, read: List[str], write: List[str], cloud_share: bool) -> Path:
-    root = root or Path.cwd()
-    path = _record_path(root)
-    content = [
-        f"path = \"{str(root)}\"",
-        f"scope = \"{scope}\"",
-        "read = [" + ", ".join(f"\"{g}\"" for g in read) + "]",
-        "write = [" + ", ".join(f"\"{g}\"" for g in write) + "]",
-        f"cloud_share = {str(cloud_share).lower()}",
-    ]
-    path.write_text("\n".join(content) + "\n", encoding="utf-8")
-    return path
-
-
-def revoke_trust(root: Optional[Path] = None) -> None:
-    root = root or Path.cwd()
-    path = _record_path(root)
-    if path.exists():
-        path.unlink()
+def revoke_trust(root: Optional[Path] = None) -> bool:
+    removed = trust_store().revoke(root or Path.cwd())
+    _changed()
+    return removed
+
+
+def list_trust() -> List[TrustRecord]:
+    return trust_store().list()
+
+
+def _changed() -> None:
+    from .snapshot import invalidate
 
+    invalidate()
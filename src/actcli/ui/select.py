@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Iterable, List, Optional, Sequence, Tuple
 
-import readchar
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
@@ -41,6 +40,8 @@ def select_one(options: Sequence[Tuple[str, str]] | Sequence[str], *, title: str
         table.add_row("", f"[dim]{help_text}[/dim]")
         return Panel(table, title=title, border_style="cyan", padding=(0, 1))
 
+    import readchar
+
     with Live(_render(), console=console, transient=True, refresh_per_second=30) as live:
         while True:
             key = readchar.readkey()
@@ -3,6 +3,7 @@ VSCode-inspired ActCLI layout with expandable left sidebar.
 """
 from __future__ import annotations
 
+from html import escape
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 
@@ -42,7 +43,7 @@ class AppState:
     models_available: List[str] = field(default_factory=lambda: ["llama3:8b", "llama3:13b", "claude-3-haiku", "gpt-4o-mini"])
     models_roundtable: List[str] = field(default_factory=lambda: ["llama3:8b", "claude-3-haiku", "gpt-4o-mini"])
     current_theme: str = "dark"
-    mcp_servers: Dict[str, bool] = field(default_factory=lambda: {"git-mcp": True, "docs-mcp": False, "fs-mcp": True})
+    mcp_servers: Dict[str, bool] = field(default_factory=dict)  # name -> enabled, from the MCP config
     read_locations: List[str] = field(default_factory=lambda: ["./**", "~/docs/**"])
     write_locations: List[str] = field(default_factory=lambda: ["./out/**"])
 
@@ -50,8 +51,9 @@ class AppState:
 class VSCodeActCLI:
     """VSCode-inspired ActCLI interface."""
 
-    def __init__(self, on_input: Optional[Callable[[str], str]] = None):
+    def __init__(self, on_input: Optional[Callable[[str], str]] = None, monitor=None):
         self.on_input = on_input or (lambda x: f"Echo: {x}")
+        self.monitor = monitor  # mcp.health.HealthMonitor feeding the MCP section, if running
         self.sidebar_state = SidebarState()
         self.app_state = AppState()
         self.conversation_history = []
@@ -80,6 +82,8 @@ class VSCodeActCLI:
             key_bindings=self.kb,
             full_screen=True,
             mouse_support=True,
+            # Redraw periodically so background health probes show up without a keypress
+            refresh_interval=2.0 if monitor is not None else None,
         )
 
     def create_completer(self):
@@ -274,11 +278,27 @@ class VSCodeActCLI:
         return HTML('\n'.join(content))
 
     def _get_mcp_servers(self):
-        """Get MCP servers display."""
+        """Get MCP servers display, with live health when a monitor is running."""
+        health = self.monitor.snapshot() if self.monitor is not None else {}
+        servers = dict(self.app_state.mcp_servers)
+        for name in health:
+            servers.setdefault(name, True)
+        if not servers:
+            return HTML('<mcp-disabled>No MCP servers configured</mcp-disabled>')
         content = []
-        for server, enabled in self.app_state.mcp_servers.items():
-            status = "<mcp-enabled>●</mcp-enabled>" if enabled else "<mcp-disabled>○</mcp-disabled>"
-            content.append(f'<mcp-item>{status} {server}</mcp-item>')
+        for server, enabled in servers.items():
+            h = health.get(server)
+            name = escape(server)
+            if not enabled:
+                line = f"<mcp-disabled>○</mcp-disabled> {name}"
+            elif h is None or h.up is None:
+                pending = " <mcp-disabled>checking…</mcp-disabled>" if self.monitor is not None else ""
+                line = f"<mcp-enabled>●</mcp-enabled> {name}{pending}"
+            elif h.up:
+                line = f"<mcp-enabled>●</mcp-enabled> {name} <mcp-latency>{h.percentile(50):.0f}/{h.percentile(95):.0f} ms</mcp-latency>"
+            else:
+                line = f"<mcp-down>✕</mcp-down> {name} <mcp-down>down</mcp-down>"
+            content.append(f'<mcp-item>{line}</mcp-item>')
         return HTML('\n'.join(content))
 
     def _get_locations(self):
@@ -379,6 +399,8 @@ Type your question below or use slash commands:
             'mcp-item': f'{text_color}',
             'mcp-enabled': '#4CAF50',
             'mcp-disabled': '#888888',
+            'mcp-down': '#F44336',
+            'mcp-latency': '#888888',
 
             # Locations
             'location-header': f'{accent} bold',
@@ -576,6 +598,6 @@ Type your question below or use slash commands:
         self.app.run()
 
 
-def create_vscode_actcli(on_input=None):
+def create_vscode_actcli(on_input=None, monitor=None):
     """Create VSCode-style ActCLI interface."""
-    return VSCodeActCLI(on_input=on_input)
\ No newline at end of file
+    return VSCodeActCLI(on_input=on_input, monitor=monitor)
\ No newline at end of file
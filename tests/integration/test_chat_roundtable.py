@@ -8,6 +8,7 @@ from actcli.commands.chat import run_roundtable
 
 def test_roundtable_echo_only(tmp_path: Path, monkeypatch) -> None:
     # Use echo adapters only by passing unknown identifiers (resolved to EchoAdapter)
+    monkeypatch.setenv("ACTCLI_SESSION_DIR", str(tmp_path / "sessions"))
     md = tmp_path / "seminar.md"
     audit = tmp_path / "audit.json"
     run_roundtable(
@@ -23,4 +24,7 @@ def test_roundtable_echo_only(tmp_path: Path, monkeypatch) -> None:
     assert md.exists() and audit.exists()
     data = json.loads(audit.read_text())
     assert 0.0 <= data.get("disagreement_score", 0.0) <= 1.0
+    # One-shot runs are logged like REPL sessions
+    (log,) = (tmp_path / "sessions").glob("session-*.jsonl")
+    assert '"Compare A vs B"' in log.read_text()
 
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from actcli.commands.presenter import PresenterServer, prepare_presenter
+
+
+VIEWERS = 200
+
+
+async def _viewer(port: int, want: int) -> list:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+    seen = []
+    while len(seen) < want:
+        line = await reader.readline()
+        if line.startswith(b"data: "):
+            seen.append(json.loads(line[6:]))
+    writer.close()
+    return seen
+
+
+def _fan_out(root: Path) -> float:
+    """Seconds for 200 viewers to receive 51 deltas each, checking every stream."""
+
+    async def scenario() -> float:
+        server = PresenterServer(prepare_presenter(root), port=0)
+        port = await server.start()
+        chunks = 50
+        viewers = [asyncio.create_task(_viewer(port, 2 + chunks)) for _ in range(VIEWERS)]
+        while server.hub.subscriber_count < VIEWERS:
+            await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        server.hub.publish({"type": "prompt", "prompt": "P"})
+        for i in range(chunks):
+            server.hub.publish({"type": "chunk", "adapter": "m", "round": 1, "text": f"{i} "})
+        results = await asyncio.wait_for(asyncio.gather(*viewers), timeout=30)
+        elapsed = time.perf_counter() - start
+        server.stop()
+        await asyncio.sleep(0.05)
+        for seen in results:
+            assert seen[0]["type"] == "snapshot" and seen[1]["type"] == "prompt"
+            assert "".join(d["text"] for d in seen[2:]) == "".join(f"{i} " for i in range(chunks))
+        return elapsed
+
+    return asyncio.run(scenario())
+
+
+def test_many_viewers_share_one_update_stream(tmp_path: Path) -> None:
+    _fan_out(tmp_path)
+
+
+@pytest.mark.skipif(not os.environ.get("ACTCLI_BENCH"), reason="timing benchmark; set ACTCLI_BENCH=1")
+def test_fan_out_latency(tmp_path: Path) -> None:
+    # 200 viewers x 51 deltas on a single event loop
+    assert _fan_out(tmp_path) < 10
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from typing import Optional
+
+from actcli.seminar.adapters.base import Capabilities, capabilities_of
+from actcli.seminar.adapters.echo import EchoAdapter
+from actcli.seminar.adapters.registry import AdapterRegistry, AdapterSpec
+from actcli.seminar.coordinator import run_round
+
+
+class GatewayAdapter:
+    """Stand-in for an in-house adapter shipped as a plugin."""
+
+    capabilities = Capabilities(async_native=True, prompt_caching=True)
+
+    def __init__(self, model_id: str, **_: object) -> None:
+        self.name = model_id
+        self.is_local = False
+        self.model_version = "gw-1"
+        self.threads_used = False
+
+    def generate(self, prompt: str, **_: object) -> str:
+        self.threads_used = True
+        return "sync"
+
+    async def agenerate(self, prompt: str, *, round_index: int = 1, **_: object) -> str:
+        await asyncio.sleep(0)
+        return f"async answer to {prompt}"
+
+
+GATEWAY_SPEC = AdapterSpec(id="gateway", target=f"{__name__}:GatewayAdapter", capabilities=GatewayAdapter.capabilities)
+
+
+def test_builtin_resolution() -> None:
+    reg = AdapterRegistry(entry_points=False)
+    assert reg.resolve("llama3").id == "ollama"
+    assert reg.resolve("phi3:mini").id == "ollama"
+    assert reg.resolve("claude").id == "claude" and reg.resolve("anthropic").id == "claude"
+    assert reg.resolve("echo").id == "echo"
+    assert reg.resolve("nonesuch") is None
+    assert reg.resolve("gpt").capabilities.seed
+
+
+def test_gateway_ids_pass_the_model_name_to_the_adapter(monkeypatch) -> None:
+    for key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY"):
+        monkeypatch.setenv(key, "test")
+    reg = AdapterRegistry(entry_points=False)
+    assert reg.resolve("openai/gpt-4o").id == "gpt" and reg.resolve("anthropic/claude-3-opus").id == "claude"
+    assert reg.resolve("gpt/gpt-4o").create("gpt/gpt-4o").model == "gpt-4o"
+    assert reg.resolve("openai/gpt-4o").create("openai/gpt-4o").model == "gpt-4o"
+    assert reg.resolve("claude/claude-3-opus").create("claude/claude-3-opus").model == "claude-3-opus"
+    assert reg.resolve("gemini/gemini-1.5-pro").create("gemini/gemini-1.5-pro").model == "gemini-1.5-pro"
+    assert reg.resolve("gpt").create("gpt").model == "gpt-4o-mini"  # bare id: the adapter's default
+    assert reg.resolve("ollama/llama3").create("ollama/llama3").model == "llama3"
+    assert reg.resolve("ollama").create("ollama").model == "llama3"
+    assert reg.resolve("phi3:mini").create("phi3:mini").model == "phi3:mini"
+    assert capabilities_of(EchoAdapter()) == reg.resolve("echo").capabilities
+
+
+def test_entry_point_plugin_loaded_on_demand() -> None:
+    reg = AdapterRegistry(entry_points=False)
+    reg._pending = {"gateway": EntryPoint(name="gateway", value=f"{__name__}:GATEWAY_SPEC", group="actcli.adapters")}
+    assert reg.resolve("llama3").id == "ollama"
+    assert "gateway" in reg._pending  # built-in hit: plugin untouched
+    spec: Optional[AdapterSpec] = reg.resolve("gateway/big-model")
+    assert spec is GATEWAY_SPEC and reg._pending == {}
+    adapter = spec.create("gateway/big-model")
+    assert capabilities_of(adapter).async_native
+
+    results = asyncio.run(run_round([adapter, EchoAdapter("e")], "Q", timeout_s=2))
+    assert results[0].text == "async answer to Q" and not adapter.threads_used
+
+
+def test_chat_import_does_not_load_provider_adapters() -> None:
+    probe = (
+        "import sys, actcli.commands.chat; "
+        "print([m for m in sys.modules if m.startswith('actcli.seminar.adapters.') and m.rsplit('.', 1)[1] in ('ollama', 'openai', 'anthropic', 'gemini')])"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_chat_falls_back_to_echo_for_broken_plugin(monkeypatch) -> None:
+    from actcli.commands import chat
+
+    reg = AdapterRegistry(entry_points=False)
+    reg._pending = {"broken": EntryPoint(name="broken", value="actcli_no_such_plugin:SPEC", group="actcli.adapters")}
+    monkeypatch.setattr(chat, "default_registry", lambda: reg)
+    adapters = chat._resolve_adapters("broken/model,echo")
+    assert [type(a) for a in adapters] == [EchoAdapter, EchoAdapter]
+    assert adapters[0].name == "broken/model"
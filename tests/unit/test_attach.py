@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from actcli.attach import Attacher, ChunkCache, chunk_text, format_context, is_binary, with_context
+from actcli.hashing import HashCache
+from actcli.policy import Policy
+from actcli.retrieval import BM25Index
+
+
+def _tree(root: Path, files: dict[str, bytes]) -> None:
+    for rel, data in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_bytes(data)
+
+
+def _attacher(tmp_path: Path, root: Path, policy: Policy | None = None, **kw) -> Attacher:
+    return Attacher(
+        policy or Policy(root=root), root,
+        hash_cache=HashCache(tmp_path / "hash.db"), chunk_cache=ChunkCache(tmp_path / "chunks.db"), **kw,
+    )
+
+
+def test_binary_detection_and_chunking() -> None:
+    assert is_binary(b"PK\x03\x04\x00\x00") and is_binary(bytes(range(1, 32)) * 4)
+    assert not is_binary(b"a,b\r\n1,2\n\tx\n") and not is_binary(b"")
+    text = "".join(f"line {i}\n" for i in range(1, 101))  # 100 lines of 7-9 chars
+    chunks = chunk_text(text, max_chars=100)
+    assert "".join(c[3] for c in chunks) == text
+    assert all(len(c[3]) <= 100 for c in chunks)
+    assert chunks[0][1] == 1 and chunks[-1][2] == 100
+    assert all(a[2] + 1 == b[1] for a, b in zip(chunks, chunks[1:]))  # contiguous line ranges
+    long = chunk_text("x" * 250 + "\nend\n", max_chars=100)
+    assert [c[3] for c in long] == ["x" * 100, "x" * 100, "x" * 50 + "\nend\n"]
+    assert chunk_text("") == []
+
+
+def test_attach_respects_policy_and_skips_binaries(tmp_path: Path) -> None:
+    root = tmp_path / "proj"
+    _tree(root, {
+        "data/claims.csv": b"id,amount\n1,10\n",
+        "data/model.bin": b"\x00\x01\x02",
+        "secrets/key.txt": b"hunter2\n",
+        "docs/readme.md": b"# Hello\n",
+        ".git/config": b"[core]\n",
+    })
+    policy = Policy(read=["./data/**", "./docs/**", "./.git/**"], root=root)
+    result = _attacher(tmp_path, root, policy).attach(["."])
+    assert [f.path for f in result.text_files] == ["data/claims.csv", "docs/readme.md"]
+    assert [(f.path, f.kind) for f in result.skipped] == [("data/model.bin", "binary")]
+
+    # A glob outside the read policy yields nothing, even when named directly
+    assert _attacher(tmp_path, root, policy).attach(["secrets/*.txt"]).files == []
+    assert _attacher(tmp_path, root, policy).attach([str(tmp_path / "elsewhere")]).files == []
+
+
+def test_reattach_unchanged_tree_reads_nothing(tmp_path: Path) -> None:
+    root = tmp_path / "proj"
+    _tree(root, {f"src/m{i}.py": f"VALUE = {i}\n".encode() for i in range(50)})
+    first = _attacher(tmp_path, root).attach(["src"])
+    assert first.read == 50 and len(first.chunks) == 50
+
+    again = _attacher(tmp_path, root).attach(["src/**/*.py"])
+    assert again.read == 0
+    assert [c.id for c in again.chunks] == [c.id for c in first.chunks]  # stable ids
+
+    time.sleep(0.01)
+    (root / "src/m7.py").write_text("VALUE = 'changed'\n", encoding="utf-8")
+    third = _attacher(tmp_path, root).attach(["src"])
+    assert third.read == 1
+    changed = next(f for f in third.files if f.path == "src/m7.py")
+    assert "changed" in changed.chunks[0].text
+    assert changed.chunks[0].id != next(f for f in first.files if f.path == "src/m7.py").chunks[0].id
+
+
+def test_one_attacher_reuses_its_cache_connections(tmp_path: Path) -> None:
+    root = tmp_path / "proj"
+    _tree(root, {"a.txt": b"a\n", "b.txt": b"b\n"})
+    attacher = _attacher(tmp_path, root)
+    attacher.attach(["a.txt"])
+    conns = (attacher.hash_cache._conn, attacher.chunk_cache._conn)
+    assert all(conns) and attacher.attach(["."]).read == 1
+    assert (attacher.hash_cache._conn, attacher.chunk_cache._conn) == conns
+    attacher.close()
+    assert attacher.hash_cache._conn is None and attacher.chunk_cache._conn is None
+
+
+def test_large_files_are_skipped_and_context_is_budgeted(tmp_path: Path) -> None:
+    root = tmp_path / "proj"
+    _tree(root, {"big.csv": b"1,2,3\n" * 1000, "a.txt": b"alpha\n" * 100, "b.txt": b"beta\n" * 100})
+    result = _attacher(tmp_path, root, max_file_bytes=4096, chunk_chars=200).attach(["*"])
+    assert [(f.path, f.kind) for f in result.skipped] == [("big.csv", "too_large")]
+
+    index = BM25Index()
+    for c in result.chunks:
+        index.add(c)
+    included = index.select("alpha", 1000)
+    context = format_context(included)
+    assert included and len(context) <= 1000 and len(included) < len(result.chunks)
+    assert context.startswith("--- a.txt (lines ")
+    prompt = with_context("Summarise", context)
+    assert prompt.endswith("Summarise") and "alpha" in prompt
+    assert with_context("Summarise", "") == "Summarise"
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from actcli.blobstore import BlobStore, make_ref, text_digest
+from actcli.seminar.adapters.base import AdapterInfo
+from actcli.seminar.coordinator import TurnResult
+from actcli.session_log import SessionLog, read_events
+from actcli.transcript import latest_turn, write_audit_json
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "raw"])
+def test_put_get_dedup(tmp_path: Path, codec: str) -> None:
+    store = BlobStore(tmp_path / "blobs", codec=codec)
+    text = "Chain ladder on paid triangles. " * 50
+    d1 = store.put(text)
+    d2 = store.put(text)
+    assert d1 == d2 == text_digest(text)
+    assert store.stats().blobs == 1
+    if codec != "raw":
+        assert store.stats().stored_bytes < store.stats().raw_bytes / 5
+
+    # A fresh instance reads the index and resolves refs in either form
+    again = BlobStore(tmp_path / "blobs")
+    assert again.get(d1) == text
+    assert again.get(make_ref(d1)) == text
+    assert again.get("0" * 64) is None
+
+
+def test_segments_roll_over(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, codec="raw", segment_max_bytes=64)
+    digests = [store.put(f"response number {i} " * 3) for i in range(5)]
+    assert len(list(tmp_path.glob("seg-*.pack"))) > 1
+    assert [store.get(d) for d in digests] == [f"response number {i} " * 3 for i in range(5)]
+
+
+def test_session_log_references_blobs(tmp_path: Path) -> None:
+    blobs = BlobStore(tmp_path / "blobs")
+    log = SessionLog(tmp_path / "s.jsonl", blobs=blobs, flush_interval_s=0.0)
+    info = AdapterInfo(id="m", name="m", is_local=True, model_version="1")
+    turn = log.begin_turn("P")
+    log.record_results(turn, 1, [TurnResult(info=info, text="same answer", latency_ms=1)])
+    log.record_results(turn, 2, [TurnResult(info=info, text="same answer", latency_ms=1)])
+    log.close()
+
+    on_disk = [e for e in read_events(tmp_path / "s.jsonl") if e["type"] == "results"]
+    assert all("text" not in r and r["text_ref"].startswith("sha256:") for e in on_disk for r in e["data"]["results"])
+    assert blobs.stats().blobs == 1
+    assert latest_turn(log).results[0].text == "same answer"
+
+    audit = tmp_path / "audit.json"
+    write_audit_json(audit, prompt="P", results=latest_turn(log).results, blobs=blobs)
+    ref = json.loads(audit.read_text())["responses"][0]["sha256"]
+    assert blobs.get(ref) == "same answer"
+
+
+def test_sees_blobs_written_by_another_store(tmp_path: Path) -> None:
+    reader, writer = BlobStore(tmp_path), BlobStore(tmp_path)
+    first = reader.put("mine")
+    theirs = writer.put("written elsewhere after the reader loaded its index")
+    assert reader.get(theirs) == "written elsewhere after the reader loaded its index"
+    assert reader.get(first) == writer.get(first) == "mine"
+    assert reader.stats().blobs == 2
+
+    # A torn index line from a crashed writer is skipped, and later entries still land on their own line
+    with open(tmp_path / "index", "ab") as f:
+        f.write(b"deadbeef 0 12")
+    again = BlobStore(tmp_path)
+    d = again.put("after the crash")
+    assert BlobStore(tmp_path).get(d) == "after the crash" and reader.get(d) == "after the crash"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from actcli.seminar.adapters.base import AdapterInfo
+from actcli.seminar.coordinator import TurnResult
+from actcli.seminar.embeddings import OllamaEmbedder, mean_pairwise_similarity
+from actcli.seminar.synthesizer import summarize
+
+
+def _result(model: str, text: str) -> TurnResult:
+    info = AdapterInfo(id=model, name=model, is_local=True, model_version="0.1")
+    return TurnResult(info=info, text=text, latency_ms=5)
+
+
+class _CountingEmbedder(OllamaEmbedder):
+    def __init__(self, cache_dir: Path, fail: bool = False) -> None:
+        super().__init__(model="fake-embed", host="http://mock", cache_dir=cache_dir)
+        self._fail = fail
+        self.batches: List[List[str]] = []
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        if self._fail:
+            raise RuntimeError("model not found")
+        self.batches.append(texts)
+        # Paraphrases map to the same direction
+        return [[1.0, 0.0] if "reserve" in t else [0.0, 1.0] for t in texts]
+
+
+def test_embedder_batches_and_caches(tmp_path: Path) -> None:
+    emb = _CountingEmbedder(tmp_path)
+    vecs = emb.embed(["reserve up", "reserve higher", "reserve up"])
+    assert emb.calls == 1 and len(emb.batches[0]) == 2
+    assert len(vecs) == 3
+    emb.embed(["reserve up"])
+    assert emb.calls == 1
+
+    # A fresh instance reads the persisted cache instead of calling the host
+    emb2 = _CountingEmbedder(tmp_path)
+    emb2.embed(["reserve higher"])
+    assert emb2.calls == 0
+
+
+def test_mean_pairwise_similarity() -> None:
+    assert mean_pairwise_similarity([[1.0, 0.0], [1.0, 0.0]]) == 1.0
+    assert mean_pairwise_similarity([[1.0, 0.0], [0.0, 1.0]]) == 0.0
+
+
+def test_summarize_semantic_and_fallback(tmp_path: Path) -> None:
+    results = [_result("a", "reserve up strongly"), _result("b", "we should reserve higher")]
+    _, semantic = summarize(results, embedder=_CountingEmbedder(tmp_path / "ok"))
+    assert semantic == 0.0
+
+    failing = _CountingEmbedder(tmp_path / "bad", fail=True)
+    _, lexical = summarize(results, embedder=failing)
+    assert lexical == summarize(results)[1] > 0.0
+    assert failing.available is False
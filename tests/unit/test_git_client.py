@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from actcli.mcp import git_client
+from actcli.mcp.git_client import AsyncGitMCPClient, GitMCPClient
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "-c", "init.defaultBranch=main", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+class _Server:
+    """Fake Git-MCP service; `batch` is optional and `fail` makes ops report errors."""
+
+    def __init__(self, batch: bool = True, fail: tuple = ()) -> None:
+        self.batch = batch
+        self.fail = fail
+        self.ops: List[str] = []
+        self.connections = 0
+
+    def run(self, op: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.ops.append(op)
+        if op in self.fail:
+            return {"ok": False, "error": f"{op} failed"}
+        data = {"commit": {"hash": "abc123"}, "pr_link": {"url": f"https://example.com/pr/{params.get('branch')}"}}.get(op, {})
+        return {"ok": True, "data": data}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["op"] != "batch":
+            return httpx.Response(200, json=self.run(body["op"], body["params"]))
+        if not self.batch:
+            return httpx.Response(400, json={"ok": False, "error": "unknown op"})
+        results = []
+        for item in body["params"]["ops"]:
+            results.append(self.run(item["op"], item["params"]))
+            if body["params"]["stop_on_error"] and not results[-1]["ok"]:
+                break
+        return httpx.Response(200, json={"ok": True, "data": {"results": results}})
+
+
+@pytest.fixture()
+def server(monkeypatch) -> _Server:
+    srv = _Server()
+    real, real_async = httpx.Client, httpx.AsyncClient
+
+    def client(**kw: Any) -> httpx.Client:
+        srv.connections += 1
+        return real(transport=httpx.MockTransport(srv), **kw)
+
+    def async_client(**kw: Any) -> httpx.AsyncClient:
+        srv.connections += 1
+        return real_async(transport=httpx.MockTransport(srv), **kw)
+
+    monkeypatch.setattr(git_client.httpx, "Client", client)
+    monkeypatch.setattr(git_client.httpx, "AsyncClient", async_client)
+    return srv
+
+
+@pytest.fixture()
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    (root / "a.txt").write_text("a\n")
+    _git(root, "add", "a.txt")
+    _git(root, "commit", "-q", "-m", "init")
+    _git(root, "remote", "add", "origin", "git@github.com:org/repo.git")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    monkeypatch.chdir(root)
+    return root
+
+
+def test_pr_prepare_is_one_request(server: _Server, repo: Path) -> None:
+    with GitMCPClient("http://mcp") as client:
+        out = client.pr_prepare(message="Title\n\nBody", branch="feat/x", remote="origin", paths=["a.txt"], gitignore=["out/"])
+        assert out == {"is_repo": True, "commit": "abc123", "url": "https://example.com/pr/feat/x"}
+        assert client.requests == 1 and server.ops == ["ensure_gitignore", "add", "commit", "push", "pr_link"]
+        client.repo_detect()
+        assert server.connections == 1  # later calls reuse the pooled connection
+    assert _git(repo, "rev-parse", "--abbrev-ref", "HEAD") == "feat/x"  # branch switch stays local
+
+
+def test_batch_falls_back_per_op_and_locally(server: _Server, repo: Path) -> None:
+    server.batch = False
+    client = GitMCPClient("http://mcp")
+    assert [r["ok"] for r in client.batch([("add", {"paths": ["a"]}), ("push", {})])] == [True, True]
+    assert not client.batch_supported and client.requests == 3
+    client.batch([("add", {"paths": ["a"]})])
+    assert client.requests == 4  # not asked to batch again
+
+    # A remote commit failure stops the batch; the commit is made locally and the rest retried per op
+    server.batch, server.fail, server.ops = True, ("commit",), []
+    (repo / "b.txt").write_text("b\n")
+    _git(repo, "add", "b.txt")
+    client = GitMCPClient("http://mcp")
+    out = client.pr_prepare(message="Add b", branch="feat/b", remote="origin")
+    assert out["commit"] == _git(repo, "rev-parse", "HEAD")
+    assert server.ops == ["commit", "push", "pr_link"] and out["url"].endswith("feat/b")
+    client.close()
+
+
+def test_async_client_batches(server: _Server) -> None:
+    async def run() -> List[Dict[str, Any]]:
+        async with AsyncGitMCPClient("http://mcp") as client:
+            results = await client.batch([("repo_detect", {}), ("commit", {"message": "m"})])
+            assert client.requests == 1
+            return results
+
+    results = asyncio.run(run())
+    assert results[1]["data"]["hash"] == "abc123"
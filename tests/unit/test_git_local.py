@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from actcli.git import local as git_local
+from actcli.git.local import LocalGit
+from actcli.git.repo_state import RepoStateCache, _CACHE, parse_config
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "-c", "init.defaultBranch=main", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    (root / "a.txt").write_text("a\n")
+    _git(root, "add", "a.txt")
+    _git(root, "commit", "-q", "-m", "init")
+    _git(root, "remote", "add", "origin", "git@github.com:org/repo.git")
+    _git(root, "remote", "add", "upstream", "https://gitlab.com/org/repo.git")
+    _git(root, "update-ref", "refs/remotes/origin/trunk", "HEAD")
+    _git(root, "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/trunk")
+    _CACHE.invalidate()
+    return root
+
+
+def _same(g: LocalGit) -> None:
+    assert g.detect() == g._detect_with_git()
+
+
+def test_detect_matches_git_without_forking(repo: Path) -> None:
+    g = LocalGit(str(repo / "."))
+    before = git_local.GIT_CALLS
+    info = g.detect()
+    assert git_local.GIT_CALLS == before
+    assert info.root == str(repo.resolve()) and info.branch == "main" and info.default_branch == "trunk"
+    assert info.remotes == {"origin": "git@github.com:org/repo.git", "upstream": "https://gitlab.com/org/repo.git"}
+    _same(g)
+    (repo / "sub").mkdir()
+    _same(LocalGit(str(repo / "sub")))
+    assert g.head() == _git(repo, "rev-parse", "HEAD")
+
+
+def test_packed_refs_detached_head_and_branch_switch(repo: Path) -> None:
+    g = LocalGit(str(repo))
+    _git(repo, "pack-refs", "--all")
+    assert not (repo / ".git/refs/heads/main").exists()
+    _same(g)
+    assert g.head() == _git(repo, "rev-parse", "HEAD")
+
+    _git(repo, "checkout", "-q", "-b", "feature/x")
+    assert g.detect().branch == "feature/x"  # HEAD changed: cache re-read
+    _git(repo, "checkout", "-q", "--detach")
+    assert g.detect().branch == "HEAD"
+    _same(g)
+
+
+def test_cache_rereads_only_on_change(repo: Path) -> None:
+    cache = RepoStateCache()
+    first = cache.get(str(repo))
+    assert cache.get(str(repo)) is first and cache.reads == 1
+    (repo / "b.txt").write_text("b\n")
+    _git(repo, "add", "b.txt")
+    _git(repo, "commit", "-q", "-m", "second")  # moves refs/heads/main
+    second = cache.get(str(repo))
+    assert cache.reads == 2 and second.head != first.head
+
+
+def test_worktree_and_fallbacks(repo: Path, tmp_path: Path) -> None:
+    wt = tmp_path / "wt"
+    _git(repo, "worktree", "add", "-q", "-b", "side", str(wt))
+    _same(LocalGit(str(wt)))
+    assert LocalGit(str(wt)).detect().branch == "side"
+
+    outside = tmp_path / "plain"
+    outside.mkdir()
+    _same(LocalGit(str(outside)))
+
+    # insteadOf rewrites are left to git
+    _git(repo, "config", "url.https://github.com/.insteadOf", "gh:")
+    _CACHE.invalidate()
+    before = git_local.GIT_CALLS
+    _same(LocalGit(str(repo)))
+    assert git_local.GIT_CALLS > before
+
+
+def test_parse_config() -> None:
+    cfg = parse_config('[core]\n\tbare = false\n# c\n[remote "origin"]\n\turl = "x.git"\n\turl = y.git\n[Remote "Up"]\nurl=z\n')
+    assert cfg["core"] == {"bare": "false"}
+    assert cfg["remote.origin"]["url"] == "x.git" and cfg["remote.Up"]["url"] == "z"
+
+
+def test_object_reader_reads_without_forking_per_query(repo: Path) -> None:
+    (repo / "dir").mkdir()
+    (repo / "dir" / "b c.txt").write_text("spaced\n")
+    (repo / "bin.dat").write_bytes(bytes(range(256)))
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "more\n\nbody")
+    g = LocalGit(str(repo))
+    try:
+        commit = g.read_commit()
+        assert commit is not None and commit.message.startswith("more") and len(commit.parents) == 1
+        names = {e.name: e for e in g.read_tree("HEAD") or []}
+        assert names["dir"].type == "tree" and names["a.txt"].type == "blob"
+        assert g.read_blob("HEAD:dir/b c.txt") == b"spaced\n"
+        assert g.read_blob("HEAD:bin.dat") == bytes(range(256))
+        assert g.read_blob("HEAD:missing.txt") is None and g.read_tree("HEAD:a.txt") is None
+
+        before = git_local.GIT_CALLS
+        # Large enough to be pipelined through the writer thread
+        revs = ["HEAD:a.txt", "HEAD:dir/b c.txt", "HEAD~1:a.txt", "nope"] * 2000
+        objs = g.objects.objects(revs)
+        assert [o.data if o else None for o in objs[:4]] == [b"a\n", b"spaced\n", b"a\n", None]
+        assert len(objs) == len(revs) and git_local.GIT_CALLS == before
+        info = g.objects.info(["HEAD", "HEAD:dir"])
+        assert [i.type for i in info] == ["commit", "tree"]
+
+        # A dead helper is restarted transparently
+        g.objects._batch._proc.kill()
+        assert g.read_blob("HEAD:a.txt") == b"a\n"
+        assert g.objects._batch.starts == 2
+    finally:
+        g.close()
+
+
+def test_status_porcelain_v2_paths_and_renames(repo: Path) -> None:
+    (repo / "keep.txt").write_text("keep\n" * 20)
+    _git(repo, "add", "keep.txt")
+    _git(repo, "commit", "-q", "-m", "keep")
+    (repo / "a.txt").write_text("changed\n")
+    _git(repo, "mv", "keep.txt", "moved file.txt")
+    (repo / "new dir").mkdir()
+    (repo / "new dir" / "x y.txt").write_text("x\n")
+    (repo / "tab\there.txt").write_text("t\n")
+    st = LocalGit(str(repo)).status()
+    assert st["branch"] == "main"
+    assert st["changed"] == ["a.txt"] and st["staged"] == ["moved file.txt"]
+    assert st["renamed"] == [{"from": "keep.txt", "to": "moved file.txt"}]
+    assert st["untracked"] == ["new dir/", "tab\there.txt"]
+
+
+def test_status_incremental_rechecks_touched_paths_only(repo: Path) -> None:
+    from actcli.git.status import StatusTracker
+
+    (repo / "b.txt").write_text("b\n")
+    _git(repo, "add", "b.txt")
+    _git(repo, "commit", "-q", "-m", "b")
+    t = StatusTracker(str(repo))
+    assert t.refresh().entries == {}
+    (repo / "a.txt").write_text("edited\n")
+    (repo / "c.txt").write_text("c\n")
+    res = t.refresh(touched=[str(repo / "a.txt"), "c.txt"])
+    assert sorted(res.entries) == ["a.txt", "c.txt"] and t.full_runs == 1 and t.incremental_runs == 1
+    # Untouched edits are not seen until a full refresh...
+    (repo / "b.txt").write_text("silent\n")
+    (repo / "a.txt").write_text("a\n")  # reverted: rechecked because it was dirty
+    assert sorted(t.refresh(touched=["c.txt"]).entries) == ["c.txt"]
+    assert sorted(t.refresh().entries) == ["b.txt", "c.txt"] and t.full_runs == 2
+    # ...and index changes or .gitignore edits force one
+    _git(repo, "add", "c.txt")
+    assert t.refresh(touched=["c.txt"]).entries["c.txt"].staged and t.full_runs == 3
+    t.refresh(touched=[".gitignore"])
+    assert t.full_runs == 4
+
+
+def test_parse_v2_streams_records() -> None:
+    import io
+
+    from actcli.git.status import iter_records, parse_v2
+
+    raw = (
+        b"# branch.oid (initial)\0# branch.head (detached)\0# branch.ab +2 -1\0"
+        b"1 .M N... 100644 100644 100644 aaa aaa sp ace.txt\0"
+        b"2 R. N... 100644 100644 100644 aaa aaa R100 new\nline\0old\0"
+        b"u UU N... 100644 100644 100644 100644 aaa bbb ccc both.txt\0? \xff.bin\0"
+    )
+    res = parse_v2(iter_records(io.BytesIO(raw), size=7))
+    assert res.branch == "HEAD" and res.oid is None and (res.ahead, res.behind) == (2, 1)
+    d = res.as_dict()
+    assert d["changed"] == ["sp ace.txt"] and d["staged"] == ["new\nline"] and d["conflicted"] == ["both.txt"]
+    assert d["renamed"] == [{"from": "old", "to": "new\nline"}]
+    assert d["untracked"] == ["\udcff.bin"]
+
+
+def test_status_failure_raises_and_is_not_cached(repo: Path, tmp_path: Path) -> None:
+    from actcli.git.status import StatusError, StatusTracker
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    with pytest.raises(StatusError, match="not a git repository"):
+        StatusTracker(str(outside)).refresh()
+    t = StatusTracker(str(repo))
+    (repo / "a.txt").write_text("edited\n")
+    assert sorted(t.refresh().entries) == ["a.txt"]
+    (repo / ".git" / "index").write_bytes(b"corrupt")
+    with pytest.raises(StatusError):
+        t.refresh(touched=["a.txt"])
+    assert t._result is None
+    with pytest.raises(StatusError):
+        t.refresh(touched=["a.txt"])
+    assert t.full_runs == 3 and t.incremental_runs == 0
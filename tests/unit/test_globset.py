@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from actcli.globset import GlobSet
+from actcli.policy import Policy
+
+
+def test_glob_semantics() -> None:
+    g = GlobSet(["./out/**", "*.md", "data/**/raw_?.csv", "src/[!_]*.py"])
+    assert g.matches("out/a.txt") and g.matches("./out/x/y/z.bin")
+    assert not g.matches("out")
+    assert g.matches("README.md") and not g.matches("docs/README.md")  # * stays in one segment
+    assert g.matches("data/raw_1.csv") and g.matches("data/2024/q1/raw_2.csv")
+    assert not g.matches("data/raw_10.csv")
+    assert g.matches("src/cli.py") and not g.matches("src/_private.py")
+    assert GlobSet(["./**"]).matches("any/depth/file")
+    assert not GlobSet([]).matches("x")
+
+
+def test_directory_pruning_and_walk(tmp_path: Path) -> None:
+    g = GlobSet(["out/**", "data/**/*.csv", "notes/*.md"])
+    assert g.may_contain("") and g.may_contain("out") and g.may_contain("data/a/b")
+    assert g.may_contain("notes") and not g.may_contain("notes/sub")
+    assert not g.may_contain("node_modules") and not g.may_contain("src")
+
+    for rel in ["out/r.txt", "data/x/y.csv", "data/x/y.txt", "notes/a.md", "notes/sub/b.md", "src/m.py", "node_modules/p/i.js"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x", encoding="utf-8")
+    assert sorted(g.walk(tmp_path)) == ["data/x/y.csv", "notes/a.md", "out/r.txt"]
+
+    policy = Policy(read=["./data/**"], write=["./out/**"])
+    assert [p.name for p in policy.readable_files(tmp_path)] == ["y.csv", "y.txt"]
+    assert policy.can_write(tmp_path / "out" / "r.txt", root=tmp_path)
+    assert not policy.can_read(tmp_path / "src" / "m.py", root=tmp_path)
+    assert not policy.can_read(tmp_path.parent, root=tmp_path)  # outside root
+    policy.allow_read("./src/*.py")
+    assert policy.can_read(tmp_path / "src" / "m.py", root=tmp_path)
+
+
+def _corpus() -> tuple[list[str], list[str]]:
+    globs = ["./out/**", "./data/**/*.csv", "./docs/**/*.md", "./src/**/*.py", "./tests/**"]
+    roots = ("src", "data", "vendor", "docs")
+    paths = [f"{roots[i % 4]}/mod{i}/file{i}.{('py', 'csv', 'md', 'txt')[i % 3]}" for i in range(20000)]
+    return globs, paths
+
+
+def test_compiled_matcher_agrees_with_fnmatch() -> None:
+    globs, paths = _corpus()
+    legacy = [p for p in paths if any(fnmatch.fnmatch("./" + p, g) for g in globs)]
+    g = GlobSet(globs)
+    # Same decisions here: no glob relies on fnmatch's `*` crossing `/`
+    assert g.filter(paths) == legacy and 0 < len(legacy) < len(paths)
+    assert g.filter(paths) == legacy  # cached decisions
+
+
+@pytest.mark.skipif(not os.environ.get("ACTCLI_BENCH"), reason="timing benchmark; set ACTCLI_BENCH=1")
+def test_compiled_matcher_beats_fnmatch_loop() -> None:
+    globs, paths = _corpus()
+    start = time.perf_counter()
+    [p for p in paths if any(fnmatch.fnmatch("./" + p, g) for g in globs)]
+    legacy_s = time.perf_counter() - start
+
+    g = GlobSet(globs)
+    start = time.perf_counter()
+    g.filter(paths)
+    cold_s = time.perf_counter() - start
+    start = time.perf_counter()
+    g.filter(paths)
+    warm_s = time.perf_counter() - start
+
+    assert cold_s < legacy_s
+    assert len(paths) / warm_s > 1_000_000 * 0.25  # cached decisions
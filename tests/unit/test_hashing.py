@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from actcli.hashing import FileHasher, HashCache, sha256_file
+from actcli.transcript import write_audit_json
+
+
+def test_sha256_file_matches_hashlib(tmp_path: Path) -> None:
+    data = os.urandom(3 * 1024 + 7)
+    f = tmp_path / "triangles.csv"
+    f.write_bytes(data)
+    assert sha256_file(f, chunk_size=1024) == hashlib.sha256(data).hexdigest()
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    assert sha256_file(empty) == hashlib.sha256(b"").hexdigest()
+
+
+def test_hasher_uses_persistent_cache(tmp_path: Path) -> None:
+    f = tmp_path / "claims.csv"
+    f.write_text("a,b\n1,2\n", encoding="utf-8")
+    cache_path = tmp_path / "cache.db"
+
+    h1 = FileHasher(HashCache(cache_path))
+    d1 = h1.hash_file(f)
+    assert h1.hashed == 1
+
+    # New process-equivalent: fresh cache object, same db file → no re-read
+    h2 = FileHasher(HashCache(cache_path))
+    assert h2.hash_file(f) == d1
+    assert h2.hashed == 0
+
+    # Content change invalidates via size/mtime
+    f.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+    d3 = h2.hash_file(f)
+    assert h2.hashed == 1 and d3.sha256 != d1.sha256
+
+
+def test_audit_lists_attachments(tmp_path: Path) -> None:
+    f = tmp_path / "triangles.csv"
+    f.write_text("1,2,3\n", encoding="utf-8")
+    audit = tmp_path / "audit.json"
+    write_audit_json(audit, prompt="P", results=[], attachments=[str(f)], hasher=FileHasher(HashCache(tmp_path / "c.db")))
+    att = json.loads(audit.read_text())["attachments"]
+    assert att == [{"path": str(f), "sha256": hashlib.sha256(b"1,2,3\n").hexdigest(), "size": 6}]
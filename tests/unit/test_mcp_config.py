@@ -54,3 +54,37 @@ log = false
     assert "[servers.a]" in text and "[servers.b]" in text
     assert "url = \"http://project-b\"" in text
 
+
+def _fresh_config(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setattr("pathlib.Path.cwd", staticmethod(lambda: tmp_path))
+    return importlib.reload(importlib.import_module("actcli.mcp.config"))
+
+
+def test_stdio_server_round_trip(tmp_path: Path, monkeypatch) -> None:
+    mod = _fresh_config(tmp_path, monkeypatch)
+    # stdio servers round-trip their launch command; http ones keep their URL
+    cfg = mod.MCPConfig(servers={
+        "a": mod.MCPServer(name="a", url="http://project-a"),
+        "c": mod.MCPServer(name="c", url="", command='python -m srv --name "x y"'),
+    })
+    mod.save_project_mcp_config(cfg)
+    again = mod.load_mcp_config().servers["c"]
+    assert again.command == 'python -m srv --name "x y"' and again.transport == "stdio"
+    assert mod.load_mcp_config().servers["a"].transport == "http"
+
+
+def test_cache_settings_round_trip(tmp_path: Path, monkeypatch) -> None:
+    mod = _fresh_config(tmp_path, monkeypatch)
+    # cache settings round-trip; defaults are not written out
+    cfg = mod.MCPConfig(servers={
+        "a": mod.MCPServer(name="a", url="http://project-a"),
+        "b": mod.MCPServer(name="b", url="http://project-b"),
+        "c": mod.MCPServer(name="c", url="", command="srv", read_only=["ls", "docs/search"], cache_ttl_s=30),
+    })
+    mod.save_project_mcp_config(cfg)
+    again = mod.load_mcp_config().servers
+    assert again["c"].read_only == ["ls", "docs/search"] and again["c"].cache_ttl_s == 30
+    assert again["a"].read_only == [] and again["a"].cache_ttl_s == mod.CACHE_TTL_S
+    section_b = mod.get_project_file().read_text().split("[servers.b]")[1].split("[servers.")[0]
+    assert "cache_ttl_s" not in section_b and "read_only" not in section_b
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import shlex
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from actcli.mcp import health
+from actcli.mcp.config import MCPServer
+from actcli.mcp.health import HealthMonitor, ProbeResult, ServerHealth, probe_all
+
+
+# Answers /health after a delay per host; "down" hosts refuse connections
+def _handler(request: httpx.Request) -> httpx.Response:
+    host = request.url.host
+    if host == "down":
+        raise httpx.ConnectError("connection refused", request=request)
+    time.sleep(0.2)
+    if host == "nohealth" and request.url.path == "/health":
+        return httpx.Response(404)
+    return httpx.Response(200 if request.method == "GET" else 204)
+
+
+@pytest.fixture(autouse=True)
+def mock_http(monkeypatch) -> None:
+    real = httpx.AsyncClient
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return await asyncio.to_thread(_handler, request)
+
+    monkeypatch.setattr(health.httpx, "AsyncClient", lambda **kw: real(transport=httpx.MockTransport(handler), **kw))
+
+
+STDIO_SERVER = r'''
+import json, sys
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg.get("method") == "initialize":
+        print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": {"serverInfo": {"name": "fake"}}}), flush=True)
+'''
+
+
+def test_probe_all_runs_concurrently(tmp_path: Path) -> None:
+    script = tmp_path / "server.py"
+    script.write_text(STDIO_SERVER)
+    servers = [MCPServer(name=f"s{i}", url=f"http://ok{i}") for i in range(5)]
+    servers += [
+        MCPServer(name="nohealth", url="http://nohealth"),
+        MCPServer(name="down", url="http://down"),
+        MCPServer(name="stdio", url="", command=f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"),
+        MCPServer(name="missing", url="", command="/nonexistent/mcp-server"),
+    ]
+    start = time.perf_counter()
+    results = {r.name: r for r in asyncio.run(probe_all(servers, timeout_s=5))}
+    assert time.perf_counter() - start < 1.5  # five 0.2 s probes (plus a 0.4 s one) overlap
+    assert all(results[f"s{i}"].ok and results[f"s{i}"].detail == "healthy" for i in range(5))
+    assert results["nohealth"].ok and results["nohealth"].detail == "reachable (204)"
+    assert not results["down"].ok and "refused" in results["down"].detail
+    assert results["stdio"].ok and not results["missing"].ok
+
+
+def test_server_health_percentiles() -> None:
+    h = ServerHealth("a")
+    for ms in range(1, 101):
+        h.record(ProbeResult("a", True, float(ms), "healthy"))
+    assert (h.percentile(50), h.percentile(95)) == (50.0, 95.0)
+    h.record(ProbeResult("a", False, 1.0, "unreachable: x"))
+    h.record(ProbeResult("a", False, 1.0, "unreachable: x"))
+    assert h.up is False and h.failures == 2 and h.summary() == "down (unreachable: x)"
+    assert len(h.latencies) == 100  # failures are not latency samples
+
+
+def test_monitor_marks_down_servers() -> None:
+    servers = {
+        "up": MCPServer(name="up", url="http://ok"),
+        "down": MCPServer(name="down", url="http://down/"),
+        "off": MCPServer(name="off", url="http://down", enabled=False),
+    }
+    monitor = HealthMonitor(servers, interval_s=0.05, timeout_s=1).start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(monitor.snapshot().get("up", ServerHealth("up")).latencies) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        snap = monitor.snapshot()
+        assert set(snap) == {"up", "down"} and snap["up"].up and len(snap["up"].latencies) >= 2
+        assert monitor.is_down("down") and not monitor.is_down("up") and not monitor.is_down("unknown")
+    finally:
+        monitor.stop()
+    assert monitor._thread is None
+
+
+def test_mcp_test_all_cli(tmp_path: Path, monkeypatch) -> None:
+    from typer.testing import CliRunner
+
+    from actcli.cli import app
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(app, ["mcp", "add", "good", "--url", "http://ok"]).exit_code == 0
+    r = runner.invoke(app, ["mcp", "test", "--all"])
+    assert r.exit_code == 0 and "good" in r.output and "healthy" in r.output
+    assert runner.invoke(app, ["mcp", "add", "bad", "--url", "http://down"]).exit_code == 0
+    r = runner.invoke(app, ["mcp", "test", "--all"])
+    assert r.exit_code == 1 and "unreachable" in r.output
+
+
+def test_monitor_pings_stdio_servers_over_the_shared_session(tmp_path: Path, monkeypatch) -> None:
+    from actcli.mcp.stdio import MCPError, SessionManager
+
+    script = tmp_path / "server.py"
+    script.write_text(STDIO_SERVER.replace(
+        'if msg.get("method") == "initialize":',
+        'if msg.get("method") == "ping":\n        print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": {}}), flush=True)\n'
+        '    if msg.get("method") == "initialize":',
+    ))
+    servers = {
+        "stdio": MCPServer(name="stdio", url="", command=f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"),
+        "gone": MCPServer(name="gone", url="", command="/nonexistent/mcp-server"),
+    }
+    sessions = SessionManager(servers)
+    monitor = HealthMonitor(servers, timeout_s=5, sessions=sessions)
+    try:
+        assert monitor.check_now()["stdio"].up
+        assert sessions.live("stdio") is None  # probed by handshake, not left running
+        pid = sessions.get("stdio")._proc.pid
+        assert monitor.check_now()["stdio"].up and sessions.get("stdio")._proc.pid == pid  # pinged, no new process
+
+        # A tool call to a server the monitor saw down fails at once instead of waiting out the timeout
+        monkeypatch.setattr(health, "_MONITOR", monitor)
+        with pytest.raises(MCPError, match="down"):
+            sessions.call_tool("gone", "anything")
+        assert sessions.live("gone") is None
+    finally:
+        sessions.close_all()
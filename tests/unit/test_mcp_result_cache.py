@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import shlex
+import sys
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from actcli.mcp import git_client, result_cache
+from actcli.mcp.config import MCPConfig, MCPServer, save_project_mcp_config
+from actcli.mcp.result_cache import ResultCache
+from actcli.mcp.stdio import SessionManager
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(result_cache, "_CACHES", {})
+
+
+def test_ttl_bounds_and_invalidation(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ResultCache("s", ttl_s=10, max_entries=2)
+    calls: List[str] = []
+
+    def fetch(v):
+        return lambda: calls.append(v) or {"ok": True, "v": v}
+
+    assert cache.call("ls", {"p": 1}, fetch("a"), read_only=True)["v"] == "a"
+    got = cache.call("ls", {"p": 1}, fetch("b"), read_only=True)
+    got["v"] = "mutated by caller"
+    assert cache.call("ls", {"p": 1}, fetch("c"), read_only=True)["v"] == "a" and calls == ["a"]
+
+    now[0] += 11  # expired
+    assert cache.call("ls", {"p": 1}, fetch("d"), read_only=True)["v"] == "d"
+
+    cache.call("ls", {"p": 2}, fetch("e"), read_only=True)
+    cache.call("ls", {"p": 3}, fetch("f"), read_only=True)
+    assert len(cache) == 2 and cache.stats.evictions == 1  # p=1, least recently used, went first
+
+    cache.call("ls", {"p": 4}, lambda: {"ok": False}, read_only=True, cacheable=lambda r: r["ok"])
+    assert len(cache) == 2  # failures are not kept
+
+    with pytest.raises(RuntimeError):
+        cache.call("write", {}, lambda: (_ for _ in ()).throw(RuntimeError("partial")), read_only=False)
+    assert len(cache) == 0 and cache.stats.invalidations == 1
+    assert (cache.stats.hits, cache.stats.misses) == (2, 5)
+
+    small = ResultCache("t", max_bytes=200)
+    small.put("big", {}, {"blob": "x" * 500})
+    assert len(small) == 0
+
+
+def test_git_client_serves_repeat_reads_from_memory(monkeypatch) -> None:
+    save_project_mcp_config(MCPConfig(servers={"git": MCPServer(name="git", url="http://mcp", read_only=["repo_detect"])}))
+    ops: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ops.append(json.loads(request.content)["op"])
+        return httpx.Response(200, json={"ok": True, "data": {"n": len(ops)}})
+
+    real = httpx.Client
+    monkeypatch.setattr(git_client.httpx, "Client", lambda **kw: real(transport=httpx.MockTransport(handler), **kw))
+    with git_client.GitMCPClient("http://mcp") as client:
+        assert client.repo_detect() == client.repo_detect()
+    with git_client.GitMCPClient("http://mcp") as other:  # the cache is per server, not per client
+        other.repo_detect()
+        other.add(["a.txt"])  # mutating: the next read goes to the server
+        other.repo_detect()
+    assert ops == ["repo_detect", "add", "repo_detect"]
+    stats = result_cache.cache_stats()["git"]
+    assert (stats.hits, stats.misses) == (2, 2)
+
+    # Counters survive the process for `actcli mcp list`
+    result_cache.save_stats()
+    monkeypatch.setattr(result_cache, "_CACHES", {})
+    from actcli.cli import app
+
+    r = CliRunner().invoke(app, ["mcp", "list"])
+    assert r.exit_code == 0 and "2 hits / 2 misses" in r.output
+
+
+SERVER = r'''
+import json, sys
+count = 0
+tools = [{"name": "docs", "annotations": {"readOnlyHint": True}}, {"name": "ls"}, {"name": "write"}]
+for line in sys.stdin:
+    msg = json.loads(line)
+    rid, method = msg.get("id"), msg.get("method")
+    if rid is None:
+        continue
+    if method == "tools/list":
+        result = {"tools": tools}
+    elif method == "tools/call":
+        count += 1
+        result = {"content": [{"type": "text", "text": str(count)}]}
+    else:
+        result = {}
+    print(json.dumps({"jsonrpc": "2.0", "id": rid, "result": result}), flush=True)
+'''
+
+
+def test_session_manager_caches_read_only_tools(tmp_path: Path) -> None:
+    script = tmp_path / "server.py"
+    script.write_text(SERVER)
+    command = f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"
+    mgr = SessionManager({"fs": MCPServer(name="fs", url="", command=command, read_only=["ls"])})
+
+    def text(tool: str, **args) -> str:
+        return mgr.call_tool("fs", tool, args)["content"][0]["text"]
+
+    try:
+        assert text("docs", q="x") == text("docs", q="x") == "1"  # readOnlyHint from tool metadata
+        assert text("ls") == text("ls") == "2"  # read_only from config
+        assert text("docs", q="y") == "3"  # different params, different entry
+        assert text("write") == "4" and text("write") == "5"  # never cached...
+        assert text("docs", q="x") == "6"  # ...and it invalidates reads
+    finally:
+        mgr.close_all()
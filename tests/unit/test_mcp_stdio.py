@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import shlex
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from actcli.mcp.config import MCPServer
+from actcli.mcp.stdio import MCPError, SessionManager, StdioSession
+
+
+# Minimal stdio MCP server: replies out of order (tools/call sleeps in a thread) and counts tools/list
+SERVER = r'''
+import json, sys, threading, time
+lock = threading.Lock()
+lists = 0
+
+def send(msg):
+    with lock:
+        sys.stdout.write(json.dumps(msg) + "\n")
+        sys.stdout.flush()
+
+def call(rid, args):
+    time.sleep(args.get("sleep", 0))
+    if args.get("fail"):
+        send({"jsonrpc": "2.0", "id": rid, "error": {"code": -32000, "message": "boom"}})
+    else:
+        send({"jsonrpc": "2.0", "id": rid, "result": {"content": [{"type": "text", "text": str(args.get("n"))}]}})
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    rid, method = msg.get("id"), msg.get("method")
+    if method == "initialize":
+        send({"jsonrpc": "2.0", "id": rid, "result": {"protocolVersion": "2024-11-05", "capabilities": {"tools": {}}, "serverInfo": {"name": "fake"}}})
+        send({"jsonrpc": "2.0", "id": 99, "method": "ping"})
+    elif method == "tools/list":
+        lists += 1
+        send({"jsonrpc": "2.0", "id": rid, "result": {"tools": [{"name": "echo", "lists": lists}]}})
+    elif method == "tools/call":
+        if msg["params"]["name"] == "exit":
+            sys.exit(0)
+        if msg["params"]["name"] == "changed":
+            send({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+            send({"jsonrpc": "2.0", "id": rid, "result": {}})
+            continue
+        threading.Thread(target=call, args=(rid, msg["params"]["arguments"])).start()
+'''
+
+
+@pytest.fixture()
+def command(tmp_path: Path) -> str:
+    script = tmp_path / "server.py"
+    script.write_text(SERVER)
+    return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"
+
+
+def test_concurrent_calls_multiplex_over_one_pipe(command: str) -> None:
+    session = StdioSession.from_server(MCPServer(name="fake", url="", command=command)).start()
+    try:
+        assert session.server_info["name"] == "fake"
+        results = {}
+
+        def worker(n: int) -> None:
+            results[n] = session.call_tool("echo", {"n": n, "sleep": 0.2})["content"][0]["text"]
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == {n: str(n) for n in range(10)}
+        assert time.perf_counter() - start < 1.5  # in parallel, not 10 x 0.2 s in turn
+
+        with pytest.raises(MCPError, match="boom"):
+            session.call_tool("echo", {"fail": True})
+
+        async def both():
+            return await asyncio.gather(session.acall_tool("echo", {"n": 1}), session.acall_tool("echo", {"n": 2}))
+
+        assert [r["content"][0]["text"] for r in asyncio.run(both())] == ["1", "2"]
+
+        # tools/list is cached until the server announces a change
+        assert session.list_tools()[0]["lists"] == 1 and session.list_tools()[0]["lists"] == 1
+        session.call_tool("changed")
+        time.sleep(0.05)
+        assert session.list_tools()[0]["lists"] == 2
+    finally:
+        session.close()
+    assert not session.alive
+
+
+def test_manager_restarts_dead_servers_within_budget(command: str) -> None:
+    servers = {"fake": MCPServer(name="fake", url="", command=command), "web": MCPServer(name="web", url="http://x")}
+    mgr = SessionManager(servers, max_restarts=1, window_s=60)
+    try:
+        first = mgr.get("fake")
+        assert mgr.get("fake") is first
+        with pytest.raises(MCPError, match="exited"):
+            first.call_tool("exit")
+        first._proc.wait(timeout=5)
+        assert mgr.call_tool("fake", "echo", {"n": 5})["content"][0]["text"] == "5"  # restarted
+        proc = mgr.get("fake")._proc
+        proc.kill()
+        proc.wait(timeout=5)
+        with pytest.raises(MCPError, match="keeps exiting"):
+            mgr.get("fake")
+        assert mgr.restart("fake").alive  # an explicit restart resets the budget
+        with pytest.raises(MCPError, match="not a stdio server"):
+            mgr.get("web")
+    finally:
+        mgr.close_all()
+
+
+def test_mcp_commands_share_the_process_wide_manager(command: str, tmp_path: Path, monkeypatch) -> None:
+    from typer.testing import CliRunner
+
+    from actcli.cli import app
+    from actcli.mcp import stdio
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(stdio, "_MANAGER", None)
+    runner = CliRunner()
+    assert runner.invoke(app, ["mcp", "add", "fake", "--command", command]).exit_code == 0
+    try:
+        r = runner.invoke(app, ["mcp", "test", "fake"])
+        assert r.exit_code == 0 and "healthy (fake, 1 tools)" in r.output
+        pid = stdio.session_manager().get("fake")._proc.pid
+        runner.invoke(app, ["mcp", "test", "fake"])
+        assert stdio.session_manager().get("fake")._proc.pid == pid  # reused, not re-spawned
+        assert "healthy" in runner.invoke(app, ["mcp", "restart", "fake"]).output
+        assert stdio.session_manager().get("fake")._proc.pid != pid
+    finally:
+        stdio.session_manager().close_all()
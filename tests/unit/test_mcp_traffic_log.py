@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import httpx
+
+from actcli.mcp import git_client, result_cache, traffic_log
+from actcli.mcp.config import MCPConfig, MCPServer, save_project_mcp_config
+from actcli.mcp.traffic_log import TrafficLog
+
+
+def _lines(path: Path) -> list:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_appends_rotates_compresses_and_prunes(tmp_path: Path) -> None:
+    log = TrafficLog("git", directory=tmp_path, max_bytes=400, keep=2)
+    for i in range(30):
+        log.record("repo_detect", {"i": i}, {"ok": True}, elapsed_ms=1.5)
+    log.close()
+    segments = log.segments()
+    assert len(segments) == 2 and all(p.name.endswith(".jsonl.gz") for p in segments)
+    kept = [r for p in segments for r in _lines(p)] + _lines(log.path)
+    assert [r["params"]["i"] for r in kept] == list(range(30))[-len(kept):]  # newest history, in order
+    assert log.path.stat().st_size <= 400 and kept[-1]["elapsed_ms"] == 1.5
+
+    # A new logger (next process) appends to the active segment instead of overwriting it
+    before = len(_lines(log.path))
+    again = TrafficLog("git", directory=tmp_path, keep=2)
+    again.record("push", {}, {"ok": True})
+    again.close()
+    assert len(_lines(log.path)) == before + 1
+
+    # Another server whose name starts with ours is not one of our segments
+    (tmp_path / "git-mcp.jsonl").write_text("{}\n")
+    assert all("mcp" not in p.name for p in again.segments())
+
+
+def test_sampling_keeps_failures_and_age_rotation(tmp_path: Path) -> None:
+    log = TrafficLog("docs", directory=tmp_path, sample=0.0, compress=False)
+    for _ in range(20):
+        log.record("lookup", {}, {"ok": True})
+    log.record("lookup", {"q": "x"}, error="boom")
+    log.flush()
+    assert [r["error"] for r in _lines(log.path)] == ["boom"] and _lines(log.path)[0]["sample"] == 0.0
+
+    log.max_age_s = 0  # the segment is now "old": the next record starts a new one
+    log.record("lookup", {}, error="again")
+    log.close()
+    assert [p.suffix for p in log.segments()] == [".jsonl"]
+    assert [r["error"] for r in _lines(log.path)] == ["again"]
+
+
+def test_client_logs_each_call(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setenv("ACTCLI_MCP_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(traffic_log, "_LOGS", {})
+    monkeypatch.setattr(result_cache, "_CACHES", {})
+    save_project_mcp_config(MCPConfig(servers={"git": MCPServer(name="git", url="http://mcp", log=True)}))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        op = json.loads(request.content)["op"]
+        return httpx.Response(500) if op == "push" else httpx.Response(200, json={"ok": True, "data": {"op": op}})
+
+    real = httpx.Client
+    monkeypatch.setattr(git_client.httpx, "Client", lambda **kw: real(transport=httpx.MockTransport(handler), **kw))
+    with git_client.GitMCPClient("http://mcp/") as client:
+        client.repo_detect()
+        client._post("add", {"paths": ["a"]})
+        try:
+            client._post("push", {})
+        except httpx.HTTPStatusError:
+            pass
+    log = traffic_log.traffic_log("git")
+    log.close()
+    records = _lines(tmp_path / "logs" / "git.jsonl")
+    assert [r["op"] for r in records] == ["repo_detect", "add", "push"]  # history kept, not overwritten
+    assert records[1]["response"]["data"]["op"] == "add" and "500" in records[2]["error"]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from typing import Any, Dict, Iterable, List, Optional
 
+import httpx
 
 from actcli.commands import models as models_cmd
 
@@ -19,7 +22,8 @@ class _FakeResp:
 
     def raise_for_status(self) -> None:
         if self.status_code // 100 != 2:
-            raise AssertionError(f"status {self.status_code}")
+            request = httpx.Request("POST", "http://host/api/pull")
+            raise httpx.HTTPStatusError(f"status {self.status_code}", request=request, response=httpx.Response(self.status_code, request=request))
 
     # Streaming context manager API
     def __enter__(self):
@@ -72,3 +76,112 @@ def test_pull_models_stream_progress(monkeypatch, capsys) -> None:
     out = capsys.readouterr().out
     assert "Pulling" in out
 
+
+class _PullServer:
+    """Streams a two-layer pull per model; `fail_first` models lose the connection mid-layer on their first attempt."""
+
+    def __init__(self, fail_first: tuple = (), delay: float = 0.05) -> None:
+        self.fail_first = set(fail_first)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.requests: List[str] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def stream(self, method: str, url: str, **kw: Any):
+        name = kw["json"]["name"]
+        with self._lock:
+            self.requests.append(name)
+            first = name in self.fail_first
+            self.fail_first.discard(name)
+        server = self
+
+        class _Stream(_FakeResp):
+            def iter_lines(self):
+                with server._lock:
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                try:
+                    time.sleep(server.delay)
+                    yield json.dumps({"status": "pulling manifest"})
+                    yield json.dumps({"status": "pulling a", "digest": "a", "total": 1000, "completed": 1000})
+                    if first:
+                        yield json.dumps({"status": "pulling b", "digest": "b", "total": 4000, "completed": 1500})
+                        raise httpx.ReadError("connection reset")
+                    # Resumed: b restarts from where the partial blob left off; two objects on one line
+                    yield json.dumps({"status": "pulling b", "digest": "b", "total": 4000, "completed": 1500}) + " " + json.dumps(
+                        {"status": "pulling b", "digest": "b", "total": 4000, "completed": 4000}
+                    )
+                    yield json.dumps({"status": "success"})
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+        return _Stream({}, 200)
+
+
+def test_pull_models_concurrently_with_retry_and_resume(monkeypatch, capsys) -> None:
+    server = _PullServer(fail_first=("m2",))
+    monkeypatch.setattr(models_cmd.httpx, "Client", lambda **kw: server)
+    monkeypatch.setattr(models_cmd, "RETRY_BACKOFF_S", 0)
+    results = models_cmd.pull_models("http://host", ["m1", "m2", "m3", "m4"], use_default=False, concurrency=2)
+    assert [r.ok for r in results] == [True] * 4
+    assert server.peak == 2 and server.requests.count("m2") == 2
+    by_name = {r.name: r for r in results}
+    assert by_name["m2"].attempts == 2 and by_name["m1"].attempts == 1
+    # The resumed layer is counted once, not re-downloaded
+    assert by_name["m2"].downloaded == by_name["m1"].downloaded == 4000 - 1500
+    out = capsys.readouterr().out
+    assert "Pulled 4/4 models" in out and "MB/s" in out
+
+
+def test_pull_models_reports_exhausted_retries(monkeypatch, capsys) -> None:
+    server = _PullServer(fail_first=("m1",))
+    monkeypatch.setattr(models_cmd.httpx, "Client", lambda **kw: server)
+    results = models_cmd.pull_models("http://host", ["m1"], use_default=False, retries=0)
+    assert not results[0].ok and results[0].error == "connection reset"
+    assert "Pulled 0/1 models" in capsys.readouterr().out
+
+
+class _Replies:
+    """Answers successive pull requests with the given (status code, stream lines) replies."""
+
+    def __init__(self, *replies: tuple) -> None:
+        self.replies = list(replies)
+        self.requests = 0
+
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def stream(self, method: str, url: str, **kw: Any):
+        self.requests += 1
+        status, lines = self.replies.pop(0)
+        return _FakeResp({}, status, lines)
+
+
+def test_pull_retries_only_transient_failures(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(models_cmd, "RETRY_BACKOFF_S", 0)
+    success = [json.dumps({"status": "success"})]
+    cases = [
+        (_Replies((503, []), (200, success)), True, 2),  # server error: retried
+        (_Replies((200, [json.dumps({"status": "pulling"})]), (200, success)), True, 2),  # stream cut short: retried
+        (_Replies((404, [])), False, 1),
+        (_Replies((200, [json.dumps({"error": "pull model manifest: file does not exist"})])), False, 1),
+    ]
+    for client, ok, attempts in cases:
+        monkeypatch.setattr(models_cmd.httpx, "Client", lambda client=client, **kw: client)
+        (result,) = models_cmd.pull_models("http://host", ["nosuch"], use_default=False)
+        assert (result.ok, result.attempts, client.requests) == (ok, attempts, attempts)
+    assert "file does not exist" in capsys.readouterr().out
+
+
+def test_iter_events_handles_concatenated_objects_and_noise() -> None:
+    lines = ['{"status": "a"}{"status": "b"}', "", "  ", "not json", '{"status": "c"}']
+    assert [e["status"] for e in models_cmd.iter_events(lines)] == ["a", "b", "not json", "c"]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+
+import httpx
+
+from actcli.commands.presenter import PresenterServer, prepare_presenter
+from actcli.presenter_feed import PresenterHistory, PresenterHub, PresenterPublisher
+from actcli.seminar.adapters.base import AdapterInfo
+from actcli.seminar.adapters.echo import EchoAdapter
+from actcli.seminar.coordinator import TurnResult, run_round
+from actcli.session_log import SessionLog
+
+
+def test_run_round_streams_chunks_and_first_token() -> None:
+    events, chunks = [], []
+    results = asyncio.run(run_round(
+        [EchoAdapter("a")], "Q", timeout_s=2,
+        on_event=lambda t, d: events.append(t),
+        on_chunk=lambda name, rnd, text: chunks.append((name, rnd, text)),
+    ))
+    assert events == ["adapter_start", "adapter_first_token", "adapter_finish"]
+    assert "".join(c[2] for c in chunks) == results[0].text
+
+
+def test_sse_push_from_publisher(tmp_path: Path) -> None:
+    root = prepare_presenter(tmp_path)
+    hub = PresenterHub()
+    server = PresenterServer(root, hub, port=0)
+    url = f"http://127.0.0.1:{server.start_background()}"
+    try:
+        received = []
+        with httpx.Client(timeout=5) as client:
+            assert client.get(url + "/app.js").status_code == 200
+            with client.stream("GET", url + "/events") as resp:
+                lines = resp.iter_lines()
+                pub = PresenterPublisher(url)
+                pub.prompt("P")
+                pub.chunk_hook("m", 1, "hel")
+                pub.chunk_hook("m", 1, "lo")
+                pub.flush()
+                for line in lines:
+                    if line.startswith("data: "):
+                        received.append(json.loads(line[6:]))
+                    if received and received[-1]["type"] == "chunk":
+                        break
+            state = client.get(url + "/state.json").json()
+        assert received[0]["type"] == "snapshot"
+        assert [d["type"] for d in received[1:]] == ["prompt", "chunk"]
+        assert state["prompt"] == "P" and state["streams"] == {"m": "hello"}
+    finally:
+        server.stop()
+
+
+def test_static_assets_etag_and_gzip(tmp_path: Path) -> None:
+    server = PresenterServer(prepare_presenter(tmp_path), port=0)
+    url = f"http://127.0.0.1:{server.start_background()}"
+    try:
+        with httpx.Client(timeout=5) as client:
+            first = client.get(url + "/app.js", headers={"Accept-Encoding": "gzip"})
+            assert first.headers["content-encoding"] == "gzip" and "EventSource" in first.text
+            etag = first.headers["etag"]
+            again = client.get(url + "/app.js", headers={"If-None-Match": etag})
+            assert again.status_code == 304 and again.content == b""
+            state = client.get(url + "/state.json")
+            assert state.json()["prompt"] == ""
+            assert client.get(url + "/state.json", headers={"If-None-Match": state.headers["etag"]}).status_code == 304
+            assert client.get(url + "/missing").status_code == 404
+    finally:
+        server.stop()
+
+
+def test_connection_limit_returns_503(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        server = PresenterServer(prepare_presenter(tmp_path), port=0, max_connections=1)
+        port = await server.start()
+        held = await asyncio.open_connection("127.0.0.1", port)
+        held[1].write(b"GET /events HTTP/1.1\r\nHost: x\r\n\r\n")
+        await held[0].readuntil(b"\r\n\r\n")
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+        assert (await reader.readline()).startswith(b"HTTP/1.1 503")
+        writer.close()
+        held[1].close()
+        server.stop()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+
+
+def test_history_api_pages_and_lazy_responses(tmp_path: Path) -> None:
+    sdir = tmp_path / "sessions"
+    log = SessionLog(sdir / "s.jsonl", flush_interval_s=0.0)
+    info = AdapterInfo(id="m", name="m", is_local=True, model_version="1")
+    for i in range(5):
+        turn = log.begin_turn(f"prompt {i}")
+        log.record_results(turn, 1, [TurnResult(info=info, text=f"{i} " + "x" * 1000, latency_ms=3)])
+    log.close()
+
+    server = PresenterServer(prepare_presenter(tmp_path), port=0, history=PresenterHistory(sdir))
+    url = f"http://127.0.0.1:{server.start_background()}"
+    try:
+        with httpx.Client(timeout=5) as client:
+            page = client.get(url + "/api/turns?limit=2").json()
+            assert page["total"] == 5 and [t["prompt"] for t in page["items"]] == ["prompt 4", "prompt 3"]
+            more = client.get(url + f"/api/turns?session={page['session']}&before={page['next']}&limit=2").json()
+            assert [t["prompt"] for t in more["items"]] == ["prompt 2", "prompt 1"]
+
+            detail = client.get(url + f"/api/turns/{page['items'][0]['id']}").json()
+            resp = detail["rounds"][0]["responses"][0]
+            assert resp["length"] > len(resp["preview"]) == PresenterHistory.PREVIEW_CHARS
+            full = client.get(url + f"/api/responses/{resp['id']}").json()
+            assert len(full["text"]) == resp["length"]
+
+            assert client.get(url + "/api/turns/999").status_code == 404
+            assert client.get(url + "/api/turns?limit=abc").status_code == 400
+
+            def locked(*_):
+                raise sqlite3.OperationalError("database is locked")
+
+            server.history.query = locked
+            assert client.get(url + "/api/turns").status_code == 500
+            assert client.get(url + "/").status_code == 200  # the server keeps serving
+    finally:
+        server.stop()
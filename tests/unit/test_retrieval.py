@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+
+import pytest
+
+from actcli.attach import Chunk
+from actcli.retrieval import BM25Index, context_budget, session_chunk, tokenize
+from actcli.seminar.adapters.echo import EchoAdapter
+from actcli.seminar.coordinator import run_round
+
+
+def _chunk(i: int, text: str, path: str | None = None) -> Chunk:
+    return Chunk(f"c{i}", path or f"f{i}.md", 0, 1, 1, text)
+
+
+def test_ranking_prefers_rare_terms_and_phrases() -> None:
+    idx = BM25Index()
+    idx.add(_chunk(1, "The chain ladder method projects claims from development triangles."))
+    idx.add(_chunk(2, "Ladder safety: never stand on the top rung of a ladder."))
+    idx.add(_chunk(3, "Bornhuetter-Ferguson blends an a priori loss ratio with the chain ladder."))
+    idx.add(_chunk(4, "Quarterly claims summary for the board."))
+    assert tokenize("The Chain-Ladder, of 2024!") == ["chain", "ladder", "2024"]
+
+    top = [c.id for _, c in idx.search("chain ladder triangles", k=3)]
+    assert top[0] == "c1"
+    assert "c2" not in top[:2]  # "ladder" alone loses to the phrase
+    assert idx.search("nothing matches this") == []
+
+
+def test_incremental_updates_by_source() -> None:
+    idx = BM25Index()
+    assert idx.update_source("a.py", [_chunk(1, "def reserve(): pass", "a.py"), _chunk(2, "def ibnr(): pass", "a.py")]) == (2, 0)
+    # Re-attaching with one chunk changed adds one and removes one
+    assert idx.update_source("a.py", [_chunk(1, "def reserve(): pass", "a.py"), _chunk(3, "def ultimate(): pass", "a.py")]) == (1, 1)
+    assert "c2" not in idx and [c.id for _, c in idx.search("ibnr")] == []
+    assert [c.id for _, c in idx.search("ultimate")] == ["c3"]
+    assert idx.drop_source("a.py") == 2 and len(idx) == 0 and idx.sources() == []
+
+    idx.add(session_chunk(1, "Which method for long-tail liability?", "Use Bornhuetter-Ferguson."))
+    assert idx.search("bornhuetter")[0][1].path == "session/turn-1"
+
+
+def test_select_respects_budget_and_model_budgets() -> None:
+    idx = BM25Index()
+    for i in range(20):
+        idx.add(_chunk(i, f"loss development factor {i} " + "x" * 300))
+    chosen = idx.select("loss development", budget_chars=1000)
+    assert 1 <= len(chosen) <= 3
+
+    local, cloud = EchoAdapter(name="llama3"), EchoAdapter(name="gpt")
+    cloud.is_local = False
+    assert context_budget(local) < context_budget(cloud)
+    local.context_chars = 123  # type: ignore[attr-defined]
+    assert context_budget(local) == 123
+
+
+def test_run_round_prompt_for_tailors_each_adapter() -> None:
+    seen = {}
+
+    class _Adapter:
+        is_local = True
+        model_version = "t"
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def generate(self, prompt: str, **_: object) -> str:
+            seen[self.name] = prompt
+            return "ok"
+
+    asyncio.run(run_round([_Adapter("a"), _Adapter("b")], "base", prompt_for=lambda ad: f"{ad.name}:base"))
+    assert seen == {"a": "a:base", "b": "b:base"}
+
+
+def _large_index() -> BM25Index:
+    rng = random.Random(7)
+    vocab = [f"w{i}" for i in range(5000)]
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+    idx = BM25Index(common_df=2000, top_postings=500)
+    words = rng.choices(vocab, weights=weights, k=20_000 * 10)
+    for i in range(20_000):
+        idx.add(_chunk(i, " ".join(words[i * 10:(i + 1) * 10])))
+    return idx
+
+
+def test_search_at_scale() -> None:
+    idx = _large_index()
+    # Exact for selective queries
+    assert idx.search("w4000 w10")[0][1].text.count("w4000") >= 1
+    assert idx.search("w0 w1 w2 w3") and idx.search("w1 w50 w700")
+
+
+@pytest.mark.skipif(not os.environ.get("ACTCLI_BENCH"), reason="timing benchmark; set ACTCLI_BENCH=1")
+def test_search_latency_at_scale() -> None:
+    idx = _large_index()
+    for q in ["w0 w1 w2 w3", "w1 w50 w700", "w4000 w10"]:
+        idx.search(q)  # warm the common-term heaps
+        start = time.perf_counter()
+        idx.search(q)
+        assert time.perf_counter() - start < 0.05
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from actcli.attach import Chunk
+from actcli.git import local as git_local
+from actcli.git.diff import parse_raw, split_patch
+from actcli.git.local import LocalGit
+from actcli.policy import Policy
+from actcli.review import ReviewCache, Reviewer, hunk_chunks, plan_batches, review_chunk_id, run_review
+from actcli.seminar.adapters.echo import EchoAdapter
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "-c", "init.defaultBranch=main", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    (root / "calc.py").write_text("".join(f"def f{i}():\n    return {i}\n\n" for i in range(60)))
+    (root / "old name.txt").write_text("same\n" * 10)
+    (root / "secret.env").write_text("KEY=1\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "base")
+    _git(root, "checkout", "-q", "-b", "feature")
+    return root
+
+
+def _edit(root: Path, old: str, new: str) -> None:
+    path = root / "calc.py"
+    path.write_text(path.read_text().replace(old, new))
+
+
+def test_parse_raw_and_patch_sections() -> None:
+    raw = b":100644 100644 aaa bbb M\0a b.py\0:100644 100644 ccc ddd R090\0old\0new\0:000000 100644 000 eee A\0n.txt\0"
+    entries = parse_raw(raw)
+    assert [(e.status, e.path, e.old_path) for e in entries] == [("M", "a b.py", None), ("R", "new", "old"), ("A", "n.txt", None)]
+    patch = "diff --git a/x b/x\nindex aaa..bbb 100644\n--- a/x\n+++ b/x\n@@ -1 +1 @@\n-a\n+b\ndiff --git a/y b/y\nold mode 100644\nnew mode 100755\n"
+    assert list(split_patch(patch)) == [("aaa", "bbb")]
+
+
+def test_hunk_chunks_group_and_ids_ignore_line_shifts() -> None:
+    section = "".join(f"@@ -{i * 10},2 +{i * 10},3 @@ ctx\n a\n+b{i}\n c\n" for i in range(1, 6))
+    raw = hunk_chunks(section, max_chars=60)
+    assert len(raw) == 5 and raw[0][1] == 10 and raw[0][2] == 12
+    assert len(hunk_chunks(section, max_chars=1000)) == 1
+    shifted = section.replace("@@ -10,2 +10,3 @@", "@@ -14,2 +14,3 @@")
+    assert review_chunk_id("p", section) == review_chunk_id("p", shifted)
+    assert review_chunk_id("p", section) != review_chunk_id("q", section)
+
+
+def test_review_reuses_cached_files_and_notes(repo: Path, tmp_path: Path) -> None:
+    _edit(repo, "return 3\n", "return 3 + 0\n")
+    _edit(repo, "return 50\n", "return 'fifty'\n")
+    _git(repo, "mv", "old name.txt", "new name.txt")
+    (repo / "secret.env").write_text("KEY=2\n")
+    _git(repo, "commit", "-qam", "first")
+    cache = ReviewCache(tmp_path / "review.db")
+    g = LocalGit(str(repo))
+    try:
+        reviewer = Reviewer(g, Policy(read=["./*.py", "./*.txt"], root=repo), cache=cache, chunk_chars=200)
+        first = reviewer.collect()
+        assert first is not None and first.diffed == 2
+        kinds = {f.path: f.kind for f in first.files}
+        assert kinds == {"calc.py": "text", "new name.txt": "meta", "secret.env": "denied"}
+        assert len(first.chunks) == 2 and all(c.path == "calc.py" for c in first.chunks)
+
+        adapters = [EchoAdapter(name="a"), EchoAdapter(name="b")]
+        out = run_review(first, adapters, cache)
+        assert len(out.results) == 2 and not out.reused  # small diff: everyone reviews everything
+
+        # A follow-up commit touching one hunk: the other hunk's notes are reused
+        _edit(repo, "return 3 + 0\n", "return 3\n# reviewed\n")
+        _git(repo, "commit", "-qam", "follow-up")
+        before = git_local.GIT_CALLS
+        second = reviewer.collect("main...HEAD")
+        assert second is not None and second.base == first.base and second.diffed == 1
+        assert git_local.GIT_CALLS - before <= 4  # merge-base, raw diff and one patch; revs resolve via cat-file
+        again = run_review(second, adapters, cache)
+        assert len(again.reused) == 1 and all(len(batch) == 1 for batch, _ in again.results)
+        assert len(run_review(second, adapters, cache, fresh=True).results[0][0]) == 2
+    finally:
+        g.close()
+        cache.close()
+
+
+def test_plan_batches_fans_out_within_budgets() -> None:
+    chunks = [Chunk(f"c{i}", f"f{i // 3}.py", i, 1, 2, "x" * 900) for i in range(30)]
+    local, cloud = EchoAdapter(name="llama"), EchoAdapter(name="gpt")
+    cloud.is_local = False
+    assert [len(b) for _, b in plan_batches(chunks[:2], [local, cloud])] == [2, 2]
+    batches = plan_batches(chunks, [local, cloud])
+    assert [c.id for _, b in batches for c in b] == [c.id for c in chunks]  # each chunk once, in order
+    sizes = {a.name: max(len(b) for x, b in batches if x is a) for a in (local, cloud)}
+    assert sizes["gpt"] > sizes["llama"]
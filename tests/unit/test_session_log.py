@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from actcli.seminar.adapters.echo import EchoAdapter
+from actcli.seminar.coordinator import run_round
+from actcli.session_log import SessionLog, build_turns, read_events
+from actcli.transcript import latest_turn, write_views
+
+
+def test_session_log_appends_and_folds(tmp_path: Path) -> None:
+    path = tmp_path / "sessions" / "s.jsonl"
+    log = SessionLog(path, flush_interval_s=0.01)
+    turn = log.begin_turn("P")
+    results = asyncio.run(run_round([EchoAdapter("a"), EchoAdapter("b")], "P", seed=1, timeout_s=2, on_event=log.adapter_hook(turn)))
+    log.record_results(turn, 1, results)
+    log.record_synthesis(turn, "S", 0.5)
+
+    written = log.call_soon(lambda: path.read_text().count("\n"))
+    log.flush()
+    assert written.result() == log.events[-1]["seq"]
+    assert log.events[0]["type"] == "prompt"  # only the current turn stays in memory
+    failed = log.call_soon(lambda: 1 / 0)
+    log.flush()
+    assert isinstance(failed.exception(), ZeroDivisionError)
+    log.begin_turn("next")
+    assert [e["type"] for e in log.events] == ["prompt"]
+    log.close()
+
+    events = list(read_events(path))
+    types = [e["type"] for e in events]
+    assert types[0] == "session_start"
+    assert types.count("adapter_start") == 2 and types.count("adapter_finish") == 2
+    assert [e["seq"] for e in events] == sorted(e["seq"] for e in events)
+
+    turns = build_turns(events)
+    assert len(turns) == 2
+    assert turns[0].prompt == "P" and turns[0].synthesis == "S"
+    assert [r.info.name for r in turns[0].results] == ["a", "b"]
+
+
+def test_views_derived_from_log(tmp_path: Path) -> None:
+    log = SessionLog()
+    turn = log.begin_turn("Q")
+    results = asyncio.run(run_round([EchoAdapter("a")], "Q", timeout_s=2, on_event=log.adapter_hook(turn)))
+    log.record_results(turn, 1, results)
+
+    audit = tmp_path / "audit.json"
+    md = tmp_path / "t.md"
+    write_views(latest_turn(log), transcript=md, audit=audit)
+    data = json.loads(audit.read_text())
+    assert [e["type"] for e in data["events"]] == ["adapter_start", "adapter_finish"]
+    assert "## Prompt" in md.read_text()
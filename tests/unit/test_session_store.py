@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from actcli.seminar.adapters.base import AdapterInfo
+from actcli.seminar.coordinator import TurnResult
+from actcli.session_log import SessionLog
+from actcli import session_store
+from actcli.session_store import SessionStore
+
+
+def _result(model: str, text: str) -> TurnResult:
+    info = AdapterInfo(id=model, name=model, is_local=True, model_version="0.1")
+    return TurnResult(info=info, text=text, latency_ms=7)
+
+
+def _log_turn(log: SessionLog, prompt: str, answers: dict[str, str], synthesis: str) -> None:
+    turn = log.begin_turn(prompt)
+    log.record_results(turn, 1, [_result(m, t) for m, t in answers.items()])
+    log.record_synthesis(turn, synthesis, 0.3)
+    log.flush()
+
+
+def test_store_incremental_index_and_search(tmp_path: Path) -> None:
+    sdir = tmp_path / "sessions"
+    log = SessionLog(sdir / "a.jsonl", flush_interval_s=0.0)
+    _log_turn(log, "How should we set IBNR for motor?", {"llama": "Use chain ladder on paid triangles.", "gpt": "Bornhuetter-Ferguson for immature years."}, "Agreements: triangles")
+
+    store = SessionStore(session_dir=sdir)
+    assert store.sync() > 0
+    assert store.sync() == 0  # unchanged file: stat only
+
+    hits = store.search("IBNR")
+    assert len(hits) == 1 and hits[0].kind == "prompt"
+    hits = store.search("triangles")
+    assert {h.kind for h in hits} == {"response", "synthesis"}
+
+    # Appending a turn only ingests the new events
+    _log_turn(log, "Tail factors?", {"llama": "Fit an inverse power curve."}, "Agreements: curve")
+    log.close()
+    assert store.sync() == 4  # the new turn plus session_end
+    assert len(store.search("triangles")) == 2
+    assert store.search("inverse power")[0].adapter == "llama"
+
+    sessions = store.list_sessions()
+    assert len(sessions) == 1 and sessions[0].turns == 2
+    turn, responses = store.get_turn(hits[0].turn_id)
+    assert turn["prompt"].startswith("How should") and len(responses) == 2
+
+    # Pagination and hostile query syntax
+    assert len(store.search("triangles", limit=1, offset=1)) == 1
+    assert store.search('"unbalanced AND (') == []
+    store.close()
+
+
+def test_list_turns_keyset_pages(tmp_path: Path) -> None:
+    sdir = tmp_path / "sessions"
+    log = SessionLog(sdir / "a.jsonl", flush_interval_s=0.0)
+    for i in range(7):
+        _log_turn(log, f"question {i}", {"llama": f"answer {i}"}, "ok")
+    log.close()
+    with SessionStore(session_dir=sdir) as store:
+        store.sync()
+        sid = store.latest_session_id()
+        assert store.count_turns(sid) == 7
+        first = store.list_turns(sid, limit=3)
+        assert [t.prompt for t in first] == ["question 6", "question 5", "question 4"]
+        rest = store.list_turns(sid, before=first[-1].turn, limit=10)
+        assert [t.prompt for t in rest][-1] == "question 0" and len(rest) == 4
+        assert first[0].responses == 1
+
+
+def test_sync_skips_finished_logs_until_dir_changes(tmp_path: Path, monkeypatch) -> None:
+    sdir = tmp_path / "sessions"
+    for name in ("a", "b"):
+        log = SessionLog(sdir / f"{name}.jsonl", flush_interval_s=0.0)
+        _log_turn(log, f"question {name}", {"llama": "answer"}, "ok")
+        log.close()
+    live = SessionLog(sdir / "c.jsonl", flush_interval_s=0.0)
+    _log_turn(live, "question c", {"llama": "answer"}, "ok")
+    monkeypatch.setattr(session_store, "WATERMARK_SETTLE_S", -1.0)  # trust the watermark right away
+
+    with SessionStore(session_dir=sdir) as store:
+        store.sync()
+        checked: list[str] = []
+        real = store.sync_file
+        monkeypatch.setattr(store, "sync_file", lambda p: checked.append(p.name) or real(p))
+        _log_turn(live, "question d", {"llama": "answer"}, "ok")
+        assert store.sync() == 3 and checked == ["c.jsonl"]  # finished logs cost nothing
+
+        checked.clear()
+        new = SessionLog(sdir / "e.jsonl", flush_interval_s=0.0)  # a new file changes the dir mtime
+        _log_turn(new, "question e", {"llama": "answer"}, "ok")
+        new.close()
+        live.close()
+        assert store.sync() == 6 and checked == ["c.jsonl", "e.jsonl"]
+        assert len(store.list_sessions()) == 4
+        checked.clear()
+        store.sync()
+        assert checked == []
+
+
+def test_show_prints_model_text_verbatim(tmp_path: Path, monkeypatch, capsys) -> None:
+    from actcli.commands import sessions
+
+    sdir = tmp_path / "sessions"
+    monkeypatch.setenv("ACTCLI_SESSION_DIR", str(sdir))
+    log = SessionLog(sdir / "a.jsonl", flush_interval_s=0.0)
+    _log_turn(log, "Is [red]this[/red] markup?", {"llama": "Index with a[i] then close [/]."}, "Keep [bold] literal")
+    log.close()
+    sessions.sessions_show(1)
+    out = capsys.readouterr().out
+    assert "Is [red]this[/red] markup?" in out and "a[i] then close [/]." in out and "Keep [bold] literal" in out
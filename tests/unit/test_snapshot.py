@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from actcli import trust as trust_mod
+from actcli.config import PROJECT_FILE
+from actcli.mcp import config as mcp_mod
+from actcli.snapshot import SnapshotService
+
+
+@pytest.fixture()
+def isolated(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setattr(trust_mod, "TRUST_DIR", tmp_path / "trust.d")
+    monkeypatch.setattr(trust_mod, "TRUST_DB", tmp_path / "trust.db")
+    monkeypatch.setattr(mcp_mod, "GLOBAL_FILE", tmp_path / "xdg" / "servers.toml")
+    root = tmp_path / "proj"
+    root.mkdir()
+    return root
+
+
+def test_snapshot_parses_once_and_reparses_on_change(isolated: Path) -> None:
+    root = isolated
+    cfg_file = root / PROJECT_FILE
+    cfg_file.write_text('[defaults]\nmode = "offline"\n', encoding="utf-8")
+    svc = SnapshotService()
+
+    first = svc.current(root)
+    assert first.config.defaults.mode == "offline" and first.trust is None
+    assert svc.current(root) is first and svc.builds == 1
+    assert not (root / ".actcli").exists()  # reading has no side effects
+
+    cfg_file.write_text('[defaults]\nmode = "hybrid"\nseed = 1\n', encoding="utf-8")
+    second = svc.current(root)
+    assert second.config.defaults.mode == "hybrid" and second.version > first.version
+
+    trust_mod.set_trust(root, scope="persist", read=["./**"], write=["./out/**"], cloud_share=True)
+    assert svc.current(root).trust.cloud_share is True
+
+    (root / ".actcli").mkdir()
+    (root / ".actcli" / "mcp.toml").write_text(
+        '[servers.git]\nurl = "http://x/"\nlog = true\nread_only = ["repo_detect"]\n', encoding="utf-8"
+    )
+    snap = svc.current(root)
+    assert snap.server_by_url("http://x").name == "git" and svc.builds == 4
+    with pytest.raises(TypeError):
+        snap.servers["other"] = snap.servers["git"]  # type: ignore[index]
+    assert snap.servers["git"].read_only == ("repo_detect",)
+    # Editing a fresh load never touches the shared snapshot
+    edited = mcp_mod.load_servers(root)["git"]
+    edited.read_only.append("status")
+    edited.url = "http://y/"
+    assert snap.servers["git"].url == "http://x/" and snap.servers["git"].read_only == ("repo_detect",)
+
+
+def test_get_config_hands_out_copies(isolated: Path, monkeypatch) -> None:
+    from actcli import snapshot
+    from actcli.config import get_config
+
+    (isolated / PROJECT_FILE).write_text('[defaults]\nmode = "offline"\n', encoding="utf-8")
+    monkeypatch.setattr(snapshot, "_SERVICE", SnapshotService())
+    cfg, _ = get_config(isolated)
+    cfg.defaults.mode = "hybrid"
+    assert get_config(isolated)[0].defaults.mode == "offline"
+
+
+def test_invalidate_catches_same_stamp_rewrites(isolated: Path) -> None:
+    root = isolated
+    cfg_file = root / PROJECT_FILE
+    cfg_file.write_text('[defaults]\nmode = "aaaaaaa"\n', encoding="utf-8")
+    svc = SnapshotService()
+    st = cfg_file.stat()
+    assert svc.current(root).config.defaults.mode == "aaaaaaa"
+
+    # Same size and mtime: invisible to stat, picked up after invalidate()
+    cfg_file.write_text('[defaults]\nmode = "offline"\n', encoding="utf-8")
+    os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert svc.current(root).config.defaults.mode == "aaaaaaa"
+    svc.invalidate()
+    assert svc.current(root).config.defaults.mode == "offline"
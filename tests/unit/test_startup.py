@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from actcli.commands.doctor import parse_importtime
+
+
+def test_cli_import_defers_config_trust_and_http() -> None:
+    probe = (
+        "import sys, actcli.cli; "
+        "print(sorted(m for m in ('httpx', 'actcli.config', 'actcli.trust', 'actcli.auth.store', 'actcli.commands.chat') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_parse_importtime() -> None:
+    text = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   actcli.version\n"
+        "import time:      2500 |       2620 | actcli\n"
+        "garbage line\n"
+    )
+    costs = parse_importtime(text)
+    assert [(c.module, c.depth) for c in costs] == [("actcli.version", 1), ("actcli", 0)]
+    assert costs[1].self_ms == 2.5 and costs[1].cumulative_ms == 2.62
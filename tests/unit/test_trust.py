@@ -1,28 +1,68 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
+import pytest
+
 from actcli import trust as trust_mod
 
 
-def test_set_get_revoke_trust(tmp_path: Path, monkeypatch) -> None:
-    # Redirect trust dir to tmp
-    tdir = tmp_path / "trust.d"
-    tdir.mkdir(parents=True)
-    monkeypatch.setattr(trust_mod, "TRUST_DIR", tdir, raising=True)
+@pytest.fixture()
+def trust_paths(tmp_path: Path, monkeypatch) -> Path:
+    # Redirect the trust database (and legacy dir) to tmp
+    monkeypatch.setattr(trust_mod, "TRUST_DB", tmp_path / "trust.db", raising=True)
+    monkeypatch.setattr(trust_mod, "TRUST_DIR", tmp_path / "trust.d", raising=True)
+    return tmp_path
+
 
-    root = tmp_path / "proj"
+def test_set_get_revoke_trust(trust_paths: Path) -> None:
+    root = trust_paths / "proj"
     root.mkdir()
+    assert trust_mod.get_trust(root) is None
 
-    rec_path = trust_mod.set_trust(root, scope="persist", read=["./**"], write=["./out/**"], cloud_share=True)
-    assert rec_path.exists()
+    rec = trust_mod.set_trust(root, scope="persist", read=["./**"], write=["./out/**"], cloud_share=True)
+    assert rec.path == str(root.resolve())
 
     rec = trust_mod.get_trust(root)
     assert rec is not None
-    assert rec.path == str(root)
-    assert rec.scope == "persist"
+    assert rec.path == str(root.resolve())
+    assert rec.scope == "persist" and rec.expires_at is None
     assert rec.cloud_share is True
 
-    trust_mod.revoke_trust(root)
-    assert not rec_path.exists()
+    assert trust_mod.revoke_trust(root) is True
+    assert trust_mod.get_trust(root) is None
+
+
+def test_nearest_ancestor_wins_and_once_expires(trust_paths: Path) -> None:
+    mono = trust_paths / "mono"
+    pkg = mono / "packages" / "pricing"
+    pkg.mkdir(parents=True)
+    trust_mod.set_trust(mono, scope="persist", read=["./**"], write=["./out/**"], cloud_share=False)
+    assert trust_mod.get_trust(pkg).path == str(mono.resolve())
+
+    store = trust_mod.trust_store()
+    store.grant(pkg, "once", ["./**"], [], True, ttl_s=60)
+    near = trust_mod.get_trust(pkg)
+    assert near.path == str(pkg.resolve()) and near.expires_at > time.time()
+
+    store.grant(pkg, "once", ["./**"], [], True, ttl_s=-1)  # already lapsed
+    assert trust_mod.get_trust(pkg).path == str(mono.resolve())
+    assert [r.path for r in trust_mod.list_trust()] == [str(mono.resolve())]
+
 
+def test_migrates_legacy_trust_d(trust_paths: Path) -> None:
+    legacy = trust_paths / "trust.d"
+    legacy.mkdir()
+    proj = trust_paths / "old"
+    proj.mkdir()
+    (legacy / "abc.toml").write_text(
+        f'path = "{proj}"\nscope = "persist"\nread = ["./data/**"]\nwrite = []\ncloud_share = true\n', encoding="utf-8"
+    )
+    rec = trust_mod.get_trust(proj / "sub")
+    assert rec is not None and rec.read == ["./data/**"] and rec.cloud_share
+    trust_mod.revoke_trust(proj)
+    trust_mod.trust_store().close()
+    # Migration runs once: a revoked legacy grant does not come back
+    fresh = trust_mod.TrustStore(trust_paths / "trust.db", legacy_dir=legacy)
+    assert fresh.lookup(proj) is None